@@ -1,25 +1,190 @@
-from typing import Type, TypeVar, Union
+from __future__ import annotations
+
+import operator
+from typing import Callable, Dict, Tuple, Type, TypeVar, Union
 
 
 class Point:
-    pass
+    __slots__ = ()
 
 
 class Vector:
+    __slots__ = ()
+
+
+class IntTypeArray:
+    """Abstract class for containers holding many IntType values in a single array. The operators
+    of IntType scalars return NotImplemented for such containers so that the array's reflected
+    operator gets to apply the typing rules element-wise."""
+
     pass
 
 
 T = TypeVar("T", bound="IntType")
 
+INTERN_RANGE = range(-21, 22)
+"""Values for which every IntType subclass shares a single instance per value."""
+
+OPERATORS: Dict[str, Callable] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "//": operator.floordiv,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "divmod": divmod,
+    "**": operator.pow,
+    "&": operator.and_,
+    "|": operator.or_,
+    "^": operator.xor,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+}
+"""The binary operators of IntType, by the symbol used in the registry."""
+
+OPERATION_REGISTRY: Dict[Tuple[type, type, str], Type["IntType"]] = {}
+"""Maps (left type, right type, operator symbol) to the result type for every operation defined between
+two IntTypes. Filled via register_operation() when the types are defined."""
+
+_DISPATCH: Dict[Tuple[type, type, str], Callable] = {}
+"""Implementation for every combination of operand types encountered so far, resolved once by _resolve()."""
+
+
+def register_operation(symbol: str, left: type, right: type, result: Type["IntType"]):
+    """Defines the operation ``left <symbol> right`` between two IntTypes. The operands are projected onto the
+    result type (e.g. as fifths or semitones), combined by the operator, and turned into the result type.
+    Operations are looked up along the MRO of both operands, so registering an abstract class such as
+    IntervalClass covers all its subclasses.
+
+    Args:
+        symbol: Operator symbol, one of the keys of OPERATORS.
+        left: Type of the left operand.
+        right: Type of the right operand.
+        result: IntType of the result.
+    """
+    if symbol not in OPERATORS:
+        raise ValueError(f"Unknown operator '{symbol}'. Use one of {list(OPERATORS)}.")
+    OPERATION_REGISTRY[(left, right, symbol)] = result
+    _DISPATCH.clear()
+
+
+def result_type(left: type, right: type, symbol: str) -> Type["IntType"]:
+    """Looks up the type resulting from ``left <symbol> right`` for two IntTypes.
+
+    Raises:
+        NotImplementedError: If the operation is not defined.
+    """
+    for left_class in left.__mro__:
+        for right_class in right.__mro__:
+            result = OPERATION_REGISTRY.get((left_class, right_class, symbol))
+            if result is not None:
+                return result
+    if symbol == "divmod":
+        raise NotImplementedError(f"Operation not defined: divmod({left}, {right})")
+    raise NotImplementedError(f"Operation not defined: {left} {symbol} {right}")
+
+
+def _resolve(left: type, right: type, symbol: str) -> Callable:
+    """Creates the implementation of ``left <symbol> right``, where at least one of the types is an IntType, and
+    stores it in _DISPATCH."""
+    function = OPERATORS[symbol]
+    if issubclass(left, IntTypeArray) or issubclass(right, IntTypeArray):
+
+        def implementation(a, b):
+            # let the array's (reflected) operator handle the operation
+            return NotImplemented
+
+    elif issubclass(left, IntType) and issubclass(right, IntType):
+        try:
+            result = result_type(left, right, symbol)
+        except NotImplementedError as e:
+            error = str(e)
+
+            def implementation(a, b):
+                raise NotImplementedError(error)
+
+        else:
+            project_a, project_b = result._projection(left), result._projection(right)
+            make = result._from_int
+            if project_a is int and project_b is int:
+                # both operands store the result's unit: int's own operator skips the projections
+                int_function = getattr(int, f"__{function.__name__.rstrip('_')}__")
+
+                def implementation(a, b):
+                    return make(int_function(a, b))
+
+            else:
+
+                def implementation(a, b):
+                    return make(function(project_a(a), project_b(b)))
+
+    elif issubclass(left, SemitonesFifthsScalar) or issubclass(
+        right, SemitonesFifthsScalar
+    ):
+        # a plain integer could mean semitones, fifths, octaves, or a packed value, and each would give another result
+        error = (
+            f"Operation not defined: {left} {symbol} {right}. Create the operand with from_fifths_semitones() "
+            f"or from_fifths_octaves() instead."
+        )
+
+        def implementation(a, b):
+            raise NotImplementedError(error)
+
+    elif issubclass(left, IntType):
+        # like an integer, the result keeps the IntType, except for divmod() which returns plain integers
+        if symbol == "divmod":
+
+            def implementation(a, b):
+                return function(int(a), b)
+
+        else:
+            make = left._from_int
+
+            def implementation(a, b):
+                return make(int(function(int(a), b)))
+
+    else:
+        if symbol == "divmod":
+
+            def implementation(a, b):
+                return function(a, int(b))
+
+        else:
+            make = right._from_int
+
+            def implementation(a, b):
+                return make(int(function(a, int(b))))
+
+    _DISPATCH[left, right, symbol] = implementation
+    return implementation
+
 
 class IntType(int):
     """Abstract class for custom integer types. For the usual numerical operators, instances behave
     like an integer when the other value is also an integer. If the other value, however, is an
-    IntType, an NotImplementedError is thrown unless the operation is defined for this IntType.
-    The actual int value is stored in the field _value. The various subclasses provide different properties for
-    accessing this field.
+    IntType, an NotImplementedError is thrown unless the operation is defined for this IntType via
+    register_operation(). The implementation for each combination of operand types is resolved only once.
+    The actual int value is the int payload itself and can be accessed as _value. The various subclasses provide
+    different properties for accessing this field. Instances are immutable and have no __dict__; values within
+    INTERN_RANGE are interned per class so that, e.g., SPC(0) is always the same object.
+
+    Instances hash like their integer value, as equality with plain integers requires. Because of this, instances
+    of different IntTypes with the same value, e.g. SPC(0) and EPC(0), collide in sets and dicts, where comparing
+    them raises NotImplementedError just as ``SPC(0) == EPC(0)`` does. Containers should therefore hold a single
+    IntType, or plain integers alongside it.
     """
 
+    __slots__ = ()
+
+    __hash__ = int.__hash__  # defining __eq__ would otherwise make instances unhashable
+
+    _interned: Dict[int, "IntType"] = {}
+    """Per-class table of shared instances, filled on first use. Every subclass gets its own."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._interned = {}
+
     @staticmethod
     def convert_init_value(value: Union[int, str]) -> int:
         """Used by the constructor to convert the initial value into the integer that will be stored."""
@@ -27,10 +192,29 @@ class IntType(int):
 
     def __new__(cls, value: Union[int, str]) -> Type[T]:
         """Can be created from an integer or any type that int() accepts."""
-        converted_value = cls.convert_init_value(value)
-        instance = int.__new__(cls, converted_value)
-        instance._value = converted_value
-        return instance
+        return cls._from_int(cls.convert_init_value(value))
+
+    @classmethod
+    def _from_int(cls, value: int) -> Type[T]:
+        """Trusted constructor used by the operators for results that are already converted integers.
+        Skips convert_init_value() and returns the interned instance where possible."""
+        try:
+            return cls._interned[value]
+        except KeyError:
+            instance = int.__new__(cls, value)
+            if value in INTERN_RANGE:
+                cls._interned[value] = instance
+            return instance
+
+    @classmethod
+    def _projection(cls, operand_type: type) -> Callable[["IntType"], int]:
+        """Returns the function that expresses operands of the given type in the unit stored by this type.
+        Used for the operations registered with this type as result."""
+        return int
+
+    @property
+    def _value(self) -> int:
+        return int(self)
 
     @property
     def name(self) -> str:
@@ -48,188 +232,190 @@ class IntType(int):
         raise NotImplementedError(f"Negation operation not defined: - {type(self)}")
 
     def __add__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} + {type(other)}"
-            )
-        return self.__class__(self._value + other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "+"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "+")
+        return implementation(self, other)
 
     def __sub__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} - {type(other)}"
-            )
-        return self.__class__(self._value - other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "-"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "-")
+        return implementation(self, other)
 
     def __mul__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} * {type(other)}"
-            )
-        return self.__class__(self._value * other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "*"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "*")
+        return implementation(self, other)
 
     def __floordiv__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} // {type(other)}"
-            )
-        return self.__class__(self._value // other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "//"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "//")
+        return implementation(self, other)
 
     def __truediv__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} / {type(other)}"
-            )
-        return self.__class__(int(self._value / other))
+        try:
+            implementation = _DISPATCH[type(self), type(other), "/"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "/")
+        return implementation(self, other)
 
     def __mod__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} % {type(other)}"
-            )
-        return self.__class__(self._value % other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "%"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "%")
+        return implementation(self, other)
 
     def __divmod__(self, other: Union[Type[T], int]) -> tuple[int, int]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: divmod({type(self)}, {type(other)})"
-            )
-        return int(self._value).__divmod__(other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "divmod"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "divmod")
+        return implementation(self, other)
 
     def __radd__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} + {type(self)}"
-            )
-        return self.__class__(other + self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "+"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "+")
+        return implementation(other, self)
 
     def __rsub__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} - {type(self)}"
-            )
-        return self.__class__(other - self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "-"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "-")
+        return implementation(other, self)
 
     def __rmul__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} * {type(self)}"
-            )
-        return self.__class__(other * self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "*"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "*")
+        return implementation(other, self)
 
     def __rfloordiv__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} // {type(self)}"
-            )
-        return self.__class__(other // self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "//"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "//")
+        return implementation(other, self)
 
     def __rtruediv__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} / {type(self)}"
-            )
-        return self.__class__(int(other / self._value))
+        try:
+            implementation = _DISPATCH[type(other), type(self), "/"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "/")
+        return implementation(other, self)
 
     def __rmod__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} % {type(self)}"
-            )
-        return self.__class__(other % self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "%"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "%")
+        return implementation(other, self)
 
     def __rdivmod__(self, other: Union[Type[T], int]) -> tuple[int, int]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: divmod({type(other)}, {type(self)})"
-            )
-        return int(other).__divmod__(self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "divmod"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "divmod")
+        return implementation(other, self)
 
     def __pow__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} ** {type(other)}"
-            )
-        return self.__class__(self._value**other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "**"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "**")
+        return implementation(self, other)
 
     def __rpow__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} ** {type(self)}"
-            )
-        return self.__class__(other**self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "**"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "**")
+        return implementation(other, self)
 
     def __and__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} & {type(other)}"
-            )
-        return self.__class__(self._value & other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "&"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "&")
+        return implementation(self, other)
 
     def __or__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} | {type(other)}"
-            )
-        return self.__class__(self._value | other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "|"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "|")
+        return implementation(self, other)
 
     def __xor__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} ^ {type(other)}"
-            )
-        return self.__class__(self._value ^ other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "^"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "^")
+        return implementation(self, other)
 
     def __lshift__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} << {type(other)}"
-            )
-        return self.__class__(self._value << other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), "<<"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), "<<")
+        return implementation(self, other)
 
     def __rshift__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(self)} >> {type(other)}"
-            )
-        return self.__class__(self._value >> other)
+        try:
+            implementation = _DISPATCH[type(self), type(other), ">>"]
+        except KeyError:
+            implementation = _resolve(type(self), type(other), ">>")
+        return implementation(self, other)
 
     def __rand__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} & {type(self)}"
-            )
-        return self.__class__(other & self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "&"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "&")
+        return implementation(other, self)
 
     def __ror__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} | {type(self)}"
-            )
-        return self.__class__(other | self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "|"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "|")
+        return implementation(other, self)
 
     def __rxor__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} ^ {type(self)}"
-            )
-        return self.__class__(other ^ self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "^"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "^")
+        return implementation(other, self)
 
     def __rlshift__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} << {type(self)}"
-            )
-        return self.__class__(other << self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), "<<"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), "<<")
+        return implementation(other, self)
 
     def __rrshift__(self, other: Union[Type[T], int]) -> Type[T]:
-        if isinstance(other, IntType):
-            raise NotImplementedError(
-                f"Operation not defined: {type(other)} >> {type(self)}"
-            )
-        return self.__class__(other >> self._value)
+        try:
+            implementation = _DISPATCH[type(other), type(self), ">>"]
+        except KeyError:
+            implementation = _resolve(type(other), type(self), ">>")
+        return implementation(other, self)
 
     def __eq__(self, other) -> bool:
+        if isinstance(other, IntTypeArray):
+            return NotImplemented
         if isinstance(other, IntType) and not (type(self) == type(other)):
             raise NotImplementedError(
                 f"Comparison not defined: {type(self)} == {type(other)}"
@@ -237,6 +423,8 @@ class IntType(int):
         return self._value == other
 
     def __lt__(self, other: Union[Type[T], int]) -> bool:
+        if isinstance(other, IntTypeArray):
+            return NotImplemented
         if isinstance(other, IntType) and not (type(self) == type(other)):
             raise NotImplementedError(
                 f"Comparison not defined: {type(self)} < {type(other)}"
@@ -244,6 +432,8 @@ class IntType(int):
         return self._value < other
 
     def __le__(self, other: Union[Type[T], int]) -> bool:
+        if isinstance(other, IntTypeArray):
+            return NotImplemented
         if isinstance(other, IntType) and not (type(self) == type(other)):
             raise NotImplementedError(
                 f"Comparison not defined: {type(self)} <= {type(other)}"
@@ -251,6 +441,8 @@ class IntType(int):
         return self._value <= other
 
     def __gt__(self, other: Union[Type[T], int]) -> bool:
+        if isinstance(other, IntTypeArray):
+            return NotImplemented
         if isinstance(other, IntType) and not (type(self) == type(other)):
             raise NotImplementedError(
                 f"Comparison not defined: {type(self)} > {type(other)}"
@@ -258,6 +450,8 @@ class IntType(int):
         return self._value > other
 
     def __ge__(self, other: Union[Type[T], int]) -> bool:
+        if isinstance(other, IntTypeArray):
+            return NotImplemented
         if isinstance(other, IntType) and not (type(self) == type(other)):
             raise NotImplementedError(
                 f"Comparison not defined: {type(self)} >= {type(other)}"
@@ -269,24 +463,41 @@ class SemitonesScalar(IntType):
     """Integer type whose _value field represents a number of semitones,
     such as a MIDI number or chromatic pitch class."""
 
+    __slots__ = ()
+
     @staticmethod
     def convert_init_value(value: Union[int, str, IntType]) -> int:
         # TODO: convert note name or interval strings to semitones
-        if isinstance(value, FifthsScalar):
+        if isinstance(value, (FifthsScalar, SemitonesFifthsScalar)):
             converted = value.semitones
         else:
             converted = int(value)
         return converted % 12
 
+    @classmethod
+    def _from_int(cls, value: int) -> "SemitonesScalar":
+        value %= 12
+        try:
+            return cls._interned[value]
+        except KeyError:
+            return super()._from_int(value)
+
+    @classmethod
+    def _projection(cls, operand_type: type) -> Callable[[IntType], int]:
+        if issubclass(operand_type, SemitonesScalar):
+            return int
+        return operator.attrgetter("semitones")
+
     @property
     def semitones(self) -> int:
         """This scalar's value."""
-        return self._value
+        return int(self)
 
     @property
-    def fifths(self) -> None:
-        """Semitones expressed as the number of fifths. Will require inference logic or additional information."""
-        return
+    def fifths(self) -> int:
+        """Semitones expressed as the number of fifths closest to C, i.e. within [-5, 6] (Db to F#). This spelling
+        ignores any context; spelling.Speller spells whole sequences."""
+        return (7 * int(self) + 5) % 12 - 5
 
     @property
     def octave(self) -> None:
@@ -301,24 +512,32 @@ class FifthsScalar(IntType):
     """Integer type whose _value field represents a number of perfect fifth intervals,
     such as a spelled pitch class or a specific interval."""
 
+    __slots__ = ()
+
     @staticmethod
     def convert_init_value(value: Union[int, str, IntType]) -> int:
         # TODO: convert note name or interval strings to fifths
-        if isinstance(value, SemitonesScalar):
+        if isinstance(value, (SemitonesScalar, SemitonesFifthsScalar)):
             converted = value.fifths
         else:
             converted = int(value)
         return converted
 
+    @classmethod
+    def _projection(cls, operand_type: type) -> Callable[[IntType], int]:
+        if issubclass(operand_type, FifthsScalar):
+            return int
+        return operator.attrgetter("fifths")
+
     @property
     def fifths(self) -> int:
         """This scalar's value."""
-        return self._value
+        return int(self)
 
     @property
     def semitones(self) -> int:
         """The stack of fifths represented by this scalar, expressed in semitones."""
-        return 7 * self._value % 12
+        return 7 * int(self) % 12
 
     @property
     def octave(self) -> None:
@@ -336,6 +555,56 @@ class FifthsScalar(IntType):
         return super().__neg__()
 
 
+FIFTHS_BASE = 1024
+"""Factor by which SemitonesFifthsScalar packs the semitones next to the fifths."""
+
+
+class SemitonesFifthsScalar(IntType):
+    """Integer type whose _value field represents a number of semitones together with a number of fifths, such as
+    a spelled pitch or a spelled interval including their octave. Both are packed into a single integer as
+    ``semitones * FIFTHS_BASE + fifths`` with fifths within [-FIFTHS_BASE / 2, FIFTHS_BASE / 2). Adding,
+    subtracting, negating and multiplying the packed integers therefore acts on both components at once, and the
+    integer order is that of the semitones, ties being broken by the fifths."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_fifths_semitones(
+        cls, fifths: int, semitones: int
+    ) -> "SemitonesFifthsScalar":
+        """Packs the two components into an instance.
+
+        Raises:
+            ValueError: If the fifths lie outside the range that can be packed.
+        """
+        if not -FIFTHS_BASE // 2 <= fifths < FIFTHS_BASE // 2:
+            raise ValueError(
+                f"{fifths} fifths lie outside the range of {cls.__name__}."
+            )
+        return cls._from_int(semitones * FIFTHS_BASE + fifths)
+
+    @classmethod
+    def _projection(cls, operand_type: type) -> Callable[[IntType], int]:
+        if issubclass(operand_type, SemitonesFifthsScalar):
+            return int
+        raise TypeError(
+            f"{operand_type} carries no octave and cannot be projected onto {cls}."
+        )
+
+    @property
+    def fifths(self) -> int:
+        """The number of fifths stored in this scalar."""
+        return (int(self) + FIFTHS_BASE // 2) % FIFTHS_BASE - FIFTHS_BASE // 2
+
+    @property
+    def semitones(self) -> int:
+        """The number of semitones stored in this scalar."""
+        return (int(self) - self.fifths) // FIFTHS_BASE
+
+    def __neg__(self) -> int:
+        return super().__neg__()
+
+
 if __name__ == "__main__":
     a = SemitonesScalar(4)
     b = SemitonesScalar("5")
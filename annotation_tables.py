@@ -0,0 +1,130 @@
+"""Streaming ingestion of TSV/CSV annotation tables whose columns contain note or interval names."""
+import csv
+import os
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from pitch_helpers import interval_names2fifths, note_names2fifths
+
+MISSING_FIFTHS = int(np.iinfo(np.int16).min)
+"""Fifths value standing in for empty cells."""
+
+MISSING_SEMITONES = -1
+"""Semitones value standing in for empty cells."""
+
+
+def fifths2semitones(fifths: np.ndarray) -> np.ndarray:
+    """Projects an array of fifths read by iter_annotation_chunks() onto semitones, keeping missing values.
+
+    Args:
+        fifths: int16 array possibly containing MISSING_FIFTHS.
+    """
+    semitones = (7 * fifths.astype(np.int32) % 12).astype(np.int8)
+    semitones[fifths == MISSING_FIFTHS] = MISSING_SEMITONES
+    return semitones
+
+
+def iter_annotation_chunks(
+    path: Union[str, os.PathLike],
+    note_columns: Sequence[str] = (),
+    interval_columns: Sequence[str] = (),
+    other_columns: Sequence[str] = (),
+    chunk_size: int = 10_000,
+    semitones: bool = False,
+    delimiter: Optional[str] = None,
+) -> Iterator[Dict[str, Union[np.ndarray, List[str]]]]:
+    """Reads an annotation table chunk by chunk so that memory use does not depend on the size of the file.
+    The cells of the note and interval columns are converted into int16 arrays of fifths. Every distinct spelling
+    is parsed only once per file. Empty cells become MISSING_FIFTHS.
+
+    Args:
+        path: Path of a TSV or CSV file with a header row.
+        note_columns: Names of columns containing note names such as 'F#' or 'Bbb'.
+        interval_columns: Names of columns containing interval names such as 'M3'.
+        other_columns: Names of columns to be passed through as lists of strings.
+        chunk_size: Maximum number of rows per yielded chunk.
+        semitones:
+            Pass True to additionally get the semitones of every converted column as int8 array under the key
+            '<column>_semitones', with empty cells as MISSING_SEMITONES.
+        delimiter: Defaults to tab for files ending on '.tsv' and to comma otherwise.
+
+    Yields:
+        Dictionaries mapping column names to the values of up to ``chunk_size`` consecutive rows.
+
+    Raises:
+        KeyError: If one of the requested columns is not in the header.
+        ValueError: Listing all invalid names of a column within the chunk in which they occur.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size needs to be positive, not {chunk_size}.")
+    if delimiter is None:
+        delimiter = "\t" if str(path).lower().endswith(".tsv") else ","
+    # one cache per kind of name, shared by all columns and chunks of the file
+    note_cache, interval_cache = {"": MISSING_FIFTHS}, {"": MISSING_FIFTHS}
+    converters = {column: (note_names2fifths, note_cache) for column in note_columns}
+    converters.update(
+        {column: (interval_names2fifths, interval_cache) for column in interval_columns}
+    )
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader, [])
+        missing = [
+            column for column in (*converters, *other_columns) if column not in header
+        ]
+        if len(missing) > 0:
+            raise KeyError(f"{path} has no columns {missing}. Header: {header}")
+        indices = {
+            column: header.index(column) for column in (*converters, *other_columns)
+        }
+        first_row = 1
+        while True:
+            cells = {column: [] for column in indices}
+            n_rows = 0
+            for row in reader:
+                for column, index in indices.items():
+                    cells[column].append(row[index] if index < len(row) else "")
+                n_rows += 1
+                if n_rows == chunk_size:
+                    break
+            if n_rows == 0:
+                return
+            chunk = {}
+            for column, values in cells.items():
+                if column not in converters:
+                    chunk[column] = values
+                    continue
+                convert, cache = converters[column]
+                try:
+                    fifths = convert(values, cache=cache)
+                except ValueError as e:
+                    raise ValueError(
+                        f"{path}, column '{column}', positions counted from data row {first_row}: {e}"
+                    ) from e
+                chunk[column] = fifths
+                if semitones:
+                    chunk[f"{column}_semitones"] = fifths2semitones(fifths)
+            yield chunk
+            first_row += n_rows
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "annotations.tsv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("mc\troot\tinterval\n")
+            for i, (root, interval) in enumerate(
+                [("F#", "M3"), ("Bbb", "P5"), ("", ""), ("C", "m7"), ("F#", "M3")]
+            ):
+                file.write(f"{i}\t{root}\t{interval}\n")
+        for chunk in iter_annotation_chunks(
+            path,
+            note_columns=["root"],
+            interval_columns=["interval"],
+            other_columns=["mc"],
+            chunk_size=2,
+            semitones=True,
+        ):
+            print(chunk)
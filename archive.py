@@ -0,0 +1,335 @@
+"""Binary container for long sequences of pitch classes, interval classes and Chord/Scale types, e.g. the roots and
+chord types of an analyzed corpus. Archives are read through numpy.memmap, so that opening and slicing them copies
+nothing, and objects such as SPC or MajorChord are created only for the elements that are accessed.
+
+Format (version 1, all integers little-endian):
+
+    offset  size  content
+    0       8     magic bytes b"PCARCHIV"
+    8       2     uint16 format version
+    10      2     reserved, zero
+    12      4     uint32 length H of the header
+    16      H     header: UTF-8 encoded JSON object with the keys
+                    "rows":    number of rows n, equal for all columns,
+                    "types":   type table, list of qualified names of PitchClassSelector subclasses such as
+                               "harmony.MajorChord",
+                    "columns": list of {"name": str, "kind": str, "offset": int} in the order of the data blocks.
+    ...           zero padding up to the next multiple of ALIGNMENT bytes
+    offset        one data block per column: n int16 values, each block starting at a multiple of ALIGNMENT
+
+The kinds are 'SPC' and 'SIC' (values are fifths), 'EPC' and 'EIC' (values are semitones), and 'type' (values are
+indices into the type table). In every kind, MISSING stands for an empty cell.
+"""
+import json
+import os
+import struct
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+
+from annotation_tables import MISSING_FIFTHS
+from harmony import SELECTOR_TYPES, PitchClassSelector, RawSemitones, _is_raw
+from pitch import SpecificPitchClass
+from pitch_arrays import EICArray, EPCArray, IntArray, SICArray, SPCArray
+
+MAGIC = b"PCARCHIV"
+VERSION = 1
+ALIGNMENT = 64
+"""Data blocks start at multiples of this many bytes."""
+
+MISSING = MISSING_FIFTHS
+"""int16 value standing for empty cells in all kinds of columns."""
+
+COLUMN_KINDS: Dict[str, Type[IntArray]] = {
+    "SPC": SPCArray,
+    "SIC": SICArray,
+    "EPC": EPCArray,
+    "EIC": EICArray,
+}
+"""Column kinds holding pitch or interval classes, by the array type whose values they store."""
+
+TYPE_KIND = "type"
+
+_DTYPE = np.dtype("<i2")
+_PREAMBLE = struct.Struct("<8sHHI")
+
+Column = Union[IntArray, np.ndarray, Sequence[Optional[Type[PitchClassSelector]]]]
+
+
+def _qualified_name(selector: Type[PitchClassSelector]) -> str:
+    return f"{selector.__module__}.{selector.__qualname__}"
+
+
+def _encode_column(
+    values: Column, kind: Optional[str], type_table: List[str]
+) -> Tuple[str, np.ndarray]:
+    """Returns the kind and the int16 values of a column, extending the type table as needed."""
+    if isinstance(values, IntArray):
+        for name, array_type in COLUMN_KINDS.items():
+            if isinstance(values, array_type):
+                return name, values.values.astype(_DTYPE)
+        raise TypeError(f"{type(values).__name__} cannot be archived.")
+    if kind is None or kind == TYPE_KIND:
+        values = list(values)
+        if all(v is None or isinstance(v, type) for v in values):
+            positions = {None: MISSING}
+            for selector in dict.fromkeys(values):
+                if selector is None:
+                    continue
+                name = _qualified_name(selector)
+                if name not in type_table:
+                    type_table.append(name)
+                positions[selector] = type_table.index(name)
+            return TYPE_KIND, np.array([positions[v] for v in values], dtype=_DTYPE)
+    if kind not in COLUMN_KINDS:
+        raise ValueError(
+            f"Raw integer columns need one of the kinds {list(COLUMN_KINDS)}, got {kind!r}."
+        )
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise TypeError(f"Raw columns of kind {kind!r} need to hold integers.")
+    return kind, values.astype(_DTYPE)
+
+
+def write_archive(
+    path: Union[str, os.PathLike],
+    columns: Mapping[str, Column],
+    kinds: Optional[Mapping[str, str]] = None,
+) -> None:
+    """Writes columns of equal length into an archive.
+
+    Args:
+        path: Path of the archive to be created.
+        columns:
+            By column name: an SPCArray, SICArray, EPCArray or EICArray; a sequence of PitchClassSelector subclasses
+            (or None); or an integer array already containing int16 values with MISSING for empty cells, whose kind
+            needs to be given in ``kinds``.
+        kinds: Kinds of the raw integer columns, e.g. {'root': 'SPC'}.
+
+    Raises:
+        ValueError: If the columns differ in length or a kind is unknown.
+    """
+    kinds = {} if kinds is None else kinds
+    type_table: List[str] = []
+    encoded = {
+        name: _encode_column(values, kinds.get(name), type_table)
+        for name, values in columns.items()
+    }
+    lengths = {len(values) for _, values in encoded.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns need the same length, got {sorted(lengths)}.")
+    rows = lengths.pop() if lengths else 0
+    block_size = -(-rows * _DTYPE.itemsize // ALIGNMENT) * ALIGNMENT
+
+    def header_bytes(data_offset: int) -> bytes:
+        descriptions = [
+            {"name": name, "kind": kind, "offset": data_offset + i * block_size}
+            for i, (name, (kind, _)) in enumerate(encoded.items())
+        ]
+        header = {"rows": rows, "types": type_table, "columns": descriptions}
+        return json.dumps(header).encode("utf-8")
+
+    # the offsets are part of the header, so grow the data offset until the header fits in front of it
+    data_offset = ALIGNMENT
+    while _PREAMBLE.size + len(header_bytes(data_offset)) > data_offset:
+        data_offset += ALIGNMENT
+    header = header_bytes(data_offset)
+    with open(path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, VERSION, 0, len(header)))
+        file.write(header)
+        file.write(b"\0" * (data_offset - _PREAMBLE.size - len(header)))
+        for _, values in encoded.values():
+            file.write(values.tobytes())
+            file.write(b"\0" * (block_size - values.nbytes))
+
+
+class ColumnView:
+    """Lazy view on one column of an Archive. Integer indexing creates a single object (None for empty cells),
+    slicing returns another view without copying anything."""
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        kind: str,
+        types: Sequence[Type[PitchClassSelector]] = (),
+    ):
+        """
+
+        Args:
+            values: The int16 values, usually a numpy.memmap.
+            kind: One of the keys of COLUMN_KINDS or 'type'.
+            types: The archive's type table.
+        """
+        self.values = values
+        self.kind = kind
+        self._types = types
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _element(self, value: int):
+        if value == MISSING:
+            return None
+        if self.kind == TYPE_KIND:
+            return self._types[value]
+        return COLUMN_KINDS[self.kind].scalar_type._from_int(value)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return self._element(int(self.values[item]))
+        return ColumnView(self.values[item], self.kind, self._types)
+
+    def __iter__(self) -> Iterator:
+        # converts blocks rather than single elements to Python integers
+        for block in np.array_split(self.values, range(65536, len(self), 65536)):
+            yield from map(self._element, block.tolist())
+
+    @property
+    def missing(self) -> np.ndarray:
+        """Boolean mask of the empty cells."""
+        return self.values == MISSING
+
+    def to_array(self) -> IntArray:
+        """Copies the column into an IntArray such as SPCArray. Empty cells need to be removed beforehand."""
+        if self.kind == TYPE_KIND:
+            raise TypeError("Type columns have no array counterpart.")
+        if self.missing.any():
+            raise ValueError("The column has empty cells; select the others first.")
+        return COLUMN_KINDS[self.kind]._from_values(np.array(self.values))
+
+    def __repr__(self) -> str:
+        return f"ColumnView(kind={self.kind!r}, length={len(self)})"
+
+
+class Archive:
+    """Read-only, memory-mapped archive written by write_archive()."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """Reads the header and maps every column without loading it.
+
+        Raises:
+            ValueError: If the file is not an archive of a supported version.
+            KeyError: If the type table names PitchClassSelector subclasses that have not been defined.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            preamble = file.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise ValueError(f"{path} is too short to be an archive.")
+            magic, version, _, header_length = _PREAMBLE.unpack(preamble)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an archive.")
+            if version != VERSION:
+                raise ValueError(
+                    f"{path} has the unsupported format version {version}."
+                )
+            header = json.loads(file.read(header_length).decode("utf-8"))
+        self.rows: int = header["rows"]
+        registered = {
+            _qualified_name(selector): selector for selector in SELECTOR_TYPES
+        }
+        unknown = [name for name in header["types"] if name not in registered]
+        if len(unknown) > 0:
+            raise KeyError(
+                f"The archive uses types that have not been defined: {unknown}"
+            )
+        self.types: List[Type[PitchClassSelector]] = [
+            registered[name] for name in header["types"]
+        ]
+        self.columns: Dict[str, ColumnView] = {}
+        for column in header["columns"]:
+            values = (
+                np.memmap(
+                    path,
+                    dtype=_DTYPE,
+                    mode="r",
+                    offset=column["offset"],
+                    shape=(self.rows,),
+                )
+                if self.rows > 0
+                else np.zeros(0, dtype=_DTYPE)
+            )
+            self.columns[column["name"]] = ColumnView(
+                values, column["kind"], self.types
+            )
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, name: str) -> ColumnView:
+        return self.columns[name]
+
+    def selectors(
+        self, type_column: str = "type", root_column: str = "root"
+    ) -> Iterator[Optional[PitchClassSelector]]:
+        """Yields one selector per row, created from a type and a root column; None for rows without type."""
+        for selector, root in zip(self[type_column], self[root_column]):
+            yield None if selector is None else selector(root)
+
+
+def selector_columns(
+    selectors: Sequence[Optional[PitchClassSelector]],
+) -> Dict[str, Column]:
+    """Turns selectors with SpecificPitchClass roots (or None) into 'type' and 'root' columns for write_archive().
+    Roots are stored in an SPC column, so enharmonic roots are not supported.
+
+    Raises:
+        TypeError: If a root is not a SpecificPitchClass (or a raw integer of fifths, see harmony.set_backend()).
+    """
+    types = [None if s is None else type(s) for s in selectors]
+    roots = np.full(len(types), MISSING, dtype=_DTYPE)
+    for row, selector in enumerate(selectors):
+        root = None if selector is None else selector.root
+        if root is None:
+            continue
+        if not (
+            isinstance(root, SpecificPitchClass)
+            or (_is_raw(root) and not isinstance(root, RawSemitones))
+        ):
+            raise TypeError(
+                f"{selector} needs a SpecificPitchClass root to be stored in an SPC column."
+            )
+        roots[row] = int(root)
+    return {"type": types, "root": roots}
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    from harmony import SPC, MajorChord, MajorScale
+
+    chords = [MajorChord(SPC(i % 13 - 6)) for i in range(100_000)]
+    chords[2] = MajorScale(SPC("Bb"))
+    chords[3] = None
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.pcarchive")
+        write_archive(
+            path,
+            {
+                **selector_columns(chords),
+                "bass": SICArray(["P1", "M3", "P5", "P1"] * 25_000),
+            },
+            kinds={"root": "SPC"},
+        )
+        archive = Archive(path)
+        print(
+            f"{len(archive)} rows of {os.path.getsize(path)} bytes with the types {archive.types}"
+        )
+        print(
+            f"roots[:5]: {list(archive['root'][:5])}, bass[1]: {archive['bass'][1]!r}"
+        )
+        print(
+            f"Selectors of rows 1 to 3: {[str(s) for s in list(archive.selectors())[1:4]]}"
+        )
+        print(f"Copy of a slice: {archive['bass'][4:8].to_array()}")
+        del archive
@@ -0,0 +1,265 @@
+"""Benchmark suite for the timing-relevant code paths: construction of the pitch types from ints and strings, every
+operator pair exercised by test_operators() in pitch.py, the name conversions of pitch_helpers, and the
+concretization of Chords and Scales. Results are stored as JSON and can be compared against a baseline.
+
+Usage:
+    python benchmark.py --n 1e6 --output results.json
+    python benchmark.py --n 1e6 --baseline results.json --threshold 0.2
+
+The second call exits with status 1 if any case is more than 20 % slower than in the baseline.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from itertools import product
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from harmony import SELECTOR_TYPES, MajorChord, MajorScale
+from pitch import EIC, EPC, SIC, SPC
+from pitch_helpers import (
+    TABLE_RANGE,
+    fifths2interval_name,
+    fifths2note_name,
+    interval_name2fifths,
+    note_name2fifths,
+)
+
+BLOCK_SIZE = 1000
+"""Number of inputs per case over which the timed statement loops; n operations run ceil(n / BLOCK_SIZE) blocks."""
+
+OPERATORS = ["+", "-", "*", "/", "**", "<", "<=", ">", ">=", "=="]
+"""The binary operators of test_operators() in pitch.py."""
+
+OPERANDS = [-3, 1.5, EPC("62"), SPC(-6), EIC(-17), SIC(6)]
+"""The instances passed to test_operators() in pitch.py."""
+
+
+class Case(NamedTuple):
+    """A benchmarked expression evaluated once per element of ``inputs``, which are bound to ``targets``."""
+
+    name: str
+    expression: str
+    inputs: Sequence
+    targets: str = "x"
+
+
+def _label(operand) -> str:
+    return (
+        type(operand).__name__ if isinstance(operand, (int, float)) else repr(operand)
+    )
+
+
+def _cycle(values: Sequence) -> List:
+    """Repeats the values to fill one block of inputs."""
+    values = list(values)
+    return (values * (BLOCK_SIZE // len(values) + 1))[:BLOCK_SIZE]
+
+
+def construction_cases() -> List[Case]:
+    ints = _cycle(range(-30, 30))
+    return [
+        Case("EPC(int)", "EPC(x)", ints),
+        Case("EIC(int)", "EIC(x)", ints),
+        Case("SPC(int)", "SPC(x)", ints),
+        Case("SIC(int)", "SIC(x)", ints),
+        Case("EPC(str)", "EPC(x)", _cycle(str(i) for i in range(-30, 30))),
+        Case("SPC(str)", "SPC(x)", _cycle(fifths2note_name(i) for i in TABLE_RANGE)),
+        Case(
+            "SIC(str)", "SIC(x)", _cycle(fifths2interval_name(i) for i in TABLE_RANGE)
+        ),
+    ]
+
+
+def _defined(expression: str, **operands) -> bool:
+    try:
+        eval(expression, operands)
+    except Exception:
+        return False
+    return True
+
+
+def operator_cases() -> List[Case]:
+    """One case per operation of test_operators() that is defined; undefined combinations raise and are skipped."""
+    cases = [
+        Case(f"-{_label(a)}", "-x", _cycle([a]))
+        for a in OPERANDS
+        if _defined("-x", x=a)
+    ]
+    for a, b in product(OPERANDS, repeat=2):
+        for operator in OPERATORS:
+            expression = f"a {operator} b"
+            if _defined(expression, a=a, b=b):
+                cases.append(
+                    Case(
+                        f"{_label(a)} {operator} {_label(b)}",
+                        expression,
+                        _cycle([(a, b)]),
+                        "a, b",
+                    )
+                )
+    return cases
+
+
+def helper_cases() -> List[Case]:
+    table = list(TABLE_RANGE)
+    beyond = list(range(TABLE_RANGE.stop, TABLE_RANGE.stop + 40))
+    return [
+        Case(
+            "note_name2fifths",
+            "note_name2fifths(x)",
+            _cycle(fifths2note_name(i) for i in table),
+        ),
+        Case(
+            "note_name2fifths (beyond table)",
+            "note_name2fifths(x)",
+            _cycle(fifths2note_name(i) for i in beyond),
+        ),
+        Case(
+            "interval_name2fifths",
+            "interval_name2fifths(x)",
+            _cycle(fifths2interval_name(i) for i in table),
+        ),
+        Case("fifths2note_name", "fifths2note_name(x)", _cycle(table)),
+        Case("fifths2note_name (beyond table)", "fifths2note_name(x)", _cycle(beyond)),
+        Case("fifths2interval_name", "fifths2interval_name(x)", _cycle(table)),
+    ]
+
+
+def concretization_cases() -> List[Case]:
+    roots = _cycle(SPC(i) for i in range(-14, 15))
+    epc_roots = _cycle(EPC(i) for i in range(12))
+    return [
+        Case("MajorChord(SPC).chord_tones", "MajorChord(x).chord_tones", roots),
+        Case("MajorChord(EPC).chord_tones", "MajorChord(x).chord_tones", epc_roots),
+        Case("MajorScale(SPC).scale_degrees", "MajorScale(x).scale_degrees", roots),
+        Case("MajorScale._concretize(SPC)", "MajorScale._concretize(x)", roots),
+        Case(
+            "all types, SPC root, uncached",
+            "[selector._concretize(x) for selector in SELECTOR_TYPES]",
+            roots,
+        ),
+    ]
+
+
+def all_cases() -> List[Case]:
+    return (
+        construction_cases()
+        + operator_cases()
+        + helper_cases()
+        + concretization_cases()
+    )
+
+
+NAMESPACE = {
+    "EPC": EPC,
+    "EIC": EIC,
+    "SPC": SPC,
+    "SIC": SIC,
+    "MajorChord": MajorChord,
+    "MajorScale": MajorScale,
+    "SELECTOR_TYPES": SELECTOR_TYPES,
+    "note_name2fifths": note_name2fifths,
+    "interval_name2fifths": interval_name2fifths,
+    "fifths2note_name": fifths2note_name,
+    "fifths2interval_name": fifths2interval_name,
+}
+"""Globals of the timed statements."""
+
+
+def measure(case: Case, n: int, repeat: int = 3) -> float:
+    """Returns the best time per evaluation of the case's expression in nanoseconds over ``repeat`` runs of at
+    least ``n`` evaluations each."""
+    blocks = max(1, -(-n // len(case.inputs)))
+    timer = timeit.Timer(
+        f"for {case.targets} in inputs: {case.expression}",
+        timer=time.perf_counter,
+        globals={**NAMESPACE, "inputs": case.inputs},
+    )
+    best = min(timer.repeat(repeat=repeat, number=blocks))
+    return best / (blocks * len(case.inputs)) * 1e9
+
+
+def run(
+    n: int, repeat: int = 3, select: Optional[str] = None, verbose: bool = True
+) -> Dict[str, float]:
+    """Measures all cases whose name contains ``select`` and returns the nanoseconds per operation by case name."""
+    results = {}
+    for case in all_cases():
+        if select is not None and select not in case.name:
+            continue
+        results[case.name] = measure(case, n, repeat)
+        if verbose:
+            print(f"{case.name:<45}{results[case.name]:>12.1f} ns")
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    """Prints the ratio of every case to the baseline and returns the names of the cases that slowed down by
+    more than ``threshold``, e.g. 0.2 for 20 %."""
+    regressions = []
+    print(f"\n{'case':<45}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, current in results.items():
+        if name not in baseline:
+            print(f"{name:<45}{'-':>12}{current:>12.1f}")
+            continue
+        ratio = current / baseline[name]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<45}{baseline[name]:>12.1f}{current:>12.1f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--n",
+        type=float,
+        default=1e5,
+        help="Operations per measurement, e.g. 1e3 to 1e7. Default: 1e5",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Default: 3")
+    parser.add_argument("--select", help="Only run cases whose name contains this.")
+    parser.add_argument("--output", help="Path of the JSON file to store results in.")
+    parser.add_argument("--baseline", help="Path of a JSON file written by --output.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Tolerated slowdown relative to the baseline. Default: 0.2",
+    )
+    args = parser.parse_args(argv)
+    n = int(args.n)
+    results = run(n, args.repeat, args.select)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "n": n,
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+    if args.baseline is None:
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if len(regressions) > 0:
+        print(
+            f"\n{len(regressions)} cases slowed down by more than {args.threshold:.0%}: {regressions}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
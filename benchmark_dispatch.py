@@ -0,0 +1,94 @@
+"""Microbenchmark comparing the operator dispatch via abstract.OPERATION_REGISTRY with the isinstance chains that
+the pitch types used before. The chains are reproduced by the Chain* classes below, which only override __add__.
+
+Usage: python benchmark_dispatch.py [number of operations per measurement]
+"""
+import sys
+import time
+import timeit
+
+from abstract import IntType
+from pitch import EIC, EPC, SIC, SPC, IntervalClass, PitchClass
+
+
+def _fallback(a, b):
+    """The former IntType.__add__."""
+    if isinstance(b, IntType):
+        raise NotImplementedError(f"Operation not defined: {type(a)} + {type(b)}")
+    return type(a)._from_int(int(int(a) + b))
+
+
+class ChainEPC(EPC):
+    __slots__ = ()
+
+    def __add__(self, other):
+        if isinstance(other, IntervalClass):
+            return EPC._from_int(self.semitones + other.semitones)
+        return _fallback(self, other)
+
+
+class ChainEIC(EIC):
+    __slots__ = ()
+
+    def __add__(self, other):
+        if isinstance(other, PitchClass):
+            return EPC._from_int(self.semitones + other.semitones)
+        if isinstance(other, IntervalClass):
+            return EIC._from_int(self.semitones + other.semitones)
+        return _fallback(self, other)
+
+
+class ChainSPC(SPC):
+    __slots__ = ()
+
+    def __add__(self, other):
+        if isinstance(other, SIC):
+            return SPC._from_int(self.fifths + other.fifths)
+        if isinstance(other, EIC):
+            return EPC._from_int(self.semitones + other.semitones)
+        return _fallback(self, other)
+
+
+class ChainSIC(SIC):
+    __slots__ = ()
+
+    def __add__(self, other):
+        if isinstance(other, SPC):
+            return SPC._from_int(self.fifths + other.fifths)
+        if isinstance(other, SIC):
+            return SIC._from_int(self.fifths + other.fifths)
+        if isinstance(other, EPC):
+            return EPC._from_int(self.semitones + other.semitones)
+        if isinstance(other, EIC):
+            return EIC._from_int(self.semitones + other.semitones)
+        return _fallback(self, other)
+
+
+CASES = [
+    ("EPC + EIC", EPC(3), ChainEPC(3), EIC(4)),
+    ("EIC + SPC", EIC(3), ChainEIC(3), SPC(2)),
+    ("SPC + SIC", SPC(2), ChainSPC(2), SIC(1)),
+    ("SPC + EIC", SPC(2), ChainSPC(2), EIC(4)),
+    ("SIC + SPC", SIC(1), ChainSIC(1), SPC(2)),
+    ("SIC + EIC", SIC(1), ChainSIC(1), EIC(4)),
+    ("SIC + 3", SIC(1), ChainSIC(1), 3),
+]
+
+
+def measure(a, b, number: int, repeat: int = 5) -> float:
+    """Returns the best CPU time per ``a + b`` in nanoseconds."""
+    timer = timeit.Timer("a + b", timer=time.process_time, globals={"a": a, "b": b})
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(number: int = 200_000) -> None:
+    print(f"{'operation':<12}{'chain (ns)':>12}{'registry (ns)':>15}{'ratio':>8}")
+    for label, registry_operand, chain_operand, other in CASES:
+        assert int(registry_operand + other) == int(chain_operand + other)
+        chain = measure(chain_operand, other, number)
+        registry = measure(registry_operand, other, number)
+        print(f"{label:<12}{chain:>12.1f}{registry:>15.1f}{registry / chain:>8.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,117 @@
+"""Measures the cold-start import time of the core modules in fresh interpreters and enforces the budget stored in
+import_budget.json. Short-lived worker processes pay this time on every start.
+
+The bytecode of the measured modules is compiled beforehand, as it would be in any installed setting, so that the
+measurement does not include compiling the sources.
+
+Usage:
+    python benchmark_import.py [--runs 20]           # exits with status 1 if a budget is exceeded
+    python benchmark_import.py --update [--margin 0.5]  # stores the measured medians plus margin as new budget
+"""
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+BUDGET_PATH = os.path.join(DIRECTORY, "import_budget.json")
+
+MODULES = ["abstract", "pitch_helpers", "pitch", "pitch_sets", "harmony"]
+"""Modules whose own import time is budgeted. Importing the last one imports all of them."""
+
+
+def measure_once(top_module: str) -> Dict[str, int]:
+    """Imports ``top_module`` in a fresh interpreter and returns the import time in microseconds of every module
+    in MODULES (excluding their dependencies) and of ``top_module`` including all dependencies under the key
+    'total'."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {top_module}"],
+        cwd=DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line.split(":", 1)[1].split("|")
+        name = name.strip()
+        if not own.strip().isdigit():
+            continue  # header line
+        if name in MODULES:
+            times[name] = int(own)
+        if name == top_module:
+            times["total"] = int(cumulative)
+    return times
+
+
+def measure(runs: int) -> Dict[str, float]:
+    """Returns the median import times over ``runs`` fresh interpreters in microseconds."""
+    for module in MODULES:
+        compileall.compile_file(os.path.join(DIRECTORY, f"{module}.py"), quiet=1)
+    measure_once(MODULES[-1])  # warms up the file system caches
+    samples: Dict[str, List[int]] = {}
+    for _ in range(runs):
+        for name, microseconds in measure_once(MODULES[-1]).items():
+            samples.setdefault(name, []).append(microseconds)
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+def check(medians: Dict[str, float], budget: Dict[str, float]) -> List[str]:
+    """Prints the medians next to the budget and returns the names over budget."""
+    exceeded = []
+    print(f"{'module':<16}{'median (us)':>12}{'budget (us)':>12}")
+    for name, median in medians.items():
+        limit = budget.get(name)
+        flag = ""
+        if limit is not None and median > limit:
+            exceeded.append(name)
+            flag = "  OVER BUDGET"
+        limit = "-" if limit is None else f"{limit:.0f}"
+        print(f"{name:<16}{median:>12.0f}{limit:>12}{flag}")
+    return exceeded
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=20, help="Default: 20")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Store the measured medians plus margin in import_budget.json.",
+    )
+    parser.add_argument(
+        "--margin",
+        type=float,
+        default=0.5,
+        help="Headroom added to the medians by --update. Default: 0.5",
+    )
+    args = parser.parse_args(argv)
+    medians = measure(args.runs)
+    if args.update:
+        budget = {
+            name: round(median * (1 + args.margin)) for name, median in medians.items()
+        }
+        with open(BUDGET_PATH, "w", encoding="utf-8") as file:
+            json.dump(budget, file, indent=2)
+            file.write("\n")
+        print(f"Stored budget in {BUDGET_PATH}: {budget}")
+        return 0
+    with open(BUDGET_PATH, encoding="utf-8") as file:
+        budget = json.load(file)
+    exceeded = check(medians, budget)
+    if len(exceeded) > 0:
+        print(f"\nImport time over budget: {exceeded}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Shared fixtures of the tests."""
+import pytest
+
+import identify
+import labels
+import universe
+from harmony import SELECTOR_TYPES
+
+
+@pytest.fixture
+def isolated_types(monkeypatch):
+    """Lets a test define PitchClassSelector subclasses without affecting other tests: the types registered during
+    the test are removed afterwards, and the shared tables built from SELECTOR_TYPES are replaced for its duration.
+    """
+    registered = len(SELECTOR_TYPES)
+    monkeypatch.setattr(universe, "_TABLES", {})
+    monkeypatch.setattr(identify, "_INDEX", None)
+    monkeypatch.setattr(labels, "_LABEL_TYPES", {})
+    monkeypatch.setattr(labels, "_labeled_size", 0)
+    yield
+    del SELECTOR_TYPES[registered:]
+    labels.parse_label.cache_clear()
@@ -0,0 +1,263 @@
+"""Scale degrees of pitch classes relative to a Scale, e.g. #4 for F# in C major. Every Scale type has a DegreeIndex
+that is computed once: spelled pitch classes are looked up by their step relative to the root, which is 4 * fifths
+modulo 7, and enharmonic pitch classes by their semitones relative to the root, so that a degree costs one lookup
+instead of a search through Scale.scale_degrees.
+
+Degrees count from 1 in the order of the scale's intervals; pitch classes without a degree, such as F in a major
+pentatonic scale on C, get NO_DEGREE. Alterations are given in chromatic semitones, positive for sharps.
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from abstract import FifthsScalar, IntType, SemitonesScalar
+from harmony import RawSemitones, Scale, _is_raw
+from pitch_arrays import FifthsArray, IntArray, SemitonesArray, SemitonesFifthsArray
+from pitch_sets import EnharmonicPitchClassSet
+
+NO_DEGREE = 0
+"""Degree of pitch classes whose step is not part of the scale."""
+
+Degree = Tuple[int, int]
+"""A scale degree and its alteration."""
+
+
+class DegreeIndex:
+    """The degrees of all pitch classes relative to the root of one Scale type."""
+
+    def __init__(self, scale_type: Type[Scale]):
+        self.scale_type = scale_type
+        self.spelled = not scale_type._enharmonic()
+        """Whether the intervals are SpecificIntervalClasses, which allows spelled lookups."""
+        self.fifths: List[int] = []
+        self.step_degrees = [NO_DEGREE] * 7
+        """The degree of every step above the root, i.e. every letter, NO_DEGREE if the scale skips it."""
+        self.step_fifths = [0] * 7
+        self._exact: Dict[int, int] = {}
+        if self.spelled:
+            self.fifths = [int(interval) for interval in scale_type.intervals]
+            for degree, fifths in enumerate(self.fifths, start=1):
+                self._exact.setdefault(fifths, degree)
+                step = 4 * fifths % 7
+                if self.step_degrees[step] == NO_DEGREE:
+                    self.step_degrees[step] = degree
+                    self.step_fifths[step] = fifths
+        semitones = [
+            EnharmonicPitchClassSet._bit(interval) for interval in scale_type.intervals
+        ]
+        self.semitone_degrees: List[Degree] = [
+            self._enharmonic_degree(s, semitones) for s in range(12)
+        ]
+        """The degree of every number of semitones above the root."""
+
+    def spelled_degree(self, fifths: int) -> Degree:
+        """The degree of the SpecificPitchClass the given fifths above the root."""
+        degree = self._exact.get(fifths)
+        if degree is not None:
+            return degree, 0
+        step = 4 * fifths % 7
+        degree = self.step_degrees[step]
+        if degree == NO_DEGREE:
+            return NO_DEGREE, 0
+        return degree, (fifths - self.step_fifths[step]) // 7
+
+    def _enharmonic_degree(self, semitones: int, members: List[int]) -> Degree:
+        if semitones in members:
+            return members.index(semitones) + 1, 0
+        if not self.spelled:
+            # the closest degree below, raised
+            lower = min(members, key=lambda member: (semitones - member) % 12)
+            return members.index(lower) + 1, (semitones - lower) % 12
+        # the spelling of the semitones closest to the middle of the scale on the line of fifths
+        center = sum(self.fifths) / len(self.fifths)
+        closest = (7 * semitones + 5) % 12 - 5
+        fifths = min(
+            (closest, closest - 12, closest + 12), key=lambda f: abs(f - center)
+        )
+        return self.spelled_degree(fifths)
+
+
+@lru_cache(maxsize=None)
+def degree_index(scale_type: Type[Scale]) -> DegreeIndex:
+    """The DegreeIndex of a Scale type, computed on first use."""
+    return DegreeIndex(scale_type)
+
+
+def _split(value: Union[int, IntType]) -> Tuple[Optional[int], int]:
+    """The fifths, None if unknown, and the semitones of a pitch class or root. Plain integers are fifths and
+    RawSemitones semitones, as in the raw backend (see harmony.set_backend())."""
+    if isinstance(value, FifthsScalar):
+        return int(value), value.semitones
+    if isinstance(value, (SemitonesScalar, RawSemitones)):
+        return None, int(value) % 12
+    if _is_raw(value):
+        value = int(value)
+        return value, 7 * value % 12
+    raise TypeError(f"{value!r} is not a pitch class.")
+
+
+def _root(scale: Scale) -> Tuple[DegreeIndex, Optional[int], int]:
+    if not isinstance(scale, Scale):
+        raise TypeError(f"{scale} is not a Scale.")
+    if scale.root is None:
+        raise ValueError(f"{scale} needs a root to assign scale degrees.")
+    index = degree_index(type(scale))
+    return (index, *_split(scale.root))
+
+
+def scale_degree(pitch_class: Union[int, IntType], scale: Scale) -> Degree:
+    """The degree of a pitch class within a scale and its alteration, e.g. (4, 1) for F# in C major and (3, -1) for
+    Eb. Spelled pitch classes in scales with a spelled root are looked up by their letter; otherwise the degree
+    belongs to the spelling closest to the scale (or, for enharmonic intervals, to the closest degree below).
+
+    Args:
+        pitch_class: SpecificPitchClass, EnharmonicPitchClass, or a raw integer (see _split()).
+        scale: Scale with a root.
+
+    Raises:
+        ValueError: If the scale has no root.
+    """
+    index, root_fifths, root_semitones = _root(scale)
+    fifths, semitones = _split(pitch_class)
+    if index.spelled and root_fifths is not None and fifths is not None:
+        return index.spelled_degree(fifths - root_fifths)
+    return index.semitone_degrees[(semitones - root_semitones) % 12]
+
+
+def _melody(
+    melody: Union[IntArray, np.ndarray, Sequence[int]], spelled: bool
+) -> Tuple[Optional[np.ndarray], np.ndarray]:
+    """The fifths, None if unknown, and the semitones of a melody."""
+    if isinstance(melody, (FifthsArray, SemitonesFifthsArray)):
+        fifths = np.asarray(melody.fifths, dtype=np.int64)
+        return fifths, 7 * fifths % 12
+    if isinstance(melody, SemitonesArray):
+        return None, np.asarray(melody.semitones, dtype=np.int64) % 12
+    if isinstance(melody, IntArray):
+        raise TypeError(f"{type(melody).__name__} holds no pitches.")
+    values = np.asarray(melody)
+    if values.size > 0 and values.dtype.kind not in "iu":
+        raise TypeError("Melodies need to consist of integers.")
+    values = values.astype(np.int64)
+    return (values, 7 * values % 12) if spelled else (None, values % 12)
+
+
+def label_degrees(
+    melody: Union[IntArray, np.ndarray, Sequence[int]],
+    scales: Union[Scale, Sequence[Optional[Scale]]],
+    spelled: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Bulk version of scale_degree() for a whole melody.
+
+    Args:
+        melody:
+            SPCArray, EPCArray, pitch array (its pitch classes are used), or an integer array of
+            fifths or semitones.
+        scales: A Scale for all notes, or one Scale (or None, yielding NO_DEGREE) per note.
+        spelled: Whether an integer array holds fifths rather than semitones.
+
+    Returns:
+        The degrees (int8) and the alterations (int16) of all notes.
+    """
+    fifths, semitones = _melody(melody, spelled)
+    if isinstance(scales, Scale):
+        scales = [scales]
+        notes = np.zeros(len(semitones), dtype=np.intp)
+    elif len(scales) != len(semitones):
+        raise ValueError(
+            f"Got {len(scales)} scales for {len(semitones)} notes; pass one per note or a single Scale."
+        )
+    else:
+        # scales are compared by identity, so every distinct object is looked at once
+        rows: Dict[int, int] = {}
+        distinct = []
+        notes = np.empty(len(scales), dtype=np.intp)
+        for i, scale in enumerate(scales):
+            row = rows.get(id(scale))
+            if row is None:
+                row = rows[id(scale)] = len(distinct)
+                distinct.append(scale)
+            notes[i] = row
+        scales = distinct
+    known = [scale is not None for scale in scales]
+    if not any(known) or len(semitones) == 0:
+        return (
+            np.full(len(semitones), NO_DEGREE, dtype=np.int8),
+            np.zeros(len(semitones), dtype=np.int16),
+        )
+    roots = [_root(scale) for scale in scales if scale is not None]
+    indices = list(dict.fromkeys(index for index, _, _ in roots))
+    type_rows = {index: row for row, index in enumerate(indices)}
+    # per distinct scale: row of its type, root fifths (and whether they are known), root semitones
+    scale_rows = np.zeros((len(scales), 4), dtype=np.int64)
+    scale_rows[known] = [
+        (type_rows[index], root_fifths or 0, root_fifths is not None, root_semitones)
+        for index, root_fifths, root_semitones in roots
+    ]
+    per_note = scale_rows[notes]
+    types, root_fifths, has_fifths, root_semitones = per_note.T
+    semitone_degrees = np.array(
+        [index.semitone_degrees for index in indices], dtype=np.int64
+    ).reshape(len(indices), 12, 2)
+    relative = (semitones - root_semitones) % 12
+    degrees = semitone_degrees[types, relative, 0]
+    alterations = semitone_degrees[types, relative, 1]
+    if fifths is not None and any(index.spelled for index in indices):
+        spelled_types = np.array([index.spelled for index in indices], dtype=bool)
+        selected = (has_fifths == 1) & spelled_types[types]
+        selected_types = types[selected]
+        relative = fifths[selected] - root_fifths[selected]
+        step = 4 * relative % 7
+        step_degrees = np.array([index.step_degrees for index in indices])
+        step_fifths = np.array([index.step_fifths for index in indices])
+        spelled_degrees = step_degrees[selected_types, step]
+        spelled_alterations = (relative - step_fifths[selected_types, step]) // 7
+        # scales with several degrees on one step: the first degree with the exact fifths wins
+        width = max(len(index.fifths) for index in indices)
+        members = np.full((len(indices), width), np.iinfo(np.int64).max)
+        for row, index in enumerate(indices):
+            members[row, : len(index.fifths)] = index.fifths
+        for position in reversed(range(width)):
+            exact = members[selected_types, position] == relative
+            spelled_degrees[exact] = position + 1
+            spelled_alterations[exact] = 0
+        degrees[selected] = spelled_degrees
+        alterations[selected] = spelled_alterations
+    alterations[degrees == NO_DEGREE] = 0
+    if not all(known):
+        unknown = ~np.array(known)[notes]
+        degrees[unknown], alterations[unknown] = NO_DEGREE, 0
+    return degrees.astype(np.int8), alterations.astype(np.int16)
+
+
+if __name__ == "__main__":
+    import time
+
+    from harmony import MajorPentatonicScale, MajorScale
+    from pitch import EPC, SPC
+    from pitch_arrays import EPCArray, SPCArray
+
+    c_major = MajorScale(SPC("C"))
+    for name in ("C", "F#", "Eb", "E#", "Bbb"):
+        print(f"{name} in C major: {scale_degree(SPC(name), c_major)}")
+    print(
+        f"EPC(6) in C major: {scale_degree(EPC(6), c_major)}, "
+        f"EPC(8): {scale_degree(EPC(8), c_major)}"
+    )
+    print(
+        f"F in C pentatonic: {scale_degree(SPC('F'), MajorPentatonicScale(SPC('C')))}"
+    )
+    melody = SPCArray(["C", "D", "Eb", "F#", "G", "A", "Bb", "C"])
+    print(f"Melody in C major: {label_degrees(melody, c_major)}")
+    local = [c_major] * 4 + [MajorScale(SPC("Bb"))] * 4
+    print(f"With modulation: {label_degrees(melody, local)[0]}")
+    print(f"Enharmonic: {label_degrees(EPCArray([0, 2, 3, 6, 7, 9, 10, 0]), c_major)}")
+
+    rng = np.random.default_rng(0)
+    notes = rng.integers(-10, 11, 1_000_000)
+    keys = [MajorScale(SPC._from_int(root)) for root in range(-6, 7)]
+    scales = [keys[i] for i in rng.integers(0, len(keys), len(notes)).tolist()]
+    start = time.perf_counter()
+    degrees, alterations = label_degrees(notes, scales)
+    print(f"{len(notes)} notes in {time.perf_counter() - start:.2f} s")
@@ -1,9 +1,14 @@
 """Module for harmonic objects of all kinds and all levels of abstraction."""
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Collection, Tuple
+from collections import OrderedDict
+from numbers import Integral
+from typing import Callable, Collection, Dict, List, NamedTuple, Optional, Tuple, Type
 
-from abstract import Point
+from abstract import IntType, Point, SemitonesScalar
 from pitch import IntervalClass, PitchClass
+from pitch_sets import EnharmonicPitchClassSet, SpecificPitchClassSet
 
 # Setting the aliases SPC and SIC to the actual implementation of pitch and interval types
 # That way, users can replace the internal types with those from music21, DCMLab/pitchtypes, or other
@@ -14,6 +19,113 @@ SIC = pitch.SpecificIntervalClass
 EPC = pitch.EnharmonicPitchClass
 
 
+class Backend(NamedTuple):
+    """The constructors that the aliases SPC, SIC, and EPC are bound to, and the converter of values of other
+    backends into this one."""
+
+    name: str
+    SPC: Callable
+    SIC: Callable
+    EPC: Callable
+    convert: Callable
+
+
+class RawSemitones(int):
+    """Integer of the raw backend that counts semitones, as the values of the EnharmonicPitchClasses of the pitch
+    backend do. All other raw integers count fifths. Arithmetic returns plain integers."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"RawSemitones({int(self)})"
+
+
+def _raw_constructor(pitch_type: Type[IntType]) -> Callable[..., int]:
+    """Wraps a pitch type such that it returns the integer value of the parsed input: fifths, or RawSemitones for
+    enharmonic types."""
+
+    def construct(value) -> int:
+        if issubclass(pitch_type, SemitonesScalar):
+            return RawSemitones(pitch_type(value))
+        return int(pitch_type(value))
+
+    construct.__name__ = construct.__qualname__ = f"raw_{pitch_type.__name__}"
+    return construct
+
+
+BACKENDS: Dict[str, Backend] = {}
+"""Available backends by name: 'pitch' (the types of pitch.py) and 'raw' (integers, i.e. fifths for SPC and SIC and
+RawSemitones for EPC, which selectors with integer roots concretize without creating pitch objects)."""
+
+_backend = "pitch"
+
+
+def get_backend() -> Backend:
+    """The backend that the aliases SPC, SIC, and EPC are currently bound to."""
+    return BACKENDS[_backend]
+
+
+def set_backend(name: str) -> Backend:
+    """Rebinds the aliases SPC, SIC, and EPC of this module. Modules that imported the aliases keep the previous
+    binding, so access them as harmony.SPC etc. to follow switches.
+
+    Args:
+        name: One of BACKENDS.
+
+    Returns:
+        The previous backend, e.g. for restoring it afterwards.
+    """
+    global SPC, SIC, EPC, _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}. Choose from {list(BACKENDS)}.")
+    previous = get_backend()
+    backend = BACKENDS[name]
+    SPC, SIC, EPC = backend.SPC, backend.SIC, backend.EPC
+    _backend = name
+    return previous
+
+
+def _is_raw(value) -> bool:
+    """Whether a value is a plain integer of the raw backend rather than an IntType."""
+    return isinstance(value, Integral) and not isinstance(value, IntType)
+
+
+CONCRETIZATION_CACHE_SIZE = 4096
+"""Maximum number of (selector class, root) combinations whose concretization is kept in memory."""
+
+_CONCRETIZATIONS: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+SELECTOR_TYPES: List[Type["PitchClassSelector"]] = []
+"""All PitchClassSelector subclasses with non-empty intervals, in order of definition, such that the index of a
+class is its type_id. Filled by PitchClassSelector.__init_subclass__()."""
+
+
+def _concretization(
+    selector: Type["PitchClassSelector"], root: Optional[Point]
+) -> tuple:
+    """Returns the concretization of the selector class's intervals for the given root from a shared,
+    size-bounded cache, so that, e.g., all MajorChords on F# share one tuple.
+
+    Args:
+        selector: PitchClassSelector subclass.
+        root: Root which is either None or compared by type and integer value.
+    """
+    if root is not None and not isinstance(root, int):
+        # the cache requires integer-valued roots
+        return selector._concretize(root)
+    key = (selector, type(root), None if root is None else int(root))
+    try:
+        members = _CONCRETIZATIONS[key]
+    except KeyError:
+        members = selector._concretize(root)
+        _CONCRETIZATIONS[key] = members
+        if len(_CONCRETIZATIONS) > CONCRETIZATION_CACHE_SIZE:
+            _CONCRETIZATIONS.popitem(last=False)
+    else:
+        _CONCRETIZATIONS.move_to_end(key)
+    return members
+
+
 class Harmony(ABC):
     """Superclass for harmonic objects of all kinds and all levels of abstraction."""
 
@@ -27,6 +139,24 @@ class PitchClassSelector(Harmony):
     intervals: Collection[IntervalClass]
     """Collection of intervals that define a collection of pitch classes when added to a reference, the root."""
 
+    type_id: Optional[int] = None
+    """Index of the class in SELECTOR_TYPES, None for classes without intervals."""
+
+    label: Optional[str] = None
+    """Type name used after the colon in labels such as 'Bb:pent' (see labels.py), None if there is none. Only the
+    class defining it is labeled; subclasses need to define their own label."""
+
+    _frozen: bool = False
+    _hash: Optional[int] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if len(getattr(cls, "intervals", ())) > 0:
+            cls.type_id = len(SELECTOR_TYPES)
+            SELECTOR_TYPES.append(cls)
+        else:
+            cls.type_id = None
+
     def __init__(self, root: PitchClass = None):
         """
 
@@ -41,33 +171,158 @@ class PitchClassSelector(Harmony):
 
     @root.setter
     def root(self, root: Point):
+        if self._frozen:
+            raise AttributeError(f"The root of the frozen {self} cannot be changed.")
         self._root = root
-        self._concretize()
+        self._hash = None  # computed on demand by __hash__()
+        self._members = None  # concretized on demand by _concretized()
+        self._sets = None  # computed on demand by _pitch_class_sets()
+
+    def __reduce__(self):
+        """Selectors defined in this module whose root is None or one of pitch.PICKLE_TYPES are pickled compactly
+        as (type_id, root type code, root value), followed by True for frozen selectors; others as class, root, and
+        frozen state. Cached members are not pickled."""
+        cls, root = type(self), self._root
+        root_code = -1 if root is None else pitch.PICKLE_CODES.get(type(root))
+        if cls.__module__ != __name__ or cls.type_id is None or root_code is None:
+            return cls, (root,), {"_frozen": True} if self._frozen else None
+        arguments = (cls.type_id, root_code, 0 if root is None else int(root))
+        return _unpickle_selector, (arguments + (True,) if self._frozen else arguments)
+
+    def freeze(self) -> PitchClassSelector:
+        """Makes the root read-only, e.g. before a selector is shared or used as a dict key or set member, so that it
+        cannot change there. Hashing does not freeze implicitly. The frozen state survives pickling. Returns the
+        selector itself."""
+        self._frozen = True
+        return self
+
+    def _key(self) -> tuple:
+        """Selectors are equal if they have the same type and roots of the same type and value."""
+        root = self._root
+        if root is None or isinstance(root, int):
+            return type(self), type(root), None if root is None else int(root)
+        return type(self), type(root), root
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PitchClassSelector):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """Hashes the same key as __eq__(). The hash is kept until the root changes."""
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
+
+    def _concretized(self) -> tuple:
+        """Returns the concretization of self.intervals for self.root, computing it on first access only."""
+        if self._members is None:
+            self._members = _concretization(type(self), self._root)
+        return self._members
+
+    def _pitch_class_sets(
+        self,
+    ) -> Tuple[EnharmonicPitchClassSet, Optional[SpecificPitchClassSet]]:
+        """Returns the concretization as enharmonic and as spelled bitset, computing them on first access only."""
+        if self._sets is None:
+            members = self._concretized()
+            if _is_raw(self._root):
+                if self._raw_semitones(self._root):
+                    self._sets = (EnharmonicPitchClassSet(members), None)
+                else:
+                    semitones = (7 * member for member in members)
+                    spelled = SpecificPitchClassSet(members)
+                    self._sets = (EnharmonicPitchClassSet(semitones), spelled)
+                return self._sets
+            if any(isinstance(member, SemitonesScalar) for member in members):
+                spelled = None
+            else:
+                spelled = SpecificPitchClassSet(members)
+            self._sets = (EnharmonicPitchClassSet(members), spelled)
+        return self._sets
+
+    @classmethod
+    def _enharmonic(cls) -> bool:
+        """Whether any of the intervals is enharmonic, which makes integer roots of the raw backend semitones
+        rather than fifths."""
+        return any(isinstance(interval, SemitonesScalar) for interval in cls.intervals)
+
+    @classmethod
+    def _raw_semitones(cls, root: Integral) -> bool:
+        """Whether the concretization for a root of the raw backend consists of semitones rather than fifths, as the
+        concretization of EnharmonicPitchClass roots or of enharmonic intervals does in the pitch backend."""
+        return isinstance(root, RawSemitones) or cls._enharmonic()
+
+    @classmethod
+    def _concretize_raw(cls, root: Integral) -> Tuple[int, ...]:
+        """The concretization for a root of the raw backend: fifths, or RawSemitones for RawSemitones roots and
+        enharmonic intervals."""
+        if cls._raw_semitones(root):
+            semitones = int(root) if isinstance(root, RawSemitones) else 7 * int(root)
+            return tuple(
+                RawSemitones((semitones + EnharmonicPitchClassSet._bit(interval)) % 12)
+                for interval in cls.intervals
+            )
+        return tuple(int(root) + int(interval) for interval in cls.intervals)
 
+    @property
+    def enharmonic_set(self) -> EnharmonicPitchClassSet:
+        """The concretized pitch classes as 12-bit set. Without root, the intervals are taken relative to C."""
+        return self._pitch_class_sets()[0]
+
+    @property
+    def spelled_set(self) -> Optional[SpecificPitchClassSet]:
+        """The concretized pitch classes as set on the line of fifths, None if the root or the intervals are
+        enharmonic. Without root, the intervals are taken relative to C."""
+        return self._pitch_class_sets()[1]
+
+    @classmethod
     @abstractmethod
-    def _concretize(self) -> None:
-        """The method that turns self.intervals into some other collection based on self.root."""
+    def _concretize(cls, root: Optional[Point]) -> tuple:
+        """The method that turns cls.intervals into some other collection based on a root."""
         pass
 
 
+def _unpickle_selector(
+    type_id: int, root_code: int, root_value: int, frozen: bool = False
+) -> PitchClassSelector:
+    """Inverse of PitchClassSelector.__reduce__()."""
+    root = (
+        None if root_code < 0 else pitch.PICKLE_TYPES[root_code]._from_int(root_value)
+    )
+    selector = SELECTOR_TYPES[type_id](root)
+    return selector.freeze() if frozen else selector
+
+
+def selector_types(
+    base: Type[PitchClassSelector] = PitchClassSelector,
+) -> List[Type[PitchClassSelector]]:
+    """Returns the registered PitchClassSelector subclasses deriving from ``base``, e.g. all Scale types.
+
+    Args:
+        base: Common superclass of the returned types.
+    """
+    return [selector for selector in SELECTOR_TYPES if issubclass(selector, base)]
+
+
 class Chord(PitchClassSelector):
     """Superclass for all PitchClassSelectors that assign meaning within a chord to one or several pitch classes."""
 
     intervals: Tuple[IntervalClass] = ()
 
-    def __init__(self, root: PitchClass = None):
-        self.chord_tones = ()
-        super().__init__(root)
+    @property
+    def chord_tones(self) -> tuple:
+        return self._concretized()
 
-    def _concretize(self) -> None:
-        if self.root is None:
+    @classmethod
+    def _concretize(cls, root: Optional[PitchClass]) -> tuple:
+        if root is None:
             # scale degrees expressed as intervals
-            self.chord_tones = tuple(self.intervals)
-        else:
-            # scale degrees expressed as pitch classes because self.root is a pitch class
-            self.chord_tones = tuple(
-                self.root + interval for interval in self.intervals
-            )
+            return tuple(cls.intervals)
+        if _is_raw(root):
+            return cls._concretize_raw(root)
+        # scale degrees expressed as pitch classes because root is a pitch class
+        return tuple(root + interval for interval in cls.intervals)
 
     def __str__(self):
         return f"Chord{self.chord_tones}"
@@ -78,56 +333,133 @@ class Scale(PitchClassSelector):
 
     intervals: Tuple[IntervalClass] = ()
 
-    def __init__(self, root: PitchClass = None):
-        self.scale_degrees = ()
-        super().__init__(root)
+    @property
+    def scale_degrees(self) -> tuple:
+        return self._concretized()
 
-    def _concretize(self) -> None:
-        if self.root is None:
+    @classmethod
+    def _concretize(cls, root: Optional[PitchClass]) -> tuple:
+        if root is None:
             # scale degrees expressed as intervals
-            self.scale_degrees = tuple(self.intervals)
-        else:
-            # scale degrees expressed as pitch classes because self.root is a pitch class
-            self.scale_degrees = tuple(
-                self.root + interval for interval in self.intervals
-            )
+            return tuple(cls.intervals)
+        if _is_raw(root):
+            return cls._concretize_raw(root)
+        # scale degrees expressed as pitch classes because root is a pitch class
+        return tuple(root + interval for interval in cls.intervals)
 
     def __str__(self):
         return f"Scale{self.scale_degrees}"
 
 
 class MajorChord(Chord):
-    intervals = (SIC("P1"), SIC("M3"), SIC("P5"))
+    # P1, M3, P5 given as fifths, which spares parsing the names on import
+    intervals = (SIC(0), SIC(4), SIC(1))
+    label = "maj"
 
 
 class MajorScale(Scale):
     intervals = (SIC(0), SIC(2), SIC(4), SIC(-1), SIC(1), SIC(3), SIC(5))
+    label = "major"
 
 
 class MajorPentatonicScale(Scale):
     intervals = (SIC(0), SIC(2), SIC(4), SIC(1), SIC(3))
+    label = "pent"
+
+
+def to_raw(value):
+    """Converts values into the raw backend at the boundary of an inner loop: SemitonesScalars become RawSemitones,
+    other IntTypes their integer values, selectors get raw roots, and tuples and lists are converted element-wise.
+    Raw values are returned as they are.
+    """
+    if isinstance(value, PitchClassSelector):
+        root = value.root
+        return type(value)(None if root is None else to_raw(root))
+    if isinstance(value, (tuple, list)):
+        return type(value)(to_raw(element) for element in value)
+    if isinstance(value, SemitonesScalar):
+        return RawSemitones(value)
+    if isinstance(value, IntType):
+        return int(value)
+    if isinstance(value, Integral):
+        return value
+    raise TypeError(f"{value!r} cannot be converted into the raw backend.")
+
+
+def to_pitch(value, pitch_type: Type[IntType] = pitch.SpecificPitchClass):
+    """Inverse of to_raw(): RawSemitones become EnharmonicPitchClasses, other integers instances of pitch_type,
+    selectors with raw roots get EnharmonicPitchClass roots for RawSemitones and SpecificPitchClass roots otherwise.
+    IntTypes are returned as they are.
+
+    Args:
+        value: Raw value, selector, or tuple or list of them.
+        pitch_type: Type of plain integers, whose meaning the raw backend does not record.
+    """
+    if isinstance(value, PitchClassSelector):
+        root = value.root
+        if not _is_raw(root):
+            return value
+        if isinstance(root, RawSemitones):
+            return type(value)(pitch.EnharmonicPitchClass(int(root)))
+        return type(value)(pitch.SpecificPitchClass._from_int(int(root)))
+    if isinstance(value, (tuple, list)):
+        return type(value)(to_pitch(element, pitch_type) for element in value)
+    if isinstance(value, RawSemitones):
+        return pitch.EnharmonicPitchClass(int(value))
+    if _is_raw(value):
+        return pitch_type(int(value))
+    if isinstance(value, IntType):
+        return value
+    raise TypeError(f"{value!r} cannot be converted into the pitch backend.")
+
+
+BACKENDS["pitch"] = Backend(
+    "pitch",
+    pitch.SpecificPitchClass,
+    pitch.SpecificIntervalClass,
+    pitch.EnharmonicPitchClass,
+    to_pitch,
+)
+BACKENDS["raw"] = Backend(
+    "raw",
+    _raw_constructor(pitch.SpecificPitchClass),
+    _raw_constructor(pitch.SpecificIntervalClass),
+    _raw_constructor(pitch.EnharmonicPitchClass),
+    to_raw,
+)
 
 
 if __name__ == "__main__":
     major_chord = MajorChord()
     print(
-        f"Abstract major chord with scale degrees expressed as specific intervals: {major_chord.__dict__}"
+        f"Abstract major chord with scale degrees expressed as specific intervals: {major_chord.chord_tones}"
     )
     major_chord.root = EPC(1)
     print(
-        f"Concrete major chord after setting root to {major_chord.root}: {major_chord.__dict__}"
+        f"Concrete major chord after setting root to {major_chord.root}: {major_chord.chord_tones}"
     )
     major_chord.root = SPC("F#")
     print(
-        f"Concrete major chord after setting root to {major_chord.root}: {major_chord.__dict__}"
+        f"Concrete major chord after setting root to {major_chord.root}: {major_chord.chord_tones}"
     )
     print(f"Major chord initialized with root Cb: {MajorChord(SPC(-7))}")
     major_scale = MajorScale()
     print(
-        f"Abstract major scale with scale degrees expressed as enharmonic intervals: {major_scale.__dict__}"
+        f"Abstract major scale with scale degrees expressed as enharmonic intervals: {major_scale.scale_degrees}"
     )
     major_scale.root = SPC("C#")
     print(
         f"Concrete major scale after setting root to {major_scale.root}: {major_scale}"
     )
     print(f"Major pentatonic scale with root Gb: {MajorPentatonicScale(SPC(-6))}")
+    print(
+        f"Major scale on C# as bitsets: {major_scale.spelled_set}, {major_scale.enharmonic_set}"
+    )
+    print(f"E# fits the scale: {SPC('E#') in major_scale.spelled_set}")
+    previous = set_backend("raw")
+    raw_scale = MajorScale(SPC("C#"))
+    print(
+        f"Raw backend: SPC('C#') = {SPC('C#')}, {raw_scale}, {to_pitch(raw_scale) == major_scale}"
+    )
+    print(f"Raw backend: EPC(1) = {EPC(1)!r}, {MajorScale(EPC(1))}")
+    set_backend(previous.name)
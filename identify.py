@@ -0,0 +1,270 @@
+"""Identification of Chord and Scale types and roots from sounding pitch classes via inverted indices keyed by
+transposition-normalized bitsets (see pitch_sets). A query costs one normalization and one dictionary lookup,
+independently of the number of registered types."""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+import numpy as np
+
+from abstract import FifthsScalar, IntType, SemitonesScalar
+from harmony import SELECTOR_TYPES, PitchClassSelector
+from pitch import EnharmonicPitchClass, SpecificPitchClass
+from pitch_sets import (
+    FIFTHS_WINDOW,
+    EnharmonicPitchClassSet,
+    PitchClassSet,
+    SpecificPitchClassSet,
+)
+
+Match = Tuple[Type[PitchClassSelector], IntType]
+"""A selector type together with a root for which it matches the query."""
+
+
+def _rotate(mask: int, steps: int) -> int:
+    steps %= 12
+    return ((mask << steps) | (mask >> (12 - steps))) & 0xFFF
+
+
+def _build_rotation_tables() -> Tuple[np.ndarray, np.ndarray, List[Tuple[int, ...]]]:
+    """For every 12-bit mask, computes the canonical rotation (the smallest mask among all rotations), the smallest
+    offset ``b`` such that ``mask == _rotate(canonical, b)``, and all such offsets."""
+    canonical = np.zeros(4096, dtype=np.int16)
+    offset = np.zeros(4096, dtype=np.int8)
+    offsets = []
+    for mask in range(4096):
+        rotations = [_rotate(mask, -b) for b in range(12)]
+        smallest = min(rotations)
+        canonical[mask] = smallest
+        offsets.append(
+            tuple(b for b, rotated in enumerate(rotations) if rotated == smallest)
+        )
+        offset[mask] = offsets[-1][0]
+    return canonical, offset, offsets
+
+
+CANONICAL_ROTATION, ROTATION_OFFSET, _ROTATION_OFFSETS = _build_rotation_tables()
+"""Lookup tables indexed by 12-bit masks: the transposition-normalized mask and the transposition from it."""
+
+
+def _submasks(mask: int) -> Iterable[int]:
+    """Yields all non-empty masks whose bits are a subset of the given mask's bits."""
+    sub = mask
+    while sub:
+        yield sub
+        sub = (sub - 1) & mask
+
+
+def _normalize_fifths(mask: int) -> Tuple[int, int]:
+    """Returns a SpecificPitchClassSet mask shifted such that its lowest bit is bit 0, and the fifths of the
+    lowest bit."""
+    lowest = (mask & -mask).bit_length() - 1
+    return mask >> lowest, lowest + FIFTHS_WINDOW.start
+
+
+class IdentificationIndex:
+    """Inverted indices mapping transposition-normalized pitch-class sets to the PitchClassSelector types that
+    contain (superset queries) or consist of (exact queries) a transposition of the set.
+    """
+
+    def __init__(self, types: Optional[Iterable[Type[PitchClassSelector]]] = None):
+        """
+
+        Args:
+            types: PitchClassSelector subclasses to index. Defaults to all registered ones.
+        """
+        self.types: List[Type[PitchClassSelector]] = []
+        # normalized mask -> [(type, transposition of the normalized mask that is part of the type on C)]
+        # with transpositions in semitones for enharmonic and in fifths for spelled masks
+        self._enharmonic_exact: Dict[int, List[Tuple[Type, int]]] = defaultdict(list)
+        self._enharmonic_subsets: Dict[int, List[Tuple[Type, int]]] = defaultdict(list)
+        self._spelled_exact: Dict[int, List[Tuple[Type, int]]] = defaultdict(list)
+        self._spelled_subsets: Dict[int, List[Tuple[Type, int]]] = defaultdict(list)
+        self.add_types(SELECTOR_TYPES if types is None else types)
+
+    def add_types(self, types: Iterable[Type[PitchClassSelector]]) -> None:
+        """Indexes all given types that are not yet part of the index."""
+        for selector in dict.fromkeys(types):
+            if selector in self.types:
+                continue
+            self.types.append(selector)
+            enharmonic = EnharmonicPitchClassSet(selector.intervals).mask
+            for sub in _submasks(enharmonic):
+                entry = (selector, int(ROTATION_OFFSET[sub]))
+                self._enharmonic_subsets[int(CANONICAL_ROTATION[sub])].append(entry)
+            self._enharmonic_exact[int(CANONICAL_ROTATION[enharmonic])].append(
+                (selector, int(ROTATION_OFFSET[enharmonic]))
+            )
+            if any(isinstance(i, SemitonesScalar) for i in selector.intervals):
+                continue
+            spelled = SpecificPitchClassSet(selector.intervals).mask
+            for sub in _submasks(spelled):
+                key, shift = _normalize_fifths(sub)
+                self._spelled_subsets[key].append((selector, shift))
+            key, shift = _normalize_fifths(spelled)
+            self._spelled_exact[key].append((selector, shift))
+
+    def update(self) -> None:
+        """Indexes the PitchClassSelector types registered since the index was built."""
+        if len(self.types) < len(SELECTOR_TYPES):
+            self.add_types(SELECTOR_TYPES)
+
+    def _match_enharmonic(self, mask: int, superset: bool) -> List[Match]:
+        if mask == 0:
+            return []
+        index = self._enharmonic_subsets if superset else self._enharmonic_exact
+        entries = index.get(int(CANONICAL_ROTATION[mask]), ())
+        matches: Set[Tuple[Type, int]] = set()
+        for selector, template_offset in entries:
+            for query_offset in _ROTATION_OFFSETS[mask]:
+                matches.add((selector, (query_offset - template_offset) % 12))
+        return self._sorted(matches, EnharmonicPitchClass)
+
+    def _match_spelled(self, mask: int, superset: bool) -> List[Match]:
+        if mask == 0:
+            return []
+        index = self._spelled_subsets if superset else self._spelled_exact
+        key, query_shift = _normalize_fifths(mask)
+        matches = {
+            (selector, query_shift - template_shift)
+            for selector, template_shift in index.get(key, ())
+        }
+        return self._sorted(matches, SpecificPitchClass)
+
+    @staticmethod
+    def _sorted(
+        matches: Set[Tuple[Type, int]], root_type: Type[IntType]
+    ) -> List[Match]:
+        return [
+            (selector, root_type._from_int(root))
+            for selector, root in sorted(matches, key=lambda m: (m[0].type_id, m[1]))
+        ]
+
+    def match(
+        self,
+        pitch_classes: Union[PitchClassSet, Iterable[IntType]],
+        superset: bool = False,
+    ) -> List[Match]:
+        """Returns the selector types and roots whose pitch classes equal (or include, if ``superset``) the given
+        ones. Spelled pitch classes are matched on the line of fifths, enharmonic ones modulo 12, i.e. pass
+        ``spelled_set.enharmonic`` to ignore spelling.
+
+        Args:
+            pitch_classes: A PitchClassSet or an iterable of either spelled or enharmonic pitch classes.
+            superset: Pass True to find all types containing the pitch classes rather than exactly matching.
+
+        Returns:
+            (type, root) pairs sorted by type_id and root, with SpecificPitchClass roots for spelled queries
+            and EnharmonicPitchClass roots otherwise.
+        """
+        if not isinstance(pitch_classes, PitchClassSet):
+            pitch_classes = list(pitch_classes)
+            if all(isinstance(pc, FifthsScalar) for pc in pitch_classes):
+                pitch_classes = SpecificPitchClassSet(pitch_classes)
+            else:
+                pitch_classes = EnharmonicPitchClassSet(pitch_classes)
+        if isinstance(pitch_classes, SpecificPitchClassSet):
+            return self._match_spelled(pitch_classes.mask, superset)
+        return self._match_enharmonic(pitch_classes.mask, superset)
+
+    def match_masks(
+        self, masks: np.ndarray, superset: bool = False
+    ) -> List[List[Match]]:
+        """Batch version of match() for enharmonic queries given as array of 12-bit masks. Every distinct
+        transposition class is looked up only once.
+
+        Args:
+            masks: Integer array of masks in which bit i stands for EPC(i), e.g. EnharmonicPitchClassSet.mask.
+            superset: See match().
+
+        Returns:
+            One list of matches per mask, in the flattened order of ``masks``.
+        """
+        masks = np.asarray(masks).ravel()
+        if masks.size and (masks.min() < 0 or masks.max() > 0xFFF):
+            raise ValueError("Enharmonic masks need to lie between 0 and 0xFFF.")
+        masks = masks.astype(np.intp)
+        unique, inverse = np.unique(masks, return_inverse=True)
+        results = [self._match_enharmonic(int(mask), superset) for mask in unique]
+        return [results[i] for i in inverse]
+
+    def match_fifths(
+        self,
+        fifths: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        superset: bool = False,
+    ) -> List[List[Match]]:
+        """Batch version of match() for spelled queries given as rows of fifths, e.g. as read by
+        annotation_tables.iter_annotation_chunks(). The rows are normalized in a vectorized fashion and every
+        distinct normalized set is looked up only once.
+
+        Args:
+            fifths: 2D integer array with one query per row.
+            mask: Boolean array of the same shape, False for padding. Defaults to all True.
+            superset: See match().
+
+        Returns:
+            One list of matches per row.
+        """
+        fifths = np.atleast_2d(np.asarray(fifths, dtype=np.int64))
+        mask = (
+            np.ones(fifths.shape, dtype=bool) if mask is None else np.atleast_2d(mask)
+        )
+        big = np.iinfo(np.int64).max
+        lowest = np.where(mask, fifths, big).min(axis=1)
+        empty = ~mask.any(axis=1)
+        lowest[empty] = 0
+        shifted = np.where(mask, fifths - lowest[:, None], 0)
+        # no template spans more than 62 fifths, wider queries cannot match anything
+        too_wide = shifted.max(axis=1, initial=0) > 62
+        shifted[too_wide] = 0
+        keys = np.bitwise_or.reduce(np.where(mask, np.int64(1) << shifted, 0), axis=1)
+        keys[too_wide | empty] = 0
+        index = self._spelled_subsets if superset else self._spelled_exact
+        unique, inverse = np.unique(keys, return_inverse=True)
+        looked_up = [index.get(int(key), ()) if key else () for key in unique]
+        results = []
+        for row, u in enumerate(inverse):
+            matches = {
+                (selector, int(lowest[row]) - template_shift)
+                for selector, template_shift in looked_up[u]
+            }
+            results.append(self._sorted(matches, SpecificPitchClass))
+        return results
+
+
+_INDEX: Optional[IdentificationIndex] = None
+
+
+def get_identification_index() -> IdentificationIndex:
+    """Returns the shared index, built on first access and extended by all PitchClassSelector subclasses defined
+    in the meantime on every further access."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = IdentificationIndex()
+    else:
+        _INDEX.update()
+    return _INDEX
+
+
+def identify(
+    pitch_classes: Union[PitchClassSet, Iterable[IntType]], superset: bool = False
+) -> List[Match]:
+    """Shortcut for get_identification_index().match(); see IdentificationIndex.match()."""
+    return get_identification_index().match(pitch_classes, superset=superset)
+
+
+if __name__ == "__main__":
+    from pitch import EPC, SPC
+
+    print(f"C E G: {identify([SPC('C'), SPC('E'), SPC('G')])}")
+    print(f"Scales containing F# A#: {identify([SPC('F#'), SPC('A#')], superset=True)}")
+    print(f"Enharmonic 1 5 8: {identify([EPC(1), EPC(5), EPC(8)])}")
+    index = get_identification_index()
+    queries = [
+        EnharmonicPitchClassSet([0, 4, 7]).mask,
+        EnharmonicPitchClassSet([2, 6, 9]).mask,
+    ]
+    print(f"Batch of masks: {index.match_masks(np.array(queries))}")
+    rows = np.array([[0, 4, 1], [6, 10, 7], [-1, 0, 0]])
+    valid = np.array([[True, True, True], [True, True, True], [True, True, False]])
+    print(f"Batch of fifths: {index.match_fifths(rows, valid, superset=True)}")
@@ -0,0 +1,200 @@
+"""Estimates the key, i.e. the best fitting Scale, of the most recent notes of a stream. A histogram of the pitch
+classes within a sliding window and the number of window notes that every scale template contains are updated
+in O(1) per note (one column of the template matrix per added and per evicted note), so no window is ever scored
+from scratch.
+
+The templates are all roots of all registered Scale subclasses, taken from the universe table for spelled
+estimation and from the scales' EnharmonicPitchClassSets for enharmonic estimation, which also covers Scale types
+with enharmonic intervals. Each scale is scored
+by the cosine similarity between its binary template and the histogram, so that a pentatonic scale beats the
+major scale containing it if only the pentatonic notes occur.
+"""
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Type, Union
+
+import numpy as np
+
+from abstract import FifthsScalar, IntType, SemitonesScalar
+from harmony import Scale, selector_types
+from pitch import EPC, SPC
+from pitch_sets import FIFTHS_WINDOW
+from universe import get_universe_table
+
+ENHARMONIC_ROOTS = range(-5, 7)
+"""Roots used for enharmonic estimation, as fifths: the spellings closest to C of the twelve pitch classes."""
+
+
+class KeyEstimator:
+    """Sliding-window key estimation. Feed notes with push(), which returns the current estimate."""
+
+    def __init__(
+        self,
+        window: int = 32,
+        spelled: bool = True,
+        types: Optional[Iterable[Type[Scale]]] = None,
+    ):
+        """
+
+        Args:
+            window: Number of most recent notes that the estimate is based on.
+            spelled:
+                True for SpecificPitchClasses on the line of fifths, yielding scales with SPC roots; False for
+                EnharmonicPitchClasses, yielding scales with EPC roots.
+            types:
+                Scale subclasses to choose from. Defaults to all defined ones, except for those with enharmonic
+                intervals if spelled, since they have no place on the line of fifths.
+
+        Raises:
+            ValueError: If spelled and some of the types have enharmonic intervals.
+        """
+        if window < 1:
+            raise ValueError("The window needs to hold at least one note.")
+        self.window = window
+        self.spelled = spelled
+        if types is None:
+            types = selector_types(Scale)
+            if spelled:
+                types = [selector for selector in types if not selector._enharmonic()]
+        self.types: List[Type[Scale]] = list(types)
+        if spelled:
+            enharmonic = [
+                selector.__name__ for selector in self.types if selector._enharmonic()
+            ]
+            if len(enharmonic) > 0:
+                raise ValueError(
+                    f"{enharmonic} have enharmonic intervals and can only be estimated with spelled=False."
+                )
+            table = get_universe_table()
+            table.add_types(self.types)
+        roots = table.roots.tolist() if spelled else list(ENHARMONIC_ROOTS)
+        # simple keys first, so that they win ties
+        self._templates = sorted(
+            ((selector, root) for selector in self.types for root in roots),
+            key=lambda template: (abs(template[1]), -template[1]),
+        )
+        bins = len(FIFTHS_WINDOW) if spelled else 12
+        matrix = np.zeros((len(self._templates), bins), dtype=np.int32)
+        for row, (selector, root) in enumerate(self._templates):
+            if spelled:
+                t, r = table.type_index(selector), table.root_index(root)
+                members = table.members[t, r][table.mask[t, r]]
+                matrix[row, members - FIFTHS_WINDOW.start] = 1
+            else:
+                mask = selector(EPC._from_int(7 * root)).enharmonic_set.mask
+                matrix[row] = [mask >> semitones & 1 for semitones in range(12)]
+        self._columns = list(matrix.T.copy())
+        """Column i holds, for every template, whether it contains bin i."""
+        self._norms = 1 / np.sqrt(matrix.sum(axis=1))
+        self._scales: List[Optional[Scale]] = [None] * len(self._templates)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forgets all notes."""
+        self._bins: Deque[Optional[int]] = deque()
+        self.histogram = np.zeros(len(self._columns), dtype=np.int32)
+        """Number of notes per pitch class within the window; spelled bins stand for FIFTHS_WINDOW."""
+        self._hits = np.zeros(len(self._templates), dtype=np.int32)
+        self._best: Optional[int] = None
+
+    def _bin(self, pitch_class: Union[int, IntType]) -> Optional[int]:
+        """The histogram bin of a note, None for spelled notes outside FIFTHS_WINDOW."""
+        if not self.spelled:
+            if isinstance(pitch_class, FifthsScalar):
+                return pitch_class.semitones
+            return int(pitch_class) % 12
+        if isinstance(pitch_class, SemitonesScalar):
+            raise TypeError(
+                f"{pitch_class!r} needs to be spelled for a spelled KeyEstimator."
+            )
+        bin = int(pitch_class) - FIFTHS_WINDOW.start
+        return bin if 0 <= bin < len(self._columns) else None
+
+    def push(self, pitch_class: Union[int, IntType]) -> Scale:
+        """Adds a note, evicting the oldest one if the window is full, and returns the new estimate.
+
+        Args:
+            pitch_class: SpecificPitchClass or fifths if spelled, otherwise EnharmonicPitchClass or semitones.
+        """
+        bin = self._bin(pitch_class)
+        self._bins.append(bin)
+        if bin is not None:
+            self.histogram[bin] += 1
+            self._hits += self._columns[bin]
+        if len(self._bins) > self.window:
+            evicted = self._bins.popleft()
+            if evicted is not None:
+                self.histogram[evicted] -= 1
+                self._hits -= self._columns[evicted]
+        scores = self._hits * self._norms
+        best = int(np.argmax(scores))
+        # the previous estimate is kept unless another scale fits strictly better
+        if self._best is not None and scores[self._best] >= scores[best]:
+            best = self._best
+        self._best = best
+        return self._scale(best)
+
+    def _scale(self, index: int) -> Scale:
+        scale = self._scales[index]
+        if scale is None:
+            selector, root = self._templates[index]
+            root = SPC._from_int(root) if self.spelled else EPC._from_int(7 * root)
+            scale = self._scales[index] = selector(root)
+        return scale
+
+    @property
+    def estimate(self) -> Optional[Scale]:
+        """The current estimate, None before the first note."""
+        return None if self._best is None else self._scale(self._best)
+
+    def scores(self) -> List[tuple]:
+        """All (score, Scale type, root as fifths) of the current window, best first."""
+        scores = (self._hits * self._norms).tolist()
+        order = sorted(range(len(scores)), key=lambda i: -scores[i])
+        return [(scores[i], *self._templates[i]) for i in order]
+
+
+def estimate_keys(
+    notes: Iterable[Union[int, IntType]],
+    window: int = 32,
+    spelled: Optional[bool] = None,
+    types: Optional[Iterable[Type[Scale]]] = None,
+) -> Iterator[Scale]:
+    """Pipeline stage yielding the estimated Scale after every note.
+
+    Args:
+        notes: Stream of SpecificPitchClasses or EnharmonicPitchClasses (or their integer values).
+        window: See KeyEstimator.
+        spelled: See KeyEstimator. By default, the stream is taken to be enharmonic if its first note is.
+        types: See KeyEstimator.
+    """
+    estimator = None
+    for note in notes:
+        if estimator is None:
+            if spelled is None:
+                spelled = not isinstance(note, SemitonesScalar)
+            estimator = KeyEstimator(window, spelled, types)
+        yield estimator.push(note)
+
+
+if __name__ == "__main__":
+    import time
+
+    from harmony import MajorScale
+
+    melody = [SPC(name) for name in "C D E G A G E D C D E G".split()]
+    melody += [SPC(name) for name in "F G A Bb C D E F E D C Bb".split()]
+    estimates = list(estimate_keys(melody, window=8))
+    print(f"Spelled: {[str(scale) for scale in estimates[::4]]}")
+    semitones = [EPC(int(pc.semitones)) for pc in melody]
+    *_, last = estimate_keys(semitones, window=8)
+    print(f"Enharmonic, after the last note: {last}")
+
+    rng = np.random.default_rng(0)
+    scale = MajorScale(SPC("Eb")).scale_degrees
+    stream = [scale[i] for i in rng.integers(0, 7, 100_000).tolist()]
+    start = time.perf_counter()
+    for estimate in estimate_keys(stream, window=64):
+        pass
+    print(
+        f"{len(stream)} notes in {time.perf_counter() - start:.2f} s, final estimate {estimate}"
+    )
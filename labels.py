@@ -0,0 +1,185 @@
+"""Parses text labels such as 'F#', 'Cb:maj' or 'Bb:pent' into Chord and Scale objects. A label consists of a
+root, i.e. a note name, optionally followed by a colon and the label of a PitchClassSelector subclass (its ``label``
+attribute); without type, DEFAULT_TYPE is used.
+
+Parsed labels are memoized, so that every distinct label is parsed once and all occurrences of a label share one
+frozen (see PitchClassSelector.freeze()) instance. Whole columns of labels can be converted into arrays of type ids
+and roots instead of objects with parse_labels().
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+import numpy as np
+
+from annotation_tables import MISSING_FIFTHS
+from harmony import SELECTOR_TYPES, PitchClassSelector
+from pitch import SPC
+from pitch_helpers import CACHE_SIZE, NOTE_NAME_PATTERN, note_name2fifths
+
+LABEL_REGEX = re.compile(
+    rf"^(?P<root>{NOTE_NAME_PATTERN.strip('^$')})(?::(?P<type>[A-Za-z0-9_]+))?$"
+)
+"""Grammar of the labels: root[:type]"""
+
+DEFAULT_TYPE = "maj"
+"""Type label assumed for labels that consist of a root only."""
+
+MISSING_TYPE = -1
+"""Type id standing for empty labels in the arrays returned by parse_labels()."""
+
+_ROOT_RANGE = range(MISSING_FIFTHS + 1, int(np.iinfo(np.int16).max) + 1)
+"""Roots that parse_labels() can store next to MISSING_FIFTHS in an int16 array."""
+
+_LABEL_TYPES: Dict[str, Type[PitchClassSelector]] = {}
+_labeled_size = 0
+"""Length of SELECTOR_TYPES when _LABEL_TYPES was filled."""
+
+
+def _own_label(selector: Type[PitchClassSelector]) -> Optional[str]:
+    """The label defined by the class itself; subclasses do not inherit the label of a labeled type."""
+    return selector.__dict__.get("label")
+
+
+def label_types() -> Dict[str, Type[PitchClassSelector]]:
+    """Returns the PitchClassSelector subclasses by their label, including all subclasses defined so far.
+
+    Raises:
+        ValueError: If two subclasses define the same label.
+    """
+    global _labeled_size
+    if _labeled_size != len(SELECTOR_TYPES):
+        labeled = {}
+        for selector in SELECTOR_TYPES:
+            label = _own_label(selector)
+            if label is None:
+                continue
+            if label in labeled:
+                raise ValueError(
+                    f"{selector.__name__} and {labeled[label].__name__} use the same label {label!r}."
+                )
+            labeled[label] = selector
+        _LABEL_TYPES.clear()
+        _LABEL_TYPES.update(labeled)
+        _labeled_size = len(SELECTOR_TYPES)
+    return _LABEL_TYPES
+
+
+def _split_label(label: str) -> Tuple[Type[PitchClassSelector], int]:
+    """Returns the type and the root, as fifths, of a label."""
+    if not isinstance(label, str):
+        raise TypeError(f"'{label}' is not an accepted label.")
+    m = LABEL_REGEX.match(label)
+    if m is None:
+        raise ValueError(f"{label} is not a valid label of the form root[:type].")
+    type_label = m.group("type") or DEFAULT_TYPE
+    try:
+        selector = label_types()[type_label]
+    except KeyError:
+        raise ValueError(
+            f"{label}: unknown type {type_label!r}. Known types: {list(label_types())}"
+        ) from None
+    return selector, note_name2fifths(m.group("root"))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_label(label: str) -> PitchClassSelector:
+    """Turns a label such as 'Bb:pent' into a frozen PitchClassSelector with an SPC root. Repeated labels return
+    the same instance.
+
+    Args:
+        label: root[:type], see the module docstring.
+
+    Raises:
+        ValueError: If the label does not follow the grammar or names an unknown type.
+    """
+    selector, root = _split_label(label)
+    return selector(SPC._from_int(root)).freeze()
+
+
+def format_label(selector: PitchClassSelector) -> str:
+    """Inverse of parse_label(), e.g. 'Bb:pent'.
+
+    Raises:
+        ValueError: If the selector's type defines no label itself or its root is not a SpecificPitchClass.
+    """
+    label = _own_label(type(selector))
+    if label is None or not isinstance(selector.root, SPC):
+        raise ValueError(f"{selector} cannot be expressed as a label.")
+    return f"{selector.root.name}:{label}"
+
+
+def parse_labels(
+    labels: Iterable[str], cache: Optional[Dict[str, Tuple[int, int]]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Bulk version of parse_label() returning the type ids (see PitchClassSelector.type_id) and the roots, as
+    fifths, in two int16 NumPy arrays of the labels' shape. No objects are created, and every distinct label is
+    parsed once. Empty labels, None, and NaN yield MISSING_TYPE and annotation_tables.MISSING_FIFTHS.
+
+    Args:
+        labels: Iterable or NumPy array of labels.
+        cache:
+            Pass a dictionary to reuse conversions across several calls, e.g. for all chunks of one file.
+            It is updated with the newly converted labels.
+
+    Raises:
+        ValueError:
+            Listing every invalid label, including labels whose root lies too far out on the line of fifths for
+            int16, and the position of its first occurrence.
+    """
+    shape = labels.shape if isinstance(labels, np.ndarray) else None
+    labels = labels.ravel().tolist() if shape is not None else list(labels)
+    missing = (MISSING_TYPE, MISSING_FIFTHS)
+    converted = {"": missing} if cache is None else cache
+    converted.setdefault("", missing)
+    invalid = {}
+    for position, label in enumerate(labels):
+        if label in converted or label in invalid:
+            continue
+        if label is None or (isinstance(label, float) and label != label):
+            # missing values are not cached, since NaNs are not equal to each other
+            continue
+        try:
+            selector, root = _split_label(label)
+        except (TypeError, ValueError):
+            invalid[label] = position
+        else:
+            if root in _ROOT_RANGE:
+                converted[label] = (selector.type_id, root)
+            else:
+                invalid[label] = position
+    if len(invalid) > 0:
+        listed = ", ".join(
+            f"{label!r} (position {position})" for label, position in invalid.items()
+        )
+        raise ValueError(f"{len(invalid)} invalid labels: {listed}")
+    pairs = np.array(
+        [converted.get(label, missing) for label in labels], dtype=np.int16
+    )
+    pairs = pairs.reshape(-1, 2)
+    type_ids, roots = pairs[:, 0], pairs[:, 1]
+    if shape is not None:
+        type_ids, roots = type_ids.reshape(shape), roots.reshape(shape)
+    return type_ids, roots
+
+
+if __name__ == "__main__":
+    import time
+
+    print(
+        f"{parse_label('F#')}, {parse_label('Cb:maj')}, {parse_label('Bb:pent')}, {parse_label('Eb:major')}"
+    )
+    print(f"Cached: {parse_label('Bb:pent') is parse_label('Bb:pent')}")
+    print(f"Formatted: {format_label(parse_label('Bb:pent'))}")
+    try:
+        parse_labels(["C", "H:maj", "C:dim", "C"])
+    except ValueError as e:
+        print(e)
+    column = np.array(
+        ["F#", "Cb:maj", "", "Bb:pent", "C:major"] * 200_000, dtype=object
+    )
+    start = time.perf_counter()
+    type_ids, roots = parse_labels(column)
+    print(
+        f"{len(column)} labels in {time.perf_counter() - start:.2f} s: {type_ids[:5]}, {roots[:5]}"
+    )
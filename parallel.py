@@ -0,0 +1,163 @@
+"""Applies functions to large corpora of pitch-class objects in a process pool. Items are sent to the workers as
+integer arrays rather than as pickled lists of objects and are turned back into objects there."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from harmony import SELECTOR_TYPES, PitchClassSelector, _unpickle_selector
+from pitch import PICKLE_CODES, PICKLE_TYPES
+
+Batch = Tuple[np.ndarray, np.ndarray, np.ndarray]
+"""Encoded items: (atoms, offsets, is_sequence), see encode()."""
+
+
+def _encode_atom(atom: Any) -> Tuple[int, int, int]:
+    """Encodes a pitch object as (kind, a, b): a scalar of PICKLE_TYPES as (type code, value, 0) and a selector
+    as (-1 - 2 * type_id - frozen, root type code or -1, root value), so that frozen selectors stay frozen."""
+    code = PICKLE_CODES.get(type(atom))
+    if code is not None:
+        return code, int(atom), 0
+    if isinstance(atom, PitchClassSelector):
+        reconstruct, arguments = atom.__reduce__()[:2]
+        if (
+            reconstruct is _unpickle_selector
+        ):  # compact form, see PitchClassSelector.__reduce__()
+            type_id, root_code, root_value = arguments[:3]
+            return -1 - 2 * type_id - atom._frozen, root_code, root_value
+    raise TypeError(f"{atom!r} of type {type(atom)} cannot be encoded.")
+
+
+def _decode_atom(kind: int, a: int, b: int) -> Any:
+    if kind >= 0:
+        return PICKLE_TYPES[kind]._from_int(a)
+    root = None if a < 0 else PICKLE_TYPES[a]._from_int(b)
+    type_id, frozen = divmod(-1 - kind, 2)
+    selector = SELECTOR_TYPES[type_id](root)
+    return selector.freeze() if frozen else selector
+
+
+def encode(items: Sequence) -> Batch:
+    """Encodes items as integer arrays.
+
+    Args:
+        items:
+            Each item is either an instance of pitch.PICKLE_TYPES, a selector defined in harmony whose root is None
+            or an instance of pitch.PICKLE_TYPES, or a list or tuple of such objects.
+
+    Returns:
+        ``atoms``, an (n, 3) integer array with one row per object; ``offsets`` such that the objects of item i are
+        ``atoms[offsets[i]:offsets[i + 1]]``; and ``is_sequence``, a bool array that is False for items that are
+        single objects.
+
+    Raises:
+        TypeError: Naming the first item that cannot be encoded.
+    """
+    atoms, offsets, is_sequence = [], [0], []
+    for position, item in enumerate(items):
+        sequence = isinstance(item, (list, tuple))
+        try:
+            if sequence:
+                atoms.extend(_encode_atom(atom) for atom in item)
+            else:
+                atoms.append(_encode_atom(item))
+        except TypeError as e:
+            raise TypeError(f"Item {position} cannot be sent as integers: {e}") from e
+        offsets.append(len(atoms))
+        is_sequence.append(sequence)
+    atoms = np.array(atoms, dtype=np.int64).reshape(-1, 3)
+    # the smallest integer types holding the values keep the batches small; combining the minimal types of the
+    # lowest and the highest value would widen, e.g., int8 and uint8 to int16
+    low, high = int(atoms.min(initial=0)), int(atoms.max(initial=0))
+    dtype = next(
+        dtype
+        for dtype in (np.int8, np.int16, np.int32, np.int64)
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max
+    )
+    return (
+        atoms.astype(dtype),
+        np.array(offsets, dtype=np.min_scalar_type(len(atoms))),
+        np.array(is_sequence, dtype=bool),
+    )
+
+
+def decode(atoms: np.ndarray, offsets: np.ndarray, is_sequence: np.ndarray) -> List:
+    """Inverse of encode(); sequences are decoded as tuples."""
+    objects = [_decode_atom(*row) for row in atoms.tolist()]
+    offsets = offsets.tolist()
+    return [
+        tuple(objects[start:stop]) if sequence else objects[start]
+        for start, stop, sequence in zip(offsets, offsets[1:], is_sequence.tolist())
+    ]
+
+
+def _apply(
+    func: Callable, atoms: np.ndarray, offsets: np.ndarray, is_sequence: np.ndarray
+) -> List:
+    """Runs in the worker processes."""
+    return [func(item) for item in decode(atoms, offsets, is_sequence)]
+
+
+def map_corpus(
+    func: Callable[[Any], Any],
+    items: Sequence,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List:
+    """Returns ``[func(item) for item in items]``, computed in a pool of worker processes to which the items are
+    sent in chunks encoded as integer arrays (see encode()). Sequences arrive at ``func`` as tuples.
+
+    Args:
+        func: Function that can be pickled, i.e. defined at the top level of a module.
+        items: See encode().
+        workers: Number of processes; defaults to the number of CPUs. With 1, everything runs in this process.
+        chunk_size: Number of items per chunk; defaults to a quarter of an equal share per worker.
+
+    Raises:
+        TypeError: If an item cannot be encoded.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    atoms, offsets, is_sequence = encode(items)
+    n_items = len(is_sequence)
+    if workers <= 1 or n_items == 0:
+        return _apply(func, atoms, offsets, is_sequence)
+    if chunk_size is None:
+        chunk_size = max(1, -(-n_items // (4 * workers)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for first in range(0, n_items, chunk_size):
+            last = min(first + chunk_size, n_items)
+            bounds = offsets[first:][: last - first + 1]
+            start, stop = bounds[0], bounds[-1]
+            futures.append(
+                executor.submit(
+                    _apply,
+                    func,
+                    atoms[start:stop],
+                    bounds - start,
+                    is_sequence[first:last],
+                )
+            )
+        return [result for future in futures for result in future.result()]
+
+
+def _chord_tone_names(chord: PitchClassSelector) -> List[str]:
+    return [repr(tone) for tone in chord.chord_tones]
+
+
+if __name__ == "__main__":
+    import pickle
+
+    from harmony import EPC, SPC, MajorChord
+
+    chords = [MajorChord(SPC(fifths % 15 - 7)) for fifths in range(10_000)]
+    chords[1] = MajorChord(EPC(1))
+    print(
+        f"Pickled objects: {len(pickle.dumps(chords))} bytes, encoded: "
+        f"{sum(len(pickle.dumps(array)) for array in encode(chords))} bytes"
+    )
+    results = map_corpus(_chord_tone_names, chords, workers=2)
+    print(f"{len(results)} results, the first three: {results[:3]}")
+    assert results == [_chord_tone_names(chord) for chord in chords]
@@ -1,16 +1,34 @@
-from abc import abstractmethod
-from typing import Union
+from __future__ import annotations
 
-from abstract import FifthsScalar, IntType, Point, SemitonesScalar, Vector
+import os
+from abc import abstractmethod
+from typing import Dict, Tuple, Type, Union
+
+from abstract import (
+    FIFTHS_BASE,
+    FifthsScalar,
+    IntType,
+    Point,
+    SemitonesFifthsScalar,
+    SemitonesScalar,
+    Vector,
+    register_operation,
+)
 from pitch_helpers import (
     fifths2interval_name,
     fifths2note_name,
+    fifths_semitones2interval_name,
+    fifths_semitones2pitch_name,
     interval_name2fifths,
+    interval_name2fifths_semitones,
     note_name2fifths,
+    pitch_name2fifths_semitones,
 )
 
 
 class PitchClass(Point):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def semitones(self):
@@ -18,6 +36,8 @@ class PitchClass(Point):
 
 
 class Pitch(Point):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def semitones(self):
@@ -25,6 +45,8 @@ class Pitch(Point):
 
 
 class IntervalClass(Vector):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def semitones(self):
@@ -32,37 +54,51 @@ class IntervalClass(Vector):
 
 
 class Interval(Vector):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def semitones(self):
         pass
 
 
+def _unpickle(code: int, value: int) -> IntType:
+    """Inverse of _reduce()."""
+    return PICKLE_TYPES[code]._from_int(value)
+
+
+def _reduce(self: IntType) -> tuple:
+    """Pickles instances of PICKLE_TYPES compactly as (type code, integer value), which also makes unpickling skip
+    the conversion of the value. Instances of other subclasses are pickled by type and value."""
+    code = PICKLE_CODES.get(type(self))
+    if code is None:
+        return type(self), (int(self),)
+    return _unpickle, (code, int(self))
+
+
 class EnharmonicPitchClass(SemitonesScalar, PitchClass):
     """An EPC value is always within [0, 11] and can be interpreted as an enumeration of piano keys from C up to B
     within the same octave. EnharmonicPitchClassCs are equivalent to the PCs of pitch-class set theory."""
 
+    __slots__ = ()
+
+    __reduce__ = _reduce
+
     def __str__(self):
         return f"EPC({self.semitones})"
 
     def __repr__(self):
         return f"EPC({self.semitones})"
 
-    def __add__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, IntervalClass):
-            return EnharmonicPitchClass(self.semitones + other.semitones)
-        return super().__add__(other)
-
-    def __sub__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, IntervalClass):
-            return EnharmonicPitchClass(self.semitones - other.semitones)
-        return super().__sub__(other)
-
 
 class EnharmonicIntervalClass(SemitonesScalar, IntervalClass):
     """An EIV value is always within [0, 11] and can be interpreted as the distance between two piano keys when
     projected into the same octave."""
 
+    __slots__ = ()
+
+    __reduce__ = _reduce
+
     def __str__(self):
         return f"EIC({self.semitones})"
 
@@ -70,35 +106,23 @@ class EnharmonicIntervalClass(SemitonesScalar, IntervalClass):
         return f"EIC({self.semitones})"
 
     def __neg__(self):
-        return EnharmonicIntervalClass(-self.semitones)
+        return EnharmonicIntervalClass._from_int(-self.semitones)
 
-    def __add__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, PitchClass):
-            return EnharmonicPitchClass(self.semitones + other.semitones)
-        if isinstance(other, IntervalClass):
-            return EnharmonicIntervalClass(self.semitones + other.semitones)
-        return super().__add__(other)
 
-    def __sub__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, IntervalClass):
-            return EnharmonicIntervalClass(self.semitones - other.semitones)
-        return super().__sub__(other)
+class SpecificPitchClass(FifthsScalar, PitchClass):
+    __slots__ = ()
 
+    __reduce__ = _reduce
 
-class SpecificPitchClass(FifthsScalar, PitchClass):
     @staticmethod
-    def convert_init_value(value: Union[int, str]) -> int:
-        # TODO: Merge into FifthsScalar.convert_init_value()
+    def convert_init_value(value: Union[int, str, IntType]) -> int:
         if isinstance(value, str):
-            converted = note_name2fifths(value)
-        else:
-            converted = int(value)
-        return converted
+            return note_name2fifths(value)
+        return FifthsScalar.convert_init_value(value)
 
     @classmethod
     def from_fifths(cls, fifths: int):
-        instance = super().__new__(cls, fifths)
-        return instance
+        return cls._from_int(int(fifths))
 
     @property
     def name(self):
@@ -110,37 +134,24 @@ class SpecificPitchClass(FifthsScalar, PitchClass):
     def __repr__(self):
         return self.name
 
-    def __add__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, SpecificIntervalClass):
-            return SpecificPitchClass(self.fifths + other.fifths)
-        if isinstance(other, EnharmonicIntervalClass):
-            return EnharmonicPitchClass(self.semitones + other.semitones)
-        return super().__add__(other)
 
-    def __sub__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, SpecificIntervalClass):
-            return SpecificPitchClass(self.fifths - other.fifths)
-        if isinstance(other, EnharmonicIntervalClass):
-            return EnharmonicPitchClass(self.semitones - other.semitones)
-        return super().__sub__(other)
+class SpecificIntervalClass(FifthsScalar, IntervalClass):
+    __slots__ = ()
 
+    __reduce__ = _reduce
 
-class SpecificIntervalClass(FifthsScalar, IntervalClass):
     @staticmethod
-    def convert_init_value(value: Union[int, str]) -> int:
-        # TODO: Merge into FifthsScalar.convert_init_value()
+    def convert_init_value(value: Union[int, str, IntType]) -> int:
         if isinstance(value, str):
-            converted = interval_name2fifths(value)
-        else:
-            converted = int(value)
-        return converted
+            return interval_name2fifths(value)
+        return FifthsScalar.convert_init_value(value)
 
     @property
     def name(self):
         return fifths2interval_name(self.fifths)
 
     def __neg__(self):
-        return SpecificIntervalClass(-self.fifths)
+        return SpecificIntervalClass._from_int(-self.fifths)
 
     def __str__(self):
         return f"SIC('{self.name}')"
@@ -148,29 +159,259 @@ class SpecificIntervalClass(FifthsScalar, IntervalClass):
     def __repr__(self):
         return self.name
 
-    def __add__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, SpecificPitchClass):
-            return SpecificPitchClass(self.fifths + other.fifths)
-        if isinstance(other, SpecificIntervalClass):
-            return SpecificIntervalClass(self.fifths + other.fifths)
-        if isinstance(other, EnharmonicPitchClass):
-            return EnharmonicPitchClass(self.semitones + other.semitones)
-        if isinstance(other, EnharmonicIntervalClass):
-            return EnharmonicIntervalClass(self.semitones + other.semitones)
-        return super().__add__(other)
-
-    def __sub__(self, other: Union[int, IntType]) -> Union[int, IntType]:
-        if isinstance(other, SpecificIntervalClass):
-            return SpecificIntervalClass(self.fifths - other.fifths)
-        if isinstance(other, EnharmonicIntervalClass):
-            return EnharmonicIntervalClass(self.semitones - other.semitones)
-        return super().__sub__(other)
+
+class EnharmonicPitch(SemitonesScalar, Pitch):
+    """An EP value is a MIDI number, i.e. the piano key counted from C-1, where C4 = EP(60). Unlike the pitch
+    classes, the values are not reduced modulo 12."""
+
+    __slots__ = ()
+
+    __reduce__ = _reduce
+
+    @staticmethod
+    def convert_init_value(value: Union[int, str, IntType]) -> int:
+        if isinstance(value, SemitonesFifthsScalar):
+            converted = value.semitones
+        elif isinstance(value, str) and not value.lstrip("-").isdigit():
+            _, converted = pitch_name2fifths_semitones(value)
+        else:
+            converted = int(value)
+        return converted
+
+    @classmethod
+    def _from_int(cls, value: int) -> "EnharmonicPitch":
+        # skips SemitonesScalar._from_int(), which would reduce the value modulo 12
+        return super(SemitonesScalar, cls)._from_int(value)
+
+    @property
+    def midi(self) -> int:
+        """This pitch's MIDI number."""
+        return int(self)
+
+    @property
+    def octave(self) -> int:
+        """The octave number, such that EP(60) lies in octave 4."""
+        return int(self) // 12 - 1
+
+    @property
+    def pitch_class(self) -> EnharmonicPitchClass:
+        return EnharmonicPitchClass._from_int(int(self))
+
+    def __str__(self):
+        return f"EP({self.semitones})"
+
+    def __repr__(self):
+        return f"EP({self.semitones})"
+
+
+class EnharmonicInterval(SemitonesScalar, Interval):
+    """An EI value is the signed distance in semitones between two EnharmonicPitches."""
+
+    __slots__ = ()
+
+    __reduce__ = _reduce
+
+    @staticmethod
+    def convert_init_value(value: Union[int, str, IntType]) -> int:
+        if isinstance(value, SemitonesFifthsScalar):
+            return value.semitones
+        return int(value)
+
+    @classmethod
+    def _from_int(cls, value: int) -> "EnharmonicInterval":
+        # skips SemitonesScalar._from_int(), which would reduce the value modulo 12
+        return super(SemitonesScalar, cls)._from_int(value)
+
+    @property
+    def octave(self) -> int:
+        """The number of complete octaves spanned by the interval, negative for descending intervals."""
+        return int(self) // 12 if int(self) >= 0 else -(-int(self) // 12)
+
+    @property
+    def interval_class(self) -> EnharmonicIntervalClass:
+        return EnharmonicIntervalClass._from_int(int(self))
+
+    def __str__(self):
+        return f"EI({self.semitones})"
+
+    def __repr__(self):
+        return f"EI({self.semitones})"
+
+    def __neg__(self):
+        return EnharmonicInterval._from_int(-int(self))
+
+
+class SpecificPitch(SemitonesFifthsScalar, Pitch):
+    """A spelled pitch with octave such as 'B#3', stored as its fifths and its MIDI number (see
+    SemitonesFifthsScalar), so that SP('C4') has 0 fifths and the semitones 60, whereas SP('B#3') has 12 fifths and
+    the same semitones. Plain integers are ambiguous and rejected, both by the constructor and the operators; use
+    from_midi(), from_fifths_octaves(), or from_fifths_semitones() instead."""
+
+    __slots__ = ()
+
+    __reduce__ = _reduce
+
+    @staticmethod
+    def convert_init_value(value: Union[str, "SpecificPitch"]) -> int:
+        if isinstance(value, str):
+            fifths, semitones = pitch_name2fifths_semitones(value)
+            return semitones * FIFTHS_BASE + fifths
+        if isinstance(value, SpecificPitch):
+            return int(value)
+        raise TypeError(
+            f"Cannot create a SpecificPitch from {value!r}. Use a name or one of the from_...() constructors."
+        )
+
+    @classmethod
+    def from_fifths_octaves(cls, fifths: int, octaves: int) -> "SpecificPitch":
+        """Creates the pitch that lies ``fifths`` fifths and ``octaves`` octaves above C0, e.g. (0, 4) for C4,
+        (1, 4) for G4, and (2, 3) for D4."""
+        return cls.from_fifths_semitones(fifths, 7 * fifths + 12 * octaves + 12)
+
+    @classmethod
+    def from_midi(cls, midi: int) -> "SpecificPitch":
+        """Creates the pitch with the given MIDI number, spelled with at most five flats or six sharps, e.g. Db4 for 61
+        and F#4 for 66."""
+        midi = int(midi)
+        return cls.from_fifths_semitones((7 * midi + 5) % 12 - 5, midi)
+
+    @property
+    def midi(self) -> int:
+        """This pitch's MIDI number, which is also its semitones."""
+        return self.semitones
+
+    @property
+    def octaves(self) -> int:
+        """The octaves in from_fifths_octaves(), which are independent of the fifths."""
+        return (self.semitones - 12 - 7 * self.fifths) // 12
+
+    @property
+    def octave(self) -> int:
+        """The octave number of the pitch name, such that C4 and B#3 lie in different octaves."""
+        return (4 * self.fifths + 7 * self.octaves) // 7
+
+    @property
+    def pitch_class(self) -> SpecificPitchClass:
+        return SpecificPitchClass._from_int(self.fifths)
+
+    @property
+    def name(self):
+        return fifths_semitones2pitch_name(self.fifths, self.semitones)
+
+    def __str__(self):
+        return f"SP('{self.name}')"
+
+    def __repr__(self):
+        return self.name
+
+
+class SpecificInterval(SemitonesFifthsScalar, Interval):
+    """A spelled interval with octave such as 'M3:1' (a major tenth), stored as its fifths and its semitones (see
+    SemitonesFifthsScalar). Like SpecificPitch, it cannot be created from or combined with plain integers."""
+
+    __slots__ = ()
+
+    __reduce__ = _reduce
+
+    @staticmethod
+    def convert_init_value(value: Union[str, "SpecificInterval"]) -> int:
+        if isinstance(value, str):
+            fifths, semitones = interval_name2fifths_semitones(value)
+            return semitones * FIFTHS_BASE + fifths
+        if isinstance(value, SpecificInterval):
+            return int(value)
+        raise TypeError(
+            f"Cannot create a SpecificInterval from {value!r}. Use a name or one of the from_...() constructors."
+        )
+
+    @classmethod
+    def from_fifths_octaves(cls, fifths: int, octaves: int) -> "SpecificInterval":
+        """Creates the interval spanning ``fifths`` fifths plus ``octaves`` octaves, e.g. (4, -2) for 'M3:0'."""
+        return cls.from_fifths_semitones(fifths, 7 * fifths + 12 * octaves)
+
+    @property
+    def octaves(self) -> int:
+        """The octaves in from_fifths_octaves(), which are independent of the fifths."""
+        return (self.semitones - 7 * self.fifths) // 12
+
+    @property
+    def steps(self) -> int:
+        """The number of diatonic steps, e.g. 2 for a third and -4 for a descending fifth."""
+        return 4 * self.fifths + 7 * self.octaves
+
+    @property
+    def interval_class(self) -> SpecificIntervalClass:
+        return SpecificIntervalClass._from_int(self.fifths)
+
+    @property
+    def name(self):
+        return fifths_semitones2interval_name(self.fifths, self.semitones)
+
+    def __neg__(self):
+        return SpecificInterval._from_int(-int(self))
+
+    def __str__(self):
+        return f"SI('{self.name}')"
+
+    def __repr__(self):
+        return self.name
 
 
 EPC = EnharmonicPitchClass
 EIC = EnharmonicIntervalClass
 SPC = SpecificPitchClass
 SIC = SpecificIntervalClass
+EP = EnharmonicPitch
+EI = EnharmonicInterval
+SP = SpecificPitch
+SI = SpecificInterval
+
+PICKLE_TYPES: Tuple[Type[IntType], ...] = (EPC, EIC, SPC, SIC, EP, EI, SP, SI)
+"""Types that are pickled as their index in this tuple and their integer value. Only ever append to it, so that
+existing pickles remain readable."""
+
+PICKLE_CODES: Dict[type, int] = {cls: code for code, cls in enumerate(PICKLE_TYPES)}
+"""Index of every type in PICKLE_TYPES."""
+
+# operations between pitch and interval types; all others are undefined (see IntType)
+register_operation("+", EPC, IntervalClass, EPC)
+register_operation("-", EPC, IntervalClass, EPC)
+register_operation("+", EIC, PitchClass, EPC)
+register_operation("+", EIC, IntervalClass, EIC)
+register_operation("-", EIC, IntervalClass, EIC)
+register_operation("+", SPC, SIC, SPC)
+register_operation("+", SPC, EIC, EPC)
+register_operation("-", SPC, SIC, SPC)
+register_operation("-", SPC, EIC, EPC)
+register_operation("+", SIC, SPC, SPC)
+register_operation("+", SIC, SIC, SIC)
+register_operation("+", SIC, EPC, EPC)
+register_operation("+", SIC, EIC, EIC)
+register_operation("-", SIC, SIC, SIC)
+register_operation("-", SIC, EIC, EIC)
+register_operation("+", EP, Interval, EP)
+register_operation("-", EP, Interval, EP)
+register_operation("-", EP, EP, EI)
+register_operation("+", EI, Pitch, EP)
+register_operation("+", EI, Interval, EI)
+register_operation("-", EI, Interval, EI)
+register_operation("+", SP, SI, SP)
+register_operation("+", SP, EI, EP)
+register_operation("-", SP, SI, SP)
+register_operation("-", SP, EI, EP)
+register_operation("-", SP, SP, SI)
+register_operation("+", SI, SP, SP)
+register_operation("+", SI, SI, SI)
+register_operation("+", SI, EP, EP)
+register_operation("+", SI, EI, EI)
+register_operation("-", SI, SI, SI)
+register_operation("-", SI, EI, EI)
+
+# opt-in instrumentation of the hot paths, installed only when requested (see profiling.py)
+if "PROFILE_PITCH_TYPES" in os.environ:
+    import profiling
+
+    profiling.enable_from_environment()
 
 if __name__ == "__main__":
     from itertools import product
@@ -0,0 +1,662 @@
+"""NumPy-backed containers for many pitch classes, interval classes, pitches or intervals at once. Each container
+type mirrors one scalar type from pitch.py and applies the same typing rules, but only once per array instead of once
+per element."""
+import operator
+from typing import Callable, Dict, Iterable, Optional, Type, Union
+
+import numpy as np
+
+from abstract import (
+    FIFTHS_BASE,
+    FifthsScalar,
+    IntType,
+    IntTypeArray,
+    SemitonesFifthsScalar,
+    SemitonesScalar,
+    result_type,
+)
+from pitch import (
+    EnharmonicInterval,
+    EnharmonicIntervalClass,
+    EnharmonicPitch,
+    EnharmonicPitchClass,
+    SpecificInterval,
+    SpecificIntervalClass,
+    SpecificPitch,
+    SpecificPitchClass,
+)
+from pitch_helpers import (
+    fifths2interval_names,
+    fifths2note_names,
+    fifths_semitones2interval_names,
+    fifths_semitones2pitch_names,
+    interval_names2fifths,
+    interval_names2fifths_semitones,
+    note_names2fifths,
+    pitch_names2fifths_semitones,
+)
+
+ARRAY_TYPES: Dict[Type[IntType], Type["IntArray"]] = {}
+"""Maps each scalar type to the array type that stores its values. Filled by IntArray.__init_subclass__()."""
+
+_ARRAY_OPERATORS: Dict[str, Callable] = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "//": np.floor_divide,
+    "/": lambda a, b: np.trunc(np.true_divide(a, b)),  # like int(a / b) for scalars
+    "%": np.mod,
+}
+
+
+def _scalar_objects(values) -> Optional[np.ndarray]:
+    """The values as object array if they hold IntType scalars, which np.asarray() would turn into plain integers
+    of the wrong unit, None otherwise."""
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return None
+    types = set(map(type, values)) if isinstance(values, (list, tuple)) else {list}
+    if any(issubclass(t, (list, tuple, np.ndarray)) for t in types):
+        # nested values are flattened first
+        types = set(map(type, np.asarray(values, dtype=object).ravel().tolist()))
+    if any(issubclass(t, IntType) for t in types):
+        return np.asarray(values, dtype=object)
+    return None
+
+
+class IntArray(IntTypeArray):
+    """Array counterpart of IntType. The values are stored in a NumPy array of the class's dtype. Operations with
+    integers or integer arrays behave like the corresponding scalar operation applied to each element. Operations
+    with other IntType scalars or IntArrays follow the typing rules of the scalar types and are broadcast."""
+
+    scalar_type: Type[IntType] = IntType
+    """The scalar type whose typing rules the array follows and which is returned when accessing single elements."""
+
+    dtype: np.dtype = np.dtype(np.int64)
+    """The compact integer type used for storing the values."""
+
+    __array_ufunc__ = None  # makes NumPy defer to the reflected operators defined here
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        ARRAY_TYPES[cls.scalar_type] = cls
+
+    def __init__(
+        self, values: Union["IntArray", Iterable[Union[int, str]], np.ndarray]
+    ):
+        """Can be created from another IntArray, or from any (nested) collection of values that the scalar type
+        accepts, e.g. integers, integer arrays, strings, or IntType scalars. Like the scalar constructor, IntType
+        elements are converted by convert_init_value(), so that EPCArray([SPC('G')]) holds EPC(7).
+
+        Raises:
+            OverflowError: If a value lies outside the range of the dtype.
+        """
+        scalars = None if isinstance(values, IntArray) else _scalar_objects(values)
+        if isinstance(values, IntArray):
+            converted = self._convert_array(values)
+        elif scalars is not None:
+            convert = np.vectorize(
+                self.scalar_type.convert_init_value, otypes=[np.int64]
+            )
+            converted = self._normalize(convert(scalars))
+        else:
+            values = np.asarray(values)
+            if values.dtype.kind in "iu":
+                converted = self._normalize(values.astype(np.int64))
+            else:
+                converted = self._parse(values)
+        self._values = self._from_results(np.asarray(converted, dtype=np.int64))._values
+
+    @classmethod
+    def _from_values(cls, values: np.ndarray) -> "IntArray":
+        """Trusted constructor for already converted and normalized values."""
+        instance = cls.__new__(cls)
+        instance._values = values.astype(cls.dtype, copy=False)
+        return instance
+
+    @classmethod
+    def _from_results(cls, values: np.ndarray) -> "IntArray":
+        """Like _from_values() for normalized int64 values that may not fit into the dtype, e.g. the results of
+        operations.
+
+        Raises:
+            OverflowError: If a value lies outside the range of the dtype.
+        """
+        limits = np.iinfo(cls.dtype)
+        if values.size > 0 and (values.min() < limits.min or values.max() > limits.max):
+            raise OverflowError(
+                f"Values outside the range [{limits.min}, {limits.max}] of {cls.__name__}."
+            )
+        return cls._from_values(values)
+
+    @staticmethod
+    def _normalize(values: np.ndarray) -> np.ndarray:
+        """Array version of the scalar type's convert_init_value() for integer values."""
+        return values
+
+    @classmethod
+    def _parse(cls, values: np.ndarray) -> np.ndarray:
+        """Array version of the scalar type's convert_init_value() for non-integer values such as strings."""
+        if values.size == 0:
+            return values.astype(np.int64)
+        convert = np.vectorize(cls.scalar_type.convert_init_value, otypes=[np.int64])
+        return convert(values)
+
+    @classmethod
+    def _format(cls, values: np.ndarray) -> np.ndarray:
+        """Array version of the scalar type's name property."""
+        names = [
+            cls.scalar_type._from_int(value).name for value in values.ravel().tolist()
+        ]
+        return np.array(names, dtype=object).reshape(values.shape)
+
+    @classmethod
+    def _convert_array(cls, values: "IntArray") -> np.ndarray:
+        """Array version of the scalar type's convert_init_value() for IntArray values."""
+        return cls._normalize(values._values)
+
+    @classmethod
+    def _project(cls, value: Union[IntType, "IntArray"]) -> Union[int, np.ndarray]:
+        """Expresses an operand in the unit stored by this array type."""
+        return value._values if isinstance(value, IntArray) else int(value)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view on the stored integers."""
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def shape(self) -> tuple:
+        return self._values.shape
+
+    @property
+    def names(self) -> np.ndarray:
+        """Array of the names of all elements."""
+        return self._format(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        if self._values.ndim == 1:
+            return (
+                self.scalar_type._from_int(value) for value in self._values.tolist()
+            )
+        return (self._from_values(row) for row in self._values)
+
+    def __getitem__(self, item) -> Union[IntType, "IntArray"]:
+        selected = self._values[item]
+        if selected.ndim == 0:
+            return self.scalar_type._from_int(int(selected))
+        return self._from_values(selected)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None:
+            return self._values
+        return self._values.astype(dtype)
+
+    def __str__(self) -> str:
+        """String representation should work as a constructor."""
+        return f"{type(self).__name__}({self._values.tolist()})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def _operate(self, other, symbol: str, reflected: bool = False) -> "IntArray":
+        """Applies the operator identified by ``symbol`` to all elements.
+
+        Args:
+            other: Right operand, or left operand if ``reflected`` is True.
+            symbol: One of '+', '-', '*', '//', '/', '%'.
+            reflected: Pass True if ``other`` is the left operand.
+        """
+        if isinstance(other, IntArray):
+            other_type = other.scalar_type
+        elif isinstance(other, IntType):
+            other_type = type(other)
+        elif issubclass(self.scalar_type, SemitonesFifthsScalar):
+            raise NotImplementedError(
+                f"Operation not defined: {type(other).__name__ if reflected else type(self).__name__} {symbol} "
+                f"{type(self).__name__ if reflected else type(other).__name__}. Create the "
+                f"operand with from_fifths_semitones() or from_fifths_octaves() instead."
+            )
+        else:
+            # like IntType, plain integers are applied to the value and the result keeps this array's type
+            own = self._values.astype(np.int64)
+            values = (
+                _ARRAY_OPERATORS[symbol](other, own)
+                if reflected
+                else _ARRAY_OPERATORS[symbol](own, other)
+            )
+            return self._from_results(
+                self._normalize(np.asarray(values).astype(np.int64))
+            )
+        if reflected:
+            array_type = ARRAY_TYPES[result_type(other_type, self.scalar_type, symbol)]
+            left, right = array_type._project(other), array_type._project(self)
+        else:
+            array_type = ARRAY_TYPES[result_type(self.scalar_type, other_type, symbol)]
+            left, right = array_type._project(self), array_type._project(other)
+        values = _ARRAY_OPERATORS[symbol](np.asarray(left, dtype=np.int64), right)
+        return array_type._from_results(array_type._normalize(values.astype(np.int64)))
+
+    def _compare(self, other, compare: Callable, symbol: str) -> np.ndarray:
+        if isinstance(other, IntArray):
+            if other.scalar_type is not self.scalar_type:
+                raise NotImplementedError(
+                    f"Comparison not defined: {type(self)} {symbol} {type(other)}"
+                )
+            return compare(self._values, other._values)
+        if isinstance(other, IntType) and type(other) is not self.scalar_type:
+            raise NotImplementedError(
+                f"Comparison not defined: {type(self)} {symbol} {type(other)}"
+            )
+        if isinstance(other, IntType):
+            other = int(other)
+        return compare(self._values, other)
+
+    def __neg__(self) -> "IntArray":
+        # raises NotImplementedError if negation is not defined
+        negated = -self.scalar_type._from_int(1)
+        return ARRAY_TYPES[type(negated)]._from_results(
+            self._normalize(-self._values.astype(np.int64))
+        )
+
+    def __add__(self, other) -> "IntArray":
+        return self._operate(other, "+")
+
+    def __radd__(self, other) -> "IntArray":
+        return self._operate(other, "+", reflected=True)
+
+    def __sub__(self, other) -> "IntArray":
+        return self._operate(other, "-")
+
+    def __rsub__(self, other) -> "IntArray":
+        return self._operate(other, "-", reflected=True)
+
+    def __mul__(self, other) -> "IntArray":
+        return self._operate(other, "*")
+
+    def __rmul__(self, other) -> "IntArray":
+        return self._operate(other, "*", reflected=True)
+
+    def __floordiv__(self, other) -> "IntArray":
+        return self._operate(other, "//")
+
+    def __rfloordiv__(self, other) -> "IntArray":
+        return self._operate(other, "//", reflected=True)
+
+    def __truediv__(self, other) -> "IntArray":
+        return self._operate(other, "/")
+
+    def __rtruediv__(self, other) -> "IntArray":
+        return self._operate(other, "/", reflected=True)
+
+    def __mod__(self, other) -> "IntArray":
+        return self._operate(other, "%")
+
+    def __rmod__(self, other) -> "IntArray":
+        return self._operate(other, "%", reflected=True)
+
+    def __eq__(self, other) -> np.ndarray:
+        return self._compare(other, operator.eq, "==")
+
+    def __ne__(self, other) -> np.ndarray:
+        return self._compare(other, operator.ne, "!=")
+
+    def __lt__(self, other) -> np.ndarray:
+        return self._compare(other, operator.lt, "<")
+
+    def __le__(self, other) -> np.ndarray:
+        return self._compare(other, operator.le, "<=")
+
+    def __gt__(self, other) -> np.ndarray:
+        return self._compare(other, operator.gt, ">")
+
+    def __ge__(self, other) -> np.ndarray:
+        return self._compare(other, operator.ge, ">=")
+
+
+class SemitonesArray(IntArray):
+    """Array counterpart of SemitonesScalar, storing values within [0, 11] as int8."""
+
+    scalar_type = SemitonesScalar
+    dtype = np.dtype(np.int8)
+
+    @staticmethod
+    def _normalize(values: np.ndarray) -> np.ndarray:
+        return np.mod(values, 12)
+
+    @classmethod
+    def _convert_array(cls, values: IntArray) -> np.ndarray:
+        if isinstance(values, FifthsArray):
+            return values.semitones
+        if isinstance(values, SemitonesFifthsArray):
+            return cls._normalize(values.semitones)
+        return cls._normalize(values._values)
+
+    @classmethod
+    def _project(cls, value: Union[IntType, IntArray]) -> Union[int, np.ndarray]:
+        return value.semitones
+
+    @property
+    def semitones(self) -> np.ndarray:
+        """This array's values."""
+        return self._values
+
+    @property
+    def fifths(self) -> np.ndarray:
+        """Array version of SemitonesScalar.fifths: the spellings closest to C, within [-5, 6] (Db to F#). They ignore
+        any context; spelling.Speller spells whole sequences."""
+        return ((7 * self._values.astype(np.int32) + 5) % 12 - 5).astype(np.int16)
+
+
+class FifthsArray(IntArray):
+    """Array counterpart of FifthsScalar, storing stacks of fifths as int16. Like the scalar types, arrays of
+    semitones are converted with their context-free spelling (see SemitonesArray.fifths), e.g. SPCArray(EPCArray([1]))
+    holds Db; use spelling.Speller to spell sequences in context."""
+
+    scalar_type = FifthsScalar
+    dtype = np.dtype(np.int16)
+
+    @classmethod
+    def _convert_array(cls, values: IntArray) -> np.ndarray:
+        if isinstance(values, (SemitonesArray, SemitonesFifthsArray)):
+            # like the scalar conversion, semitones get the context-free spelling of SemitonesScalar.fifths
+            return values.fifths
+        return values._values
+
+    @classmethod
+    def _project(cls, value: Union[IntType, IntArray]) -> Union[int, np.ndarray]:
+        return value.fifths
+
+    @property
+    def fifths(self) -> np.ndarray:
+        """This array's values."""
+        return self._values
+
+    @property
+    def semitones(self) -> np.ndarray:
+        """The stacks of fifths represented by this array, expressed in semitones."""
+        return (7 * self._values.astype(np.int32) % 12).astype(np.int8)
+
+    def __str__(self) -> str:
+        """Constructors of subtypes will work with string representations."""
+        return f"{type(self).__name__}({self.names.tolist()})"
+
+
+class EPCArray(SemitonesArray):
+    """Array of EnharmonicPitchClass values."""
+
+    scalar_type = EnharmonicPitchClass
+
+
+class EICArray(SemitonesArray):
+    """Array of EnharmonicIntervalClass values."""
+
+    scalar_type = EnharmonicIntervalClass
+
+
+class SPCArray(FifthsArray):
+    """Array of SpecificPitchClass values."""
+
+    scalar_type = SpecificPitchClass
+
+    @classmethod
+    def _parse(cls, values: np.ndarray) -> np.ndarray:
+        return note_names2fifths(values)
+
+    @classmethod
+    def _format(cls, values: np.ndarray) -> np.ndarray:
+        return fifths2note_names(values)
+
+
+class SICArray(FifthsArray):
+    """Array of SpecificIntervalClass values."""
+
+    scalar_type = SpecificIntervalClass
+
+    @classmethod
+    def _parse(cls, values: np.ndarray) -> np.ndarray:
+        return interval_names2fifths(values)
+
+    @classmethod
+    def _format(cls, values: np.ndarray) -> np.ndarray:
+        return fifths2interval_names(values)
+
+
+class SemitonesFifthsArray(IntArray):
+    """Array counterpart of SemitonesFifthsScalar, storing the packed semitones and fifths as int32."""
+
+    scalar_type = SemitonesFifthsScalar
+    dtype = np.dtype(np.int32)
+
+    def __init__(
+        self, values: Union["SemitonesFifthsArray", Iterable[str], np.ndarray]
+    ):
+        """Like the scalar types, does not accept plain integers, which could be semitones or packed values; use
+        from_fifths_semitones() or from_fifths_octaves() instead."""
+        if (
+            not isinstance(values, IntArray)
+            and _scalar_objects(values) is None
+            and np.asarray(values).dtype.kind in "iu"
+        ):
+            raise TypeError(
+                f"Cannot create a {type(self).__name__} from integers. Use names or one of the from_...() "
+                f"constructors."
+            )
+        super().__init__(values)
+
+    @classmethod
+    def _convert_array(cls, values: IntArray) -> np.ndarray:
+        if not isinstance(values, SemitonesFifthsArray):
+            raise TypeError(
+                f"Cannot convert {type(values).__name__} to {cls.__name__}: octaves or spelling are missing."
+            )
+        return values._values
+
+    @classmethod
+    def from_fifths_semitones(
+        cls, fifths: np.ndarray, semitones: np.ndarray
+    ) -> "SemitonesFifthsArray":
+        """Packs two integer arrays of the same shape into an array.
+
+        Raises:
+            ValueError: If fifths lie outside the range that can be packed.
+        """
+        fifths = np.asarray(fifths, dtype=np.int32)
+        if fifths.size > 0 and not (
+            -FIFTHS_BASE // 2 <= fifths.min() and fifths.max() < FIFTHS_BASE // 2
+        ):
+            raise ValueError(f"Some fifths lie outside the range of {cls.__name__}.")
+        return cls._from_values(
+            np.asarray(semitones, dtype=np.int32) * FIFTHS_BASE + fifths
+        )
+
+    @property
+    def fifths(self) -> np.ndarray:
+        """The fifths of all elements."""
+        return (
+            (self._values + FIFTHS_BASE // 2) % FIFTHS_BASE - FIFTHS_BASE // 2
+        ).astype(np.int16)
+
+    @property
+    def semitones(self) -> np.ndarray:
+        """The semitones of all elements."""
+        return (self._values - self.fifths) // FIFTHS_BASE
+
+    @property
+    def octaves(self) -> np.ndarray:
+        """The octaves that are independent of the fifths, see SpecificInterval.from_fifths_octaves()."""
+        return (self.semitones.astype(np.int32) - 7 * self.fifths) // 12
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({self.names.tolist()})"
+
+
+class SpecificPitchArray(SemitonesFifthsArray):
+    """Array of SpecificPitch values. Transposing by a SpecificInterval (or an array of them) adds the packed
+    integers, so that no SpecificPitch is created per element."""
+
+    scalar_type = SpecificPitch
+
+    @classmethod
+    def from_fifths_octaves(
+        cls, fifths: np.ndarray, octaves: np.ndarray
+    ) -> "SpecificPitchArray":
+        """Array version of SpecificPitch.from_fifths_octaves()."""
+        fifths = np.asarray(fifths, dtype=np.int32)
+        return cls.from_fifths_semitones(
+            fifths, 7 * fifths + 12 * np.asarray(octaves, dtype=np.int32) + 12
+        )
+
+    @classmethod
+    def from_midi(cls, midi: np.ndarray) -> "SpecificPitchArray":
+        """Array version of SpecificPitch.from_midi()."""
+        midi = np.asarray(midi, dtype=np.int32)
+        return cls.from_fifths_semitones((7 * midi + 5) % 12 - 5, midi)
+
+    @classmethod
+    def _parse(cls, values: np.ndarray) -> np.ndarray:
+        fifths, semitones = pitch_names2fifths_semitones(values)
+        return semitones.astype(np.int32) * FIFTHS_BASE + fifths
+
+    @classmethod
+    def _format(cls, values: np.ndarray) -> np.ndarray:
+        packed = cls._from_values(values)
+        return fifths_semitones2pitch_names(packed.fifths, packed.semitones)
+
+    @property
+    def octaves(self) -> np.ndarray:
+        """The octaves that are independent of the fifths, see SpecificPitch.from_fifths_octaves()."""
+        return (self.semitones.astype(np.int32) - 12 - 7 * self.fifths) // 12
+
+    @property
+    def midi(self) -> np.ndarray:
+        """The MIDI numbers of all pitches, which are also their semitones."""
+        return self.semitones
+
+    @property
+    def octave(self) -> np.ndarray:
+        """The octave numbers of the pitch names."""
+        return (4 * self.fifths.astype(np.int32) + 7 * self.octaves) // 7
+
+    @property
+    def pitch_classes(self) -> "SPCArray":
+        """The pitches projected onto SpecificPitchClasses."""
+        return SPCArray._from_values(self.fifths)
+
+
+class SpecificIntervalArray(SemitonesFifthsArray):
+    """Array of SpecificInterval values."""
+
+    scalar_type = SpecificInterval
+
+    @classmethod
+    def from_fifths_octaves(
+        cls, fifths: np.ndarray, octaves: np.ndarray
+    ) -> "SpecificIntervalArray":
+        """Array version of SpecificInterval.from_fifths_octaves()."""
+        fifths = np.asarray(fifths, dtype=np.int32)
+        return cls.from_fifths_semitones(
+            fifths, 7 * fifths + 12 * np.asarray(octaves, dtype=np.int32)
+        )
+
+    @classmethod
+    def _parse(cls, values: np.ndarray) -> np.ndarray:
+        fifths, semitones = interval_names2fifths_semitones(values)
+        return semitones.astype(np.int32) * FIFTHS_BASE + fifths
+
+    @classmethod
+    def _format(cls, values: np.ndarray) -> np.ndarray:
+        packed = cls._from_values(values)
+        return fifths_semitones2interval_names(packed.fifths, packed.semitones)
+
+    @property
+    def steps(self) -> np.ndarray:
+        """The numbers of diatonic steps."""
+        return 4 * self.fifths.astype(np.int32) + 7 * self.octaves
+
+    @property
+    def interval_classes(self) -> "SICArray":
+        """The intervals projected onto SpecificIntervalClasses."""
+        return SICArray._from_values(self.fifths)
+
+
+class EnharmonicPitchArray(SemitonesArray):
+    """Array of EnharmonicPitch values, i.e. MIDI numbers stored as int16 and not reduced modulo 12."""
+
+    scalar_type = EnharmonicPitch
+    dtype = np.dtype(np.int16)
+
+    @staticmethod
+    def _normalize(values: np.ndarray) -> np.ndarray:
+        return values
+
+    @classmethod
+    def _parse(cls, values: np.ndarray) -> np.ndarray:
+        _, semitones = pitch_names2fifths_semitones(values)
+        return semitones
+
+    @property
+    def midi(self) -> np.ndarray:
+        """This array's values."""
+        return self._values
+
+    @property
+    def octave(self) -> np.ndarray:
+        """The octave numbers, such that 60 lies in octave 4."""
+        return self._values // 12 - 1
+
+    @property
+    def pitch_classes(self) -> EPCArray:
+        """The pitches projected onto EnharmonicPitchClasses."""
+        return EPCArray._from_values(np.mod(self._values, 12))
+
+
+class EnharmonicIntervalArray(SemitonesArray):
+    """Array of EnharmonicInterval values, i.e. signed semitones stored as int16."""
+
+    scalar_type = EnharmonicInterval
+    dtype = np.dtype(np.int16)
+
+    @staticmethod
+    def _normalize(values: np.ndarray) -> np.ndarray:
+        return values
+
+    @property
+    def interval_classes(self) -> EICArray:
+        """The intervals projected onto EnharmonicIntervalClasses."""
+        return EICArray._from_values(np.mod(self._values, 12))
+
+
+ARRAY_TYPES[IntType] = IntArray
+
+if __name__ == "__main__":
+    spcs = SPCArray(["F#", "Bbb", "C", "E#"])
+    print(f"{spcs} has the fifths {spcs.fifths} and the semitones {spcs.semitones}")
+    print(f"{spcs} + SIC('M3') = {spcs + SpecificIntervalClass('M3')}")
+    print(f"{spcs} + EIC(4) = {spcs + EnharmonicIntervalClass(4)}")
+    sics = SICArray([[0], [4], [1]])
+    print(f"Broadcasting {spcs} + {sics} =\n{(spcs + sics).names}")
+    print(f"SPC('D') - {sics} = {SpecificPitchClass('D') - sics}")
+    print(f"EPCArray({spcs}) = {EPCArray(spcs)}")
+    print(f"{spcs} * 2 = {spcs * 2}")
+    print(f"{spcs} == SPC('C') = {spcs == SpecificPitchClass('C')}")
+    print(f"{spcs}[0] = {spcs[0]!s}")
+    try:
+        spcs + spcs
+    except NotImplementedError as e:
+        print(f'{spcs} + {spcs} failed with "{e}"')
+    melody = SpecificPitchArray(["C4", "E4", "G4", "B#3"])
+    print(
+        f"{melody} has the MIDI numbers {melody.midi} and the octaves {melody.octave}"
+    )
+    print(f"{melody} + SI('M3:1') = {melody + SpecificInterval('M3:1')}")
+    print(f"{melody} projected onto pitch classes: {melody.pitch_classes}")
+    print(f"EnharmonicPitchArray({melody}) = {EnharmonicPitchArray(melody)}")
+    try:
+        -EPCArray([1, 2])
+    except NotImplementedError as e:
+        print(f'-EPCArray([1, 2]) failed with "{e}"')
@@ -1,5 +1,54 @@
+from __future__ import annotations
+
 import re
-from typing import Literal, Sequence, Tuple, Union, overload
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+NOTE_NAME_PATTERN = r"^([A-G]|[a-g])(#*|b*)$"
+INTERVAL_NAME_PATTERN = r"^(P|M|m|a+|d+)(\d+)$"
+PITCH_NAME_PATTERN = r"^([A-G]|[a-g])(#*|b*)(-?\d+)$"
+_REGEXES = {
+    "NOTE_NAME_REGEX": NOTE_NAME_PATTERN,
+    "INTERVAL_NAME_REGEX": INTERVAL_NAME_PATTERN,
+    "PITCH_NAME_REGEX": PITCH_NAME_PATTERN,
+}
+"""The patterns are compiled on first use rather than at import time, which would cost about as much as the rest
+of the module. The compiled versions remain available as NOTE_NAME_REGEX, INTERVAL_NAME_REGEX and PITCH_NAME_REGEX
+via the module's __getattr__()."""
+
+
+def _regex(name: str) -> re.Pattern:
+    """Returns the compiled version of one of the _REGEXES, compiling it on first use."""
+    compiled = globals().get(name)
+    if compiled is None:
+        compiled = globals()[name] = re.compile(_REGEXES[name])
+    return compiled
+
+
+def __getattr__(name: str):
+    if name not in _REGEXES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _regex(name)
+
+
+TABLE_RANGE = range(-21, 22)
+"""Fifths for which names are precomputed. Conversions outside of this range go through a bounded cache."""
+
+CACHE_SIZE = 4096
+"""Maximum number of conversions outside TABLE_RANGE that are remembered per conversion function."""
+
+_INT16_RANGE = range(-(2**15), 2**15)
+"""Values that the bulk conversions can store in their int16 arrays."""
 
 
 @overload
@@ -21,9 +70,11 @@ def split_note_name(
         note_name: Note name.
         count: Pass True to get the accidentals as integer rather than as string.
     """
-    assert isinstance(note_name, str), f"'{note_name}' is not an accepted note name."
-    m = re.match(r"^([A-G]|[a-g])(#*|b*)$", note_name)
-    assert m is not None, f"{note_name} is not a valid note name."
+    if not isinstance(note_name, str):
+        raise TypeError(f"'{note_name}' is not an accepted note name.")
+    m = _regex("NOTE_NAME_REGEX").match(note_name)
+    if m is None:
+        raise ValueError(f"{note_name} is not a valid note name.")
     note_name, accidentals = m.group(1), m.group(2)
     if count:
         accidentals = accidentals.count("#") - accidentals.count("b")
@@ -32,45 +83,68 @@ def split_note_name(
 
 def note_name2fifths(note_name: str) -> int:
     """Turn a note name such as `Ab` into a tonal pitch class, such that -1=F, 0=C, 1=G etc.
-        Uses: split_note_name()
+        Uses: _parse_note_name() for names that are not in the precomputed table.
 
     Args:
         note_name: Note name.
     """
+    try:
+        return _NOTE_NAME2FIFTHS[note_name]
+    except KeyError:
+        return _parse_note_name(note_name)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_note_name(note_name: str) -> int:
+    """Uncached version of note_name2fifths().
+    Uses: split_note_name()
+    """
     name_tpcs = {"C": 0, "D": 2, "E": 4, "F": -1, "G": 1, "A": 3, "B": 5}
     accidentals, name = split_note_name(note_name, count=True)
     step_tpc = name_tpcs[name.upper()]
     return step_tpc + 7 * accidentals
 
 
-def interval_name2fifths(interval_name):
-    m = re.match(r"^(P|M|m|a+|d+)(\d+)$", interval_name)
-    assert m is not None, f"{interval_name} is not a valid interval name."
+def interval_name2fifths(interval_name: str) -> int:
+    """Turn an interval name such as `M3` into a stack of fifths, such that 'P1'=0, 'P4'=-1, 'M3'=4 etc.
+        Uses: _parse_interval_name() for names that are not in the precomputed table.
+
+    Args:
+        interval_name: Interval name.
+    """
+    try:
+        return _INTERVAL_NAME2FIFTHS[interval_name]
+    except KeyError:
+        return _parse_interval_name(interval_name)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_interval_name(interval_name: str) -> int:
+    """Uncached version of interval_name2fifths()."""
+    if not isinstance(interval_name, str):
+        raise TypeError(f"'{interval_name}' is not an accepted interval name.")
+    m = _regex("INTERVAL_NAME_REGEX").match(interval_name)
+    if m is None:
+        raise ValueError(f"{interval_name} is not a valid interval name.")
     quality, int_num = m.group(1), int(m.group(2))
-    assert int_num > 0, f"'{interval_name}': the interval needs to be non-zero."
+    if int_num == 0:
+        raise ValueError(f"'{interval_name}': the interval needs to be non-zero.")
     fifths_base = (
         2 * int_num - 1
     ) % 7 - 1  # base interval class, i.e. P or M version, as fifths
     if quality == "P":
-        assert fifths_base in (
-            -1,
-            0,
-            1,
-        ), f"'{interval_name}': Only 4ths, 5ths and unisons can be P"
+        if fifths_base not in (-1, 0, 1):
+            raise ValueError(f"'{interval_name}': Only 4ths, 5ths and unisons can be P")
     if quality == "M":
-        assert fifths_base in (
-            2,
-            3,
-            4,
-            5,
-        ), f"'{interval_name}': Only 2nds, 3rds, 6ths, and 7ths can be M"
+        if fifths_base not in (2, 3, 4, 5):
+            raise ValueError(
+                f"'{interval_name}': Only 2nds, 3rds, 6ths, and 7ths can be M"
+            )
     elif quality == "m":
-        assert fifths_base in (
-            2,
-            3,
-            4,
-            5,
-        ), f"'{interval_name}': Only 2nds, 3rds, 6ths, and 7ths can be m"
+        if fifths_base not in (2, 3, 4, 5):
+            raise ValueError(
+                f"'{interval_name}': Only 2nds, 3rds, 6ths, and 7ths can be m"
+            )
         fifths_base -= 7
     elif "a" in quality:
         fifths_base += 7 * len(quality)
@@ -100,11 +174,22 @@ def _fifths2str(fifths: int, steps: Sequence[str], inverted: bool = False) -> st
 def fifths2note_name(fifths: int) -> str:
     """Return note name of a stack of fifths such that
        0 = C, -1 = F, -2 = Bb, 1 = G etc.
-       Uses: _fifths2str()
+       Uses: _format_note_name() for fifths outside TABLE_RANGE.
 
     Args:
         fifths: Fifths to be turned into a note name.
     """
+    try:
+        return _FIFTHS2NOTE_NAME[fifths]
+    except KeyError:
+        return _format_note_name(fifths)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_note_name(fifths: int) -> str:
+    """Uncached version of fifths2note_name().
+    Uses: _fifths2str()
+    """
     note_names = ["F", "C", "G", "D", "A", "E", "B"]
     name = _fifths2str(fifths, note_names, inverted=True)
     return name
@@ -113,7 +198,17 @@ def fifths2note_name(fifths: int) -> str:
 def fifths2interval_name(fifths: int) -> str:
     """Return interval name of a stack of fifths such that
     0 = 'P1', -1 = 'P4', -2 = 'm7', 4 = 'M3' etc.
+    Uses: _format_interval_name() for fifths outside TABLE_RANGE.
     """
+    try:
+        return _FIFTHS2INTERVAL_NAME[fifths]
+    except KeyError:
+        return _format_interval_name(fifths)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _format_interval_name(fifths: int) -> str:
+    """Uncached version of fifths2interval_name()."""
     fifths_plus_one = fifths + 1  # making 0 = fourth, 1 = unison, 2 = fifth etc.
     int_num = ["4", "1", "5", "2", "6", "3", "7"][fifths_plus_one % 7]
     if -5 <= fifths <= 5:
@@ -123,3 +218,308 @@ def fifths2interval_name(fifths: int) -> str:
     else:
         quality = "d" * ((-fifths + 1) // 7)
     return quality + int_num
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pitch_name2fifths_semitones(pitch_name: str) -> Tuple[int, int]:
+    """Turn a pitch name such as `Ab4` into its fifths and its MIDI number, such that 'C4'=(0, 60), 'G4'=(1, 67),
+    'B#3'=(12, 60) etc. The octave number belongs to the letter, so that 'B#3' and 'Cb4' lie a half step apart.
+        Uses: note_name2fifths()
+
+    Args:
+        pitch_name: Note name followed by the octave number.
+    """
+    if not isinstance(pitch_name, str):
+        raise TypeError(f"'{pitch_name}' is not an accepted pitch name.")
+    m = _regex("PITCH_NAME_REGEX").match(pitch_name)
+    if m is None:
+        raise ValueError(f"{pitch_name} is not a valid pitch name.")
+    fifths = note_name2fifths(m.group(1) + m.group(2))
+    steps = 4 * fifths % 7 + 7 * int(m.group(3))  # diatonic steps above C0
+    octaves = (steps - 4 * fifths) // 7  # octaves to add to the stack of fifths
+    return fifths, 7 * fifths + 12 * octaves + 12
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fifths_semitones2pitch_name(fifths: int, semitones: int) -> str:
+    """Inverse of pitch_name2fifths_semitones(), e.g. (12, 60) = 'B#3'.
+        Uses: fifths2note_name()
+
+    Args:
+        fifths: Fifths of the pitch.
+        semitones: MIDI number of the pitch.
+    """
+    octaves = (semitones - 12 - 7 * fifths) // 12
+    return fifths2note_name(fifths) + str((4 * fifths + 7 * octaves) // 7)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def interval_name2fifths_semitones(interval_name: str) -> Tuple[int, int]:
+    """Turn an interval name with octave such as `M3:1` into its fifths and semitones, such that 'M3:0'=(4, 4),
+    'M3:1'=(4, 16), 'P5:0'=(1, 7), '-M2:0'=(-2, -2) etc. The number after the colon counts the octaves that the
+    interval spans in addition to the simple interval; a leading '-' marks descending intervals.
+        Uses: interval_name2fifths()
+
+    Args:
+        interval_name: Interval name.
+    """
+    if not isinstance(interval_name, str):
+        raise TypeError(f"'{interval_name}' is not an accepted interval name.")
+    sign = -1 if interval_name.startswith("-") else 1
+    simple, colon, octave = interval_name.lstrip("-").partition(":")
+    if not colon or not octave.isdigit():
+        raise ValueError(
+            f"{interval_name} is not a valid interval name, such as 'M3:0' or '-P5:1'."
+        )
+    fifths = interval_name2fifths(simple)
+    steps = 4 * fifths % 7 + 7 * int(octave)
+    octaves = (steps - 4 * fifths) // 7
+    return sign * fifths, sign * (7 * fifths + 12 * octaves)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fifths_semitones2interval_name(fifths: int, semitones: int) -> str:
+    """Inverse of interval_name2fifths_semitones(), e.g. (4, 16) = 'M3:1' and (-4, -4) = '-M3:0'.
+        Uses: fifths2interval_name()
+
+    Args:
+        fifths: Fifths of the interval.
+        semitones: Semitones of the interval.
+    """
+    steps = 4 * fifths + 7 * ((semitones - 7 * fifths) // 12)
+    sign = ""
+    if steps < 0 or (steps == 0 and semitones < 0):
+        sign, fifths, steps = "-", -fifths, -steps
+    return f"{sign}{fifths2interval_name(fifths)}:{steps // 7}"
+
+
+_FIFTHS2NOTE_NAME: Dict[int, str] = {
+    fifths: _format_note_name.__wrapped__(fifths) for fifths in TABLE_RANGE
+}
+_NOTE_NAME2FIFTHS: Dict[str, int] = {
+    name: fifths for fifths, name in _FIFTHS2NOTE_NAME.items()
+}
+_FIFTHS2INTERVAL_NAME: Dict[int, str] = {
+    fifths: _format_interval_name.__wrapped__(fifths) for fifths in TABLE_RANGE
+}
+_INTERVAL_NAME2FIFTHS: Dict[str, int] = {
+    name: fifths for fifths, name in _FIFTHS2INTERVAL_NAME.items()
+}
+
+
+def _parse_batch(
+    names: Iterable[str],
+    parse: Callable[[str], int],
+    what: str,
+    cache: Optional[Dict[str, int]] = None,
+):
+    """Boilerplate used by the bulk name2fifths-functions. Parses every distinct name only once and collects all
+    invalid names before raising.
+
+    Args:
+        names: Names to be converted. A NumPy array keeps its shape.
+        parse: Function converting a single name.
+        what: Description of the names used in the error message.
+        cache: Dictionary of already converted names which will be updated with the newly converted ones.
+
+    Raises:
+        ValueError:
+            Listing every invalid name, including names whose values do not fit into int16, and the position of
+            its first occurrence.
+    """
+    import numpy as np
+
+    shape = names.shape if isinstance(names, np.ndarray) else None
+    names = names.ravel().tolist() if shape is not None else list(names)
+    converted = {} if cache is None else cache
+    invalid = {}
+    for position, name in enumerate(names):
+        if name in converted or name in invalid:
+            continue
+        try:
+            fifths = parse(name)
+        except (TypeError, ValueError):
+            invalid[name] = position
+        else:
+            if fifths in _INT16_RANGE:
+                converted[name] = fifths
+            else:
+                invalid[name] = position
+    if len(invalid) > 0:
+        listed = ", ".join(
+            f"{name!r} (position {position})" for name, position in invalid.items()
+        )
+        raise ValueError(f"{len(invalid)} invalid {what}: {listed}")
+    fifths = np.fromiter(
+        map(converted.__getitem__, names), dtype=np.int16, count=len(names)
+    )
+    return fifths if shape is None else fifths.reshape(shape)
+
+
+def _format_batch(fifths, formatter: Callable[[int], str]):
+    """Boilerplate used by the bulk fifths2-functions. Formats every distinct value only once.
+
+    Args:
+        fifths: Array-like of integers.
+        formatter: Function converting a single value.
+    """
+    import numpy as np
+
+    uniques, inverse = np.unique(np.asarray(fifths), return_inverse=True)
+    names = np.array([formatter(value) for value in uniques.tolist()], dtype=object)
+    return names[inverse].reshape(np.shape(fifths))
+
+
+def note_names2fifths(
+    note_names: Iterable[str], cache: Optional[Dict[str, int]] = None
+):
+    """Bulk version of note_name2fifths() returning an int16 NumPy array. Every distinct name is parsed once.
+
+    Args:
+        note_names: Iterable or NumPy array of note names.
+        cache:
+            Pass a dictionary to reuse conversions across several calls, e.g. for all chunks of one file.
+            It is updated with the newly converted names.
+
+    Raises:
+        ValueError: Listing all invalid note names at once.
+    """
+    return _parse_batch(note_names, note_name2fifths, "note names", cache)
+
+
+def interval_names2fifths(
+    interval_names: Iterable[str], cache: Optional[Dict[str, int]] = None
+):
+    """Bulk version of interval_name2fifths() returning an int16 NumPy array. Every distinct name is parsed once.
+
+    Args:
+        interval_names: Iterable or NumPy array of interval names.
+        cache:
+            Pass a dictionary to reuse conversions across several calls, e.g. for all chunks of one file.
+            It is updated with the newly converted names.
+
+    Raises:
+        ValueError: Listing all invalid interval names at once.
+    """
+    return _parse_batch(interval_names, interval_name2fifths, "interval names", cache)
+
+
+def fifths2note_names(fifths):
+    """Bulk version of fifths2note_name() returning a NumPy array of strings with the shape of the input.
+
+    Args:
+        fifths: Array-like of integers.
+    """
+    return _format_batch(fifths, fifths2note_name)
+
+
+def fifths2interval_names(fifths):
+    """Bulk version of fifths2interval_name() returning a NumPy array of strings with the shape of the input.
+
+    Args:
+        fifths: Array-like of integers.
+    """
+    return _format_batch(fifths, fifths2interval_name)
+
+
+def _parse_pair_batch(
+    names: Iterable[str], parse: Callable[[str], Tuple[int, int]], what: str
+):
+    """Boilerplate used by the bulk name2fifths_semitones-functions. Parses every distinct name only once and
+    collects all invalid names before raising.
+
+    Args:
+        names: Names to be converted. A NumPy array keeps its shape.
+        parse: Function converting a single name into (fifths, semitones).
+        what: Description of the names used in the error message.
+
+    Raises:
+        ValueError: Listing every invalid name, including names whose values do not fit into int16.
+    """
+    import numpy as np
+
+    names = np.asarray(names, dtype=object)
+    uniques, inverse = np.unique(names.ravel(), return_inverse=True)
+    pairs, invalid = [], []
+    for name in uniques.tolist():
+        try:
+            pair = parse(name)
+        except (TypeError, ValueError):
+            invalid.append(name)
+        else:
+            if pair[0] in _INT16_RANGE and pair[1] in _INT16_RANGE:
+                pairs.append(pair)
+            else:
+                invalid.append(name)
+    if len(invalid) > 0:
+        raise ValueError(
+            f"{len(invalid)} invalid {what}: {', '.join(map(repr, invalid))}"
+        )
+    pairs = np.array(pairs, dtype=np.int16).reshape(-1, 2)[inverse]
+    return pairs[:, 0].reshape(names.shape), pairs[:, 1].reshape(names.shape)
+
+
+def _format_pair_batch(fifths, semitones, formatter: Callable[[int, int], str]):
+    """Boilerplate used by the bulk fifths_semitones2-functions. Formats every distinct pair only once.
+
+    Args:
+        fifths: Array-like of integers.
+        semitones: Array-like of integers with the same shape.
+        formatter: Function converting a single pair.
+    """
+    import numpy as np
+
+    fifths, semitones = np.asarray(fifths), np.asarray(semitones)
+    pairs = np.stack([fifths.ravel(), semitones.ravel()], axis=1)
+    uniques, inverse = np.unique(pairs, axis=0, return_inverse=True)
+    names = np.array([formatter(*pair) for pair in uniques.tolist()], dtype=object)
+    return names[inverse.ravel()].reshape(fifths.shape)
+
+
+def pitch_names2fifths_semitones(pitch_names: Iterable[str]):
+    """Bulk version of pitch_name2fifths_semitones() returning the fifths and the MIDI numbers as two int16 NumPy
+    arrays. Every distinct name is parsed once.
+
+    Args:
+        pitch_names: Iterable or NumPy array of pitch names.
+
+    Raises:
+        ValueError: Listing all invalid pitch names at once.
+    """
+    return _parse_pair_batch(pitch_names, pitch_name2fifths_semitones, "pitch names")
+
+
+def interval_names2fifths_semitones(interval_names: Iterable[str]):
+    """Bulk version of interval_name2fifths_semitones() returning the fifths and the semitones as two int16 NumPy
+    arrays. Every distinct name is parsed once.
+
+    Args:
+        interval_names: Iterable or NumPy array of interval names.
+
+    Raises:
+        ValueError: Listing all invalid interval names at once.
+    """
+    return _parse_pair_batch(
+        interval_names, interval_name2fifths_semitones, "interval names"
+    )
+
+
+def fifths_semitones2pitch_names(fifths, semitones):
+    """Bulk version of fifths_semitones2pitch_name() returning a NumPy array of strings with the shape of the input.
+
+    Args:
+        fifths: Array-like of integers.
+        semitones: Array-like of MIDI numbers with the same shape.
+    """
+    return _format_pair_batch(fifths, semitones, fifths_semitones2pitch_name)
+
+
+def fifths_semitones2interval_names(fifths, semitones):
+    """Bulk version of fifths_semitones2interval_name() returning a NumPy array of strings with the shape of the
+    input.
+
+    Args:
+        fifths: Array-like of integers.
+        semitones: Array-like of integers with the same shape.
+    """
+    return _format_pair_batch(fifths, semitones, fifths_semitones2interval_name)
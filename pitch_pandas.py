@@ -0,0 +1,368 @@
+"""pandas extension dtypes 'spc', 'sic', 'epc' and 'eic' storing pitch and interval classes as integers instead of
+Python objects. Columns follow the typing rules of pitch.py through the arrays of pitch_arrays, convert from note and
+interval names through the bulk parsers of pitch_helpers, and group, sort and round-trip through Parquet on the
+stored integers. Empty cells are stored as the smallest value of the integer type and appear as pd.NA.
+
+    >>> import pitch_pandas
+    >>> roots = pd.Series(["C", "F#", None]).astype("spc")
+    >>> roots + SIC("M3")
+"""
+import operator
+from typing import Any, Callable, Dict, Sequence, Type
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    take,
+)
+
+from abstract import IntType
+from pitch_arrays import EICArray, EPCArray, IntArray, SICArray, SPCArray
+
+_DTYPES: Dict[Type[IntArray], "PitchDtype"] = {}
+"""The extension dtype for every IntArray type, filled when the dtypes are registered."""
+
+
+class PitchDtype(ExtensionDtype):
+    """Base class of the extension dtypes. Every subclass mirrors one IntArray type and uses its dtype for storage."""
+
+    array_type: Type[IntArray] = IntArray
+    """The IntArray type implementing operations and conversions."""
+
+    na_value = pd.NA
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.type = cls.array_type.scalar_type
+
+    def __repr__(self) -> str:
+        return self.name
+
+    @property
+    def missing(self) -> int:
+        """Stored integer standing for empty cells."""
+        return int(np.iinfo(self.array_type.dtype).min)
+
+    @classmethod
+    def construct_array_type(cls) -> Type["PitchExtensionArray"]:
+        return PitchExtensionArray
+
+    def __from_arrow__(self, array) -> "PitchExtensionArray":
+        """Turns a pyarrow (Chunked)Array of integers with nulls, e.g. read from Parquet, into a column."""
+        chunks = getattr(array, "chunks", [array])
+        values = [
+            chunk.fill_null(self.missing).to_numpy(zero_copy_only=False)
+            for chunk in chunks
+        ]
+        data = np.concatenate(values) if values else np.zeros(0)
+        return PitchExtensionArray._from_storage(data, self)
+
+
+@register_extension_dtype
+class SPCDtype(PitchDtype):
+    name = "spc"
+    array_type = SPCArray
+
+
+@register_extension_dtype
+class SICDtype(PitchDtype):
+    name = "sic"
+    array_type = SICArray
+
+
+@register_extension_dtype
+class EPCDtype(PitchDtype):
+    name = "epc"
+    array_type = EPCArray
+
+
+@register_extension_dtype
+class EICDtype(PitchDtype):
+    name = "eic"
+    array_type = EICArray
+
+
+for _dtype in (SPCDtype(), SICDtype(), EPCDtype(), EICDtype()):
+    _DTYPES[_dtype.array_type] = _dtype
+
+
+def _is_missing(value: Any) -> bool:
+    return (
+        value is None
+        or value is pd.NA
+        or (isinstance(value, float) and np.isnan(value))
+    )
+
+
+class PitchExtensionArray(ExtensionArray):
+    """Column of one of the PitchDtypes. ``_data`` holds the integers, with ``dtype.missing`` for empty cells."""
+
+    def __init__(self, data: np.ndarray, dtype: PitchDtype):
+        """Prefer pd.array(values, dtype='spc') or Series.astype('spc').
+
+        Args:
+            data: The stored integers, including the missing value.
+            dtype: Instance of a PitchDtype subclass.
+        """
+        self._data = data
+        self._dtype = dtype
+
+    @classmethod
+    def _from_storage(
+        cls, data: np.ndarray, dtype: PitchDtype
+    ) -> "PitchExtensionArray":
+        return cls(np.asarray(data).astype(dtype.array_type.dtype, copy=False), dtype)
+
+    @classmethod
+    def _from_int_array(
+        cls, values: IntArray, missing: np.ndarray
+    ) -> "PitchExtensionArray":
+        """Wraps the result of an IntArray operation, re-inserting the empty cells."""
+        dtype = _DTYPES[type(values)]
+        data = values.values.copy()
+        data[missing] = dtype.missing
+        return cls(data, dtype)
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars, *, dtype=None, copy=False
+    ) -> "PitchExtensionArray":
+        """Creates a column from pitch objects, integers, names, or another PitchExtensionArray."""
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(scalars, PitchExtensionArray):
+            return scalars.astype(dtype, copy=copy)
+        if isinstance(scalars, IntArray):
+            converted = dtype.array_type(scalars).values
+            return cls._from_storage(converted, dtype)
+        scalars = np.asarray(scalars, dtype=object).ravel()
+        missing = np.fromiter(map(_is_missing, scalars), dtype=bool, count=len(scalars))
+        data = np.full(len(scalars), dtype.missing, dtype=dtype.array_type.dtype)
+        present = scalars[~missing]
+        if len(present) > 0:
+            if all(isinstance(value, str) for value in present):
+                # parses every distinct name once
+                converted = dtype.array_type(present.astype(str))
+            elif any(isinstance(value, IntType) for value in present):
+                converted = dtype.array_type._from_values(
+                    np.array(
+                        [dtype.array_type.scalar_type(value) for value in present],
+                        dtype=np.int64,
+                    )
+                )
+            else:
+                converted = dtype.array_type(present.astype(np.int64))
+            data[~missing] = converted.values
+        return cls(data, dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls, strings, *, dtype=None, copy=False
+    ) -> "PitchExtensionArray":
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(
+        cls, values: np.ndarray, original: "PitchExtensionArray"
+    ) -> "PitchExtensionArray":
+        return cls._from_storage(values, original.dtype)
+
+    @classmethod
+    def _concat_same_type(
+        cls, to_concat: Sequence["PitchExtensionArray"]
+    ) -> "PitchExtensionArray":
+        return cls(
+            np.concatenate([array._data for array in to_concat]), to_concat[0].dtype
+        )
+
+    @property
+    def dtype(self) -> PitchDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            value = int(self._data[item])
+            if value == self._dtype.missing:
+                return pd.NA
+            return self._dtype.type._from_int(value)
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._data[item], self._dtype)
+
+    def __setitem__(self, key, value) -> None:
+        if pd.api.types.is_scalar(value) or isinstance(value, IntType):
+            value = [value]
+        converted = self._from_sequence(value, dtype=self._dtype)._data
+        key = pd.api.indexers.check_array_indexer(self, key)
+        self._data[key] = converted[0] if len(converted) == 1 else converted
+
+    def isna(self) -> np.ndarray:
+        return self._data == self._dtype.missing
+
+    def copy(self) -> "PitchExtensionArray":
+        return type(self)(self._data.copy(), self._dtype)
+
+    def take(
+        self, indices, allow_fill: bool = False, fill_value=None
+    ) -> "PitchExtensionArray":
+        if allow_fill and not _is_missing(fill_value):
+            fill_value = self._from_sequence([fill_value], dtype=self._dtype)._data[0]
+        else:
+            fill_value = self._dtype.missing
+        data = take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value)
+        return type(self)(data, self._dtype)
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def _values_for_factorize(self):
+        return self._data, self._dtype.missing
+
+    def __arrow_array__(self, type=None):
+        """Stores the integers with nulls for empty cells, e.g. for Parquet. The pandas metadata written along
+        records the dtype name, through which __from_arrow__() restores the column."""
+        import pyarrow as pa
+
+        return pa.array(self._data, mask=self.isna(), type=type)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """Object array of the pitch objects, with pd.NA for empty cells."""
+        return np.array(list(self), dtype=object if dtype is None else dtype)
+
+    def astype(self, dtype, copy: bool = True):
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, PitchDtype):
+            if dtype == self._dtype:
+                return self.copy() if copy else self
+            missing = self.isna()
+            converted = dtype.array_type(self._as_int_array())
+            return self._from_int_array(converted, missing)
+        if dtype == object:
+            return np.array(self)
+        if pd.api.types.is_string_dtype(dtype):
+            # formats every distinct value once
+            names = self._dtype.array_type._format(self._data).astype(object)
+            names[self.isna()] = pd.NA
+            return pd.array(names, dtype=dtype)
+        return super().astype(dtype, copy=copy)
+
+    def _formatter(self, boxed: bool = False) -> Callable[[Any], str]:
+        return repr
+
+    def _as_int_array(self) -> IntArray:
+        """The values as IntArray, with empty cells set to 0."""
+        return self._dtype.array_type._from_values(np.where(self.isna(), 0, self._data))
+
+    def _operands(self, other):
+        """Returns ``other`` in a form accepted by IntArray operations, and the mask of empty cells it adds."""
+        if isinstance(other, (pd.Series, pd.Index)):
+            other = other.array
+        if isinstance(other, PitchExtensionArray):
+            return other._as_int_array(), other.isna()
+        if isinstance(other, (IntType, int, np.integer)):
+            return other, np.zeros(len(self), dtype=bool)
+        if isinstance(other, np.ndarray) and other.dtype.kind in "iu":
+            return other, np.zeros(len(self), dtype=bool)
+        return NotImplemented, None
+
+    def _arithmetic(self, other, symbol: str, reflected: bool = False):
+        operand, other_missing = self._operands(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        values = self._as_int_array()
+        function = _REFLECTED[symbol] if reflected else _OPERATORS[symbol]
+        result = function(values, operand)
+        return self._from_int_array(result, self.isna() | other_missing)
+
+    def _comparison(self, other, compare: Callable):
+        operand, other_missing = self._operands(other)
+        if operand is NotImplemented:
+            return NotImplemented
+        result = compare(self._as_int_array(), operand)
+        return pd.arrays.BooleanArray(np.asarray(result), self.isna() | other_missing)
+
+    def __add__(self, other):
+        return self._arithmetic(other, "+")
+
+    def __radd__(self, other):
+        return self._arithmetic(other, "+", reflected=True)
+
+    def __sub__(self, other):
+        return self._arithmetic(other, "-")
+
+    def __rsub__(self, other):
+        return self._arithmetic(other, "-", reflected=True)
+
+    def __mul__(self, other):
+        return self._arithmetic(other, "*")
+
+    def __rmul__(self, other):
+        return self._arithmetic(other, "*", reflected=True)
+
+    def __neg__(self):
+        return self._from_int_array(-self._as_int_array(), self.isna())
+
+    def __eq__(self, other):
+        return self._comparison(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._comparison(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._comparison(other, operator.lt)
+
+    def __le__(self, other):
+        return self._comparison(other, operator.le)
+
+    def __gt__(self, other):
+        return self._comparison(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._comparison(other, operator.ge)
+
+
+_OPERATORS: Dict[str, Callable] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+}
+_REFLECTED: Dict[str, Callable] = {
+    symbol: (lambda function: lambda a, b: function(b, a))(function)
+    for symbol, function in _OPERATORS.items()
+}
+
+
+if __name__ == "__main__":
+    import io
+
+    from pitch import EIC, SIC, SPC
+
+    table = pd.DataFrame(
+        {
+            "root": pd.Series(["C", "F#", None, "Bb", "C"]).astype("spc"),
+            "interval": pd.array(["M3", "P5", "P1", "m7", "M3"], dtype="sic"),
+        }
+    )
+    print(table, table.dtypes, sep="\n")
+    print(f"root + interval:\n{table.root + table.interval}")
+    print(f"root + SIC('M3'):\n{table.root + SIC('M3')}")
+    print(f"root + EIC(1):\n{table.root + EIC(1)}")
+    print(f"as enharmonic pitch classes:\n{table.root.astype('epc')}")
+    print(f"root == SPC('C'):\n{table.root == SPC('C')}")
+    print(f"sorted by root:\n{table.sort_values('root')}")
+    print(f"grouped by root:\n{table.groupby('root').size()}")
+    print(f"as names: {table.interval.astype(str).tolist()}")
+    buffer = io.BytesIO()
+    table.to_parquet(buffer)
+    restored = pd.read_parquet(buffer)
+    print(
+        f"Parquet round trip keeps {restored.dtypes.tolist()}: {restored.equals(table)}"
+    )
@@ -0,0 +1,224 @@
+"""Bitset representations of pitch-class collections. Set operations, membership tests, and transpositions are
+single integer operations on the mask instead of loops over tuples of pitch classes."""
+from typing import Iterable, Iterator, Type, TypeVar, Union
+
+from abstract import FifthsScalar, IntType, SemitonesScalar
+from pitch import EnharmonicPitchClass, SpecificPitchClass
+
+FIFTHS_WINDOW = range(-35, 36)
+"""Window of the line of fifths covered by SpecificPitchClassSet masks, i.e. from Fbbbbb to Bxxxxx. Bit i stands
+for the fifths FIFTHS_WINDOW[i]."""
+
+S = TypeVar("S", bound="PitchClassSet")
+
+
+class PitchClassSet:
+    """Immutable set of pitch classes stored as integer mask in which every bit stands for one pitch class.
+    Operations between sets of different types are not defined."""
+
+    __slots__ = ("mask",)
+
+    width: int = 0
+    """Number of bits used by the mask."""
+
+    def __init__(self, pitch_classes: Iterable[Union[int, IntType]] = ()):
+        """
+
+        Args:
+            pitch_classes: Pitch classes or plain integers in the unit of the set type (semitones or fifths).
+        """
+        mask = 0
+        for pitch_class in pitch_classes:
+            mask |= 1 << self._bit(pitch_class)
+        object.__setattr__(self, "mask", mask)
+
+    @classmethod
+    def from_mask(cls: Type[S], mask: int) -> S:
+        """Creates a set from its integer mask."""
+        if not 0 <= mask < 1 << cls.width:
+            raise ValueError(f"{mask} is not a {cls.width}-bit mask.")
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "mask", mask)
+        return instance
+
+    @classmethod
+    def _bit(cls, pitch_class: Union[int, IntType]) -> int:
+        """Returns the position of the bit standing for the given pitch class."""
+        raise NotImplementedError
+
+    @classmethod
+    def _element(cls, bit: int) -> IntType:
+        """Returns the pitch class for which the given bit stands."""
+        raise NotImplementedError
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def _check_type(self, other: "PitchClassSet", symbol: str) -> None:
+        if type(other) is not type(self):
+            raise NotImplementedError(
+                f"Operation not defined: {type(self)} {symbol} {type(other)}"
+            )
+
+    def __contains__(self, pitch_class: Union[int, IntType]) -> bool:
+        try:
+            bit = self._bit(pitch_class)
+        except ValueError:
+            return False
+        return self.mask & (1 << bit) != 0
+
+    def __iter__(self) -> Iterator[IntType]:
+        mask = self.mask
+        while mask:
+            lowest = mask & -mask
+            yield self._element(lowest.bit_length() - 1)
+            mask ^= lowest
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.mask))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        self._check_type(other, "==")
+        return self.mask == other.mask
+
+    def __and__(self: S, other: S) -> S:
+        self._check_type(other, "&")
+        return self.from_mask(self.mask & other.mask)
+
+    def __or__(self: S, other: S) -> S:
+        self._check_type(other, "|")
+        return self.from_mask(self.mask | other.mask)
+
+    def __xor__(self: S, other: S) -> S:
+        self._check_type(other, "^")
+        return self.from_mask(self.mask ^ other.mask)
+
+    def __sub__(self: S, other: S) -> S:
+        self._check_type(other, "-")
+        return self.from_mask(self.mask & ~other.mask)
+
+    def __le__(self, other: "PitchClassSet") -> bool:
+        """Subset test."""
+        self._check_type(other, "<=")
+        return self.mask & ~other.mask == 0
+
+    def __lt__(self, other: "PitchClassSet") -> bool:
+        return self <= other and self.mask != other.mask
+
+    def __ge__(self, other: "PitchClassSet") -> bool:
+        """Superset test."""
+        self._check_type(other, ">=")
+        return other.mask & ~self.mask == 0
+
+    def __gt__(self, other: "PitchClassSet") -> bool:
+        return self >= other and self.mask != other.mask
+
+    def isdisjoint(self, other: "PitchClassSet") -> bool:
+        self._check_type(other, "isdisjoint")
+        return self.mask & other.mask == 0
+
+    def __str__(self) -> str:
+        """String representation should work as a constructor."""
+        return f"{type(self).__name__}({[element.name for element in self]})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class EnharmonicPitchClassSet(PitchClassSet):
+    """12-bit set of EnharmonicPitchClasses in which bit i stands for EPC(i). SpecificPitchClasses are projected
+    onto their semitones. Transposition is a rotation of the mask."""
+
+    __slots__ = ()
+
+    width = 12
+
+    @classmethod
+    def _bit(cls, pitch_class: Union[int, IntType]) -> int:
+        if isinstance(pitch_class, FifthsScalar):
+            return pitch_class.semitones
+        return int(pitch_class) % 12
+
+    @classmethod
+    def _element(cls, bit: int) -> EnharmonicPitchClass:
+        return EnharmonicPitchClass._from_int(bit)
+
+    def transpose(self, interval: Union[int, IntType]) -> "EnharmonicPitchClassSet":
+        """Rotates the set by the given number of semitones or by the semitones of an interval class."""
+        steps = self._bit(interval)
+        mask = ((self.mask << steps) | (self.mask >> (12 - steps))) & 0xFFF
+        return self.from_mask(mask)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}({[int(element) for element in self]})"
+
+
+class SpecificPitchClassSet(PitchClassSet):
+    """Set of SpecificPitchClasses within FIFTHS_WINDOW in which bit i stands for the fifths FIFTHS_WINDOW[i].
+    Transposition is a shift of the mask."""
+
+    __slots__ = ()
+
+    width = len(FIFTHS_WINDOW)
+
+    @classmethod
+    def _bit(cls, pitch_class: Union[int, IntType]) -> int:
+        if isinstance(pitch_class, SemitonesScalar):
+            raise NotImplementedError(
+                f"{type(pitch_class)} cannot be placed on the line of fifths."
+            )
+        bit = int(pitch_class) - FIFTHS_WINDOW.start
+        if not 0 <= bit < cls.width:
+            raise ValueError(
+                f"{pitch_class!r} lies outside the window of fifths {FIFTHS_WINDOW}."
+            )
+        return bit
+
+    @classmethod
+    def _element(cls, bit: int) -> SpecificPitchClass:
+        return SpecificPitchClass._from_int(bit + FIFTHS_WINDOW.start)
+
+    def transpose(self, interval: Union[int, IntType]) -> "SpecificPitchClassSet":
+        """Shifts the set by the given number of fifths or by the fifths of a specific interval class.
+
+        Raises:
+            ValueError: If members would leave FIFTHS_WINDOW.
+        """
+        if isinstance(interval, SemitonesScalar):
+            raise NotImplementedError(
+                f"Operation not defined: {type(self)} transposed by {type(interval)}"
+            )
+        fifths = int(interval)
+        mask = self.mask << fifths if fifths >= 0 else self.mask >> -fifths
+        if mask >> self.width or (fifths < 0 and self.mask & ((1 << -fifths) - 1)):
+            raise ValueError(
+                f"Transposing {self} by {fifths} fifths leaves the window {FIFTHS_WINDOW}."
+            )
+        return self.from_mask(mask)
+
+    @property
+    def enharmonic(self) -> EnharmonicPitchClassSet:
+        """The set projected onto enharmonic pitch classes."""
+        return EnharmonicPitchClassSet(self)
+
+
+if __name__ == "__main__":
+    from pitch import EPC, SIC, SPC
+
+    c_major = SpecificPitchClassSet(SPC(f) for f in range(-1, 6))
+    print(f"C major scale: {c_major} with mask {c_major.mask:#x}")
+    print(f"Transposed by {SIC('M2')!r}: {c_major.transpose(SIC('M2'))}")
+    print(f"F# in C major: {SPC('F#') in c_major}, F in C major: {SPC('F') in c_major}")
+    triad = SpecificPitchClassSet([SPC("C"), SPC("E"), SPC("G")])
+    print(f"{triad} <= C major: {triad <= c_major}")
+    print(f"C major projected: {c_major.enharmonic}")
+    print(f"Transposed by one semitone: {c_major.enharmonic.transpose(1)}")
+    print(f"EPC(6) in C major: {EPC(6) in c_major.enharmonic}")
@@ -0,0 +1,272 @@
+"""Opt-in instrumentation of the hot paths: instances created per IntType subclass, operator calls per
+(left type, right type, operator) including those that raised NotImplementedError, and calls and cumulative time of
+the pitch_helpers conversions.
+
+Profiling is switched on by setting the environment variable PROFILE_PITCH_TYPES=1 before importing pitch, by
+calling enable(), or for a block of code by ``with profiling(): ...``. Only while it is on are wrappers installed;
+disabling restores the original functions, so that switched off the instrumentation costs nothing.
+"""
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import abstract
+import pitch_helpers
+from abstract import IntType
+
+ENVIRONMENT_VARIABLE = "PROFILE_PITCH_TYPES"
+
+HELPERS = [
+    "split_note_name",
+    "note_name2fifths",
+    "interval_name2fifths",
+    "fifths2note_name",
+    "fifths2interval_name",
+    "note_names2fifths",
+    "interval_names2fifths",
+    "fifths2note_names",
+    "fifths2interval_names",
+]
+"""Functions of pitch_helpers whose calls are timed. The bulk functions call the scalar ones, whose time is
+therefore included in both."""
+
+UNARY_AND_COMPARISONS = {
+    "__neg__": "neg",
+    "__eq__": "==",
+    "__lt__": "<",
+    "__le__": "<=",
+    "__gt__": ">",
+    "__ge__": ">=",
+}
+"""IntType methods that do not go through abstract._resolve() and are therefore wrapped individually."""
+
+instances: Counter = Counter()
+"""Number of allocated (i.e. not interned) instances per IntType subclass."""
+
+operator_calls: Counter = Counter()
+"""Number of calls per (left type, right type, operator symbol); the right type is None for negation."""
+
+operator_errors: Counter = Counter()
+"""Number of calls per (left type, right type, operator symbol) that raised NotImplementedError."""
+
+helper_calls: Counter = Counter()
+"""Number of calls per pitch_helpers function name."""
+
+helper_seconds: Counter = Counter()
+"""Cumulative time in seconds per pitch_helpers function name."""
+
+_originals: List[Tuple[object, str, object]] = []
+"""(owner, attribute, original value) for every installed wrapper, in the order of installation."""
+
+
+def is_enabled() -> bool:
+    return len(_originals) > 0
+
+
+def _install(owner: object, attribute: str, wrapper: object) -> None:
+    """Replaces an attribute of a class or module, remembering the original for disable()."""
+    original = vars(owner)[attribute]
+    _originals.append((owner, attribute, original))
+    setattr(owner, attribute, wrapper)
+
+
+def _counted_from_int(original: classmethod) -> classmethod:
+    function = original.__func__
+
+    def _from_int(cls, value):
+        if value not in cls._interned:
+            instances[cls] += 1
+        return function(cls, value)
+
+    return classmethod(_from_int)
+
+
+def _counted_resolve(original: Callable) -> Callable:
+    def _resolve(left, right, symbol):
+        implementation = original(left, right, symbol)
+        key = (left, right, symbol)
+
+        def counted(a, b):
+            operator_calls[key] += 1
+            try:
+                return implementation(a, b)
+            except NotImplementedError:
+                operator_errors[key] += 1
+                raise
+
+        # replaces the entry stored by the original _resolve()
+        abstract._DISPATCH[key] = counted
+        return counted
+
+    return _resolve
+
+
+def _counted_method(original: Callable, symbol: str) -> Callable:
+    if symbol == "neg":
+
+        def method(self):
+            key = (type(self), None, symbol)
+            operator_calls[key] += 1
+            try:
+                return original(self)
+            except NotImplementedError:
+                operator_errors[key] += 1
+                raise
+
+    else:
+
+        def method(self, other):
+            key = (type(self), type(other), symbol)
+            operator_calls[key] += 1
+            try:
+                return original(self, other)
+            except NotImplementedError:
+                operator_errors[key] += 1
+                raise
+
+    method.__name__ = original.__name__
+    return method
+
+
+def _timed_helper(original: Callable, name: str) -> Callable:
+    def helper(*args, **kwargs):
+        helper_calls[name] += 1
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            helper_seconds[name] += time.perf_counter() - start
+
+    helper.__name__ = original.__name__
+    helper.__doc__ = original.__doc__
+    helper.__wrapped__ = original
+    return helper
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _subclasses(subclass)
+
+
+def enable() -> None:
+    """Installs the wrappers. Operator implementations resolved so far are discarded so that they are resolved
+    again, and counted, on their next use. Calling enable() while enabled has no effect."""
+    if is_enabled():
+        return
+    _install(IntType, "_from_int", _counted_from_int(vars(IntType)["_from_int"]))
+    _install(abstract, "_resolve", _counted_resolve(abstract._resolve))
+    for cls in dict.fromkeys(_subclasses(IntType)):
+        for method, symbol in UNARY_AND_COMPARISONS.items():
+            if method in vars(cls):
+                _install(cls, method, _counted_method(vars(cls)[method], symbol))
+    for name in HELPERS:
+        original = getattr(pitch_helpers, name)
+        wrapper = _timed_helper(original, name)
+        # modules that imported the function by name hold their own reference to it
+        for module in list(sys.modules.values()):
+            if vars(module).get(name) is original:
+                _install(module, name, wrapper)
+    abstract._DISPATCH.clear()
+
+
+def disable() -> None:
+    """Restores the original functions. The counts are kept until reset()."""
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        setattr(owner, attribute, original)
+    # the implementations resolved while enabled are counting wrappers
+    abstract._DISPATCH.clear()
+
+
+def reset() -> None:
+    """Sets all counts and times to zero."""
+    for counter in (
+        instances,
+        operator_calls,
+        operator_errors,
+        helper_calls,
+        helper_seconds,
+    ):
+        counter.clear()
+
+
+def snapshot() -> Dict[str, Dict]:
+    """Returns copies of the current counts.
+
+    Returns:
+        Dictionary with the keys 'instances' (by class), 'operator_calls' and 'operator_errors'
+        (by (left type, right type, symbol)), 'helper_calls' and 'helper_seconds' (by function name).
+    """
+    return {
+        "instances": dict(instances),
+        "operator_calls": dict(operator_calls),
+        "operator_errors": dict(operator_errors),
+        "helper_calls": dict(helper_calls),
+        "helper_seconds": dict(helper_seconds),
+    }
+
+
+def report() -> str:
+    """Formats the current counts as table, most frequent first."""
+    lines = ["instances created:"]
+    for cls, count in instances.most_common():
+        lines.append(f"  {cls.__name__:<40}{count:>12}")
+    lines.append("operator calls (NotImplementedError):")
+    for (left, right, symbol), count in operator_calls.most_common():
+        right_name = "" if right is None else right.__name__
+        operation = f"{left.__name__} {symbol} {right_name}".strip()
+        errors = operator_errors[(left, right, symbol)]
+        lines.append(f"  {operation:<40}{count:>12} ({errors})")
+    lines.append("pitch_helpers calls (seconds):")
+    for name, count in helper_calls.most_common():
+        lines.append(f"  {name:<40}{count:>12} ({helper_seconds[name]:.6f})")
+    return "\n".join(lines)
+
+
+@contextmanager
+def profiling(reset_counts: bool = True) -> Iterator[None]:
+    """Context manager enabling profiling within its block, e.g.
+
+    >>> with profiling():
+    ...     SPC("C") + SIC("M3")
+    >>> snapshot()["operator_calls"]
+
+    Args:
+        reset_counts: Pass False to keep the counts from previous profiling.
+    """
+    was_enabled = is_enabled()
+    if reset_counts:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def enable_from_environment() -> None:
+    """Enables profiling if the environment variable PROFILE_PITCH_TYPES is set to a value other than 0."""
+    if os.environ.get(ENVIRONMENT_VARIABLE, "0") not in ("", "0"):
+        enable()
+
+
+if __name__ == "__main__":
+    from pitch import EPC, SIC, SPC
+
+    with profiling():
+        for name in ["C", "F#", "Bb", "Fbbbbbbb"]:
+            for interval in ["M3", "P5", "m7"]:
+                SPC(name) + SIC(interval)
+        try:
+            SPC("C") + EPC(3)
+        except NotImplementedError:
+            pass
+        -SIC(3)
+        SPC(4) == SPC(4)
+    print(report())
+    print(f"Still wrapped after the block: {is_enabled()}")
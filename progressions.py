@@ -0,0 +1,345 @@
+"""Transposition-invariant index of chord progressions. Every chord of a piece is reduced to its type and the root
+motion from the preceding chord in fifths (the SpecificIntervalClass between the roots), so that a progression and
+all its transpositions share one key:
+
+    (type_0, motion_1, type_1, ..., motion_n-1, type_n-1)
+
+e.g. (MajorChord.type_id, 1, MajorChord.type_id) for every step from a major chord to the major chord a fifth above.
+The positions of all n-grams up to the order of the index are kept in a hash table that grows with every added piece,
+so that n-grams are counted and patterns are found by looking up their rarest n-gram and checking only its
+occurrences, instead of scanning the corpus. Indices are stored as archives (see archive.py).
+"""
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from abstract import FifthsScalar
+from archive import MISSING, Archive, write_archive
+from harmony import SELECTOR_TYPES, Chord, RawSemitones, _is_raw
+from pitch import SIC
+
+Gram = Tuple[int, ...]
+"""An n-gram key: alternating type ids and root motions in fifths, starting and ending with a type id."""
+
+PatternElement = Optional[Union[Chord, Type[Chord]]]
+"""A Chord matching its type and its root relative to the other rooted elements, a Chord subclass matching its type
+with any root, or None matching any chord."""
+
+
+class ProgressionIndex:
+    """Hash index of the n-grams of the chords of a corpus. Pieces are added with add_piece()."""
+
+    def __init__(self, order: int = 4):
+        """
+
+        Args:
+            order: Length of the longest n-grams that are indexed. Longer n-grams and patterns are supported too.
+        """
+        if order < 1:
+            raise ValueError("The order needs to be at least 1.")
+        self.order = order
+        self._grams: Dict[Gram, List[int]] = defaultdict(list)
+        """The first chord of every occurrence of all n-grams up to the order."""
+        self._chunks: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._starts: List[int] = []
+        self.size = 0
+        """Number of chords in the corpus."""
+
+    def __len__(self) -> int:
+        """The number of pieces."""
+        return len(self._starts)
+
+    @staticmethod
+    def _encode(chords: Iterable[Chord]) -> Tuple[np.ndarray, np.ndarray]:
+        """The type ids and the roots, as fifths, of the chords of a piece."""
+        types, roots = [], []
+        for chord in chords:
+            if not isinstance(chord, Chord) or type(chord).type_id is None:
+                raise TypeError(f"{chord!r} is not a Chord of a registered type.")
+            root = chord.root
+            if isinstance(root, FifthsScalar) or (
+                _is_raw(root) and not isinstance(root, RawSemitones)
+            ):
+                roots.append(int(root))
+            else:
+                raise ValueError(
+                    f"{chord} needs a SpecificPitchClass root to express root motions in fifths."
+                )
+            types.append(type(chord).type_id)
+        return np.array(types, dtype=np.int16), np.array(roots, dtype=np.int16)
+
+    def add_piece(self, chords: Sequence[Chord]) -> int:
+        """Appends a piece to the corpus and indexes its n-grams.
+
+        Args:
+            chords: Chords with SpecificPitchClass roots.
+
+        Returns:
+            The index of the piece.
+        """
+        return self._add(*self._encode(chords))
+
+    def _add(self, types: np.ndarray, roots: np.ndarray) -> int:
+        start = self.size
+        type_list = types.tolist()
+        motions = [0] + np.diff(roots.astype(np.int64)).tolist()
+        for i in range(len(type_list)):
+            key: Gram = (type_list[i],)
+            self._grams[key].append(start + i)
+            for j in range(i + 1, min(i + self.order, len(type_list))):
+                key += (motions[j], type_list[j])
+                self._grams[key].append(start + i)
+        self._chunks.append((types, roots))
+        self._arrays = None
+        self._starts.append(start)
+        self.size += len(type_list)
+        return len(self._starts) - 1
+
+    def _corpus(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The type ids, the roots, and the piece of all chords, concatenated on first use after adding pieces."""
+        if self._arrays is None:
+            types = np.concatenate(
+                [c[0] for c in self._chunks] or [np.zeros(0, np.int16)]
+            )
+            roots = np.concatenate(
+                [c[1] for c in self._chunks] or [np.zeros(0, np.int16)]
+            )
+            lengths = [len(c[0]) for c in self._chunks]
+            pieces = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+            self._arrays = (types, roots.astype(np.int64), pieces)
+        return self._arrays
+
+    def _windows(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """The type ids and the root motions of all n-grams within a piece."""
+        types, roots, pieces = self._corpus()
+        if self.size < n:
+            return np.zeros((0, n), np.int64), np.zeros((0, n - 1), np.int64)
+        view = np.lib.stride_tricks.sliding_window_view
+        windows = self.size - n + 1
+        starts = np.flatnonzero(pieces[:windows] == pieces[-windows:])
+        motions = np.diff(view(roots, n)[starts], axis=1)
+        return view(types, n)[starts].astype(np.int64), motions
+
+    def count(self, n: int) -> Dict[Gram, int]:
+        """The number of occurrences of every n-gram.
+
+        Args:
+            n: Number of chords. N-grams up to the order are counted from the index, longer ones from the corpus.
+        """
+        if n < 1:
+            raise ValueError("N-grams consist of at least one chord.")
+        if n <= self.order:
+            length = 2 * n - 1
+            return {
+                key: len(positions)
+                for key, positions in self._grams.items()
+                if len(key) == length
+            }
+        types, motions = self._windows(n)
+        keys = np.empty((len(types), 2 * n - 1), dtype=np.int64)
+        keys[:, ::2], keys[:, 1::2] = types, motions
+        unique, counts = np.unique(keys, axis=0, return_counts=True)
+        return dict(zip(map(tuple, unique.tolist()), counts.tolist()))
+
+    def most_common(self, n: int, k: int = 10) -> List[Tuple[Gram, int]]:
+        """The k most frequent n-grams with their numbers of occurrences."""
+        counts = self.count(n)
+        return sorted(counts.items(), key=lambda item: -item[1])[:k]
+
+    @staticmethod
+    def _pattern(
+        pattern: Sequence[PatternElement],
+    ) -> List[Tuple[Optional[int], Optional[int]]]:
+        """The type id and the root, as fifths, of every pattern element, None where any value matches."""
+        elements = []
+        for element in pattern:
+            if element is None:
+                elements.append((None, None))
+            elif (
+                isinstance(element, type)
+                and issubclass(element, Chord)
+                and element.type_id is not None
+            ):
+                elements.append((element.type_id, None))
+            else:
+                types, roots = ProgressionIndex._encode([element])
+                elements.append((int(types[0]), int(roots[0])))
+        return elements
+
+    def _anchor(
+        self, elements: List[Tuple[Optional[int], Optional[int]]]
+    ) -> Optional[Tuple[int, Gram]]:
+        """The indexed n-gram of the pattern with the fewest occurrences, and its offset within the pattern."""
+        best = None
+        for offset, (type_id, root) in enumerate(elements):
+            if type_id is None:
+                continue
+            key: Gram = (type_id,)
+            candidates = [key]
+            for j in range(offset + 1, min(offset + self.order, len(elements))):
+                next_type, next_root = elements[j]
+                if next_type is None or next_root is None or elements[j - 1][1] is None:
+                    break
+                key += (next_root - elements[j - 1][1], next_type)
+                candidates.append(key)
+            for key in candidates:
+                occurrences = len(self._grams.get(key, ()))
+                if best is None or occurrences < best[0]:
+                    best = (occurrences, offset, key)
+        return None if best is None else best[1:]
+
+    def search(self, pattern: Sequence[PatternElement]) -> np.ndarray:
+        """Finds all occurrences of a pattern in any transposition. Rooted elements need to keep their root
+        intervals, also across wildcards, e.g. [MajorChord(SPC('D')), None, MajorChord(SPC('C'))] matches major
+        chords two fifths apart with any chord in between.
+
+        Args:
+            pattern: Chords, Chord subclasses, or None, see PatternElement.
+
+        Returns:
+            An array of shape (occurrences, 2) holding the piece and the position within the piece of the first
+            chord of every occurrence, in corpus order.
+        """
+        elements = self._pattern(pattern)
+        length = len(elements)
+        if length == 0:
+            raise ValueError("The pattern needs at least one element.")
+        types, roots, pieces = self._corpus()
+        anchor = self._anchor(elements)
+        if anchor is None:
+            candidates = np.arange(self.size - length + 1)
+        else:
+            offset, key = anchor
+            candidates = np.array(self._grams.get(key, ()), dtype=np.intp) - offset
+            candidates = candidates[
+                (candidates >= 0) & (candidates <= self.size - length)
+            ]
+        candidates = candidates[pieces[candidates] == pieces[candidates + length - 1]]
+        reference = None
+        for offset, (type_id, root) in enumerate(elements):
+            if type_id is not None:
+                candidates = candidates[types[candidates + offset] == type_id]
+            if root is None:
+                continue
+            if reference is None:
+                reference = (offset, root)
+                continue
+            motion = roots[candidates + offset] - roots[candidates + reference[0]]
+            candidates = candidates[motion == root - reference[1]]
+        starts = np.array(self._starts, dtype=np.intp)
+        candidate_pieces = pieces[candidates]
+        return np.stack(
+            [candidate_pieces, candidates - starts[candidate_pieces]], axis=1
+        )
+
+    @staticmethod
+    def format_gram(key: Gram) -> str:
+        """An n-gram as text, e.g. 'maj P4 maj', with type labels (or class names) and root motions as interval
+        classes."""
+        words = []
+        for i, value in enumerate(key):
+            if i % 2 == 0:
+                selector = SELECTOR_TYPES[value]
+                words.append(selector.label or selector.__name__)
+            else:
+                words.append(repr(SIC._from_int(value)))
+        return " ".join(words)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Writes the corpus into an archive with a 'type' and a 'root' column, in which empty rows separate the
+        pieces. The n-grams are not stored but indexed again by load()."""
+        types, roots, _ = self._corpus()
+        separators = np.array(self._starts[1:], dtype=np.intp)
+        type_column = np.insert(types.astype(np.int64), separators, -1).tolist()
+        root_column = np.insert(roots.astype(np.int16), separators, MISSING)
+        write_archive(
+            path,
+            {
+                "type": [None if t < 0 else SELECTOR_TYPES[t] for t in type_column],
+                "root": root_column,
+            },
+            kinds={"root": "SPC"},
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike], order: int = 4) -> "ProgressionIndex":
+        """Reads a corpus written by save() and indexes it.
+
+        Args:
+            path: Archive written by save().
+            order: See ProgressionIndex. Need not be the order of the saved index.
+        """
+        archive = Archive(path)
+        index = cls(order)
+        if len(archive) == 0:
+            return index
+        type_ids = np.array(
+            [selector.type_id for selector in archive.types] + [-1], dtype=np.int16
+        )
+        codes, roots = np.asarray(archive["type"].values), np.asarray(
+            archive["root"].values
+        )
+        types = type_ids[np.where(codes == MISSING, -1, codes)]
+        bounds = np.flatnonzero(codes == MISSING)
+        for piece_types, piece_roots in zip(
+            np.split(types, bounds), np.split(roots, bounds)
+        ):
+            if len(piece_types) > 0 and piece_types[0] < 0:
+                piece_types, piece_roots = piece_types[1:], piece_roots[1:]
+            index._add(piece_types.copy(), piece_roots.astype(np.int16))
+        return index
+
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    from harmony import SPC, MajorChord
+
+    class MinorChord(Chord):
+        intervals = (SIC(0), SIC(-3), SIC(1))
+        label = "min"
+
+    def chords(names: str) -> List[Chord]:
+        return [
+            MinorChord(SPC(name[:-1])) if name.endswith("m") else MajorChord(SPC(name))
+            for name in names.split()
+        ]
+
+    index = ProgressionIndex(order=3)
+    index.add_piece(chords("C Am F G C"))
+    index.add_piece(chords("Eb Cm Ab Bb Eb"))
+    index.add_piece(chords("D G A D Bm G A D"))
+    for key, count in index.most_common(3, 3):
+        print(f"{index.format_gram(key)}: {count}")
+    print(f"I-vi-IV in any key: {index.search(chords('C Am F')).tolist()}")
+    print(
+        f"IV - any chord - I: {index.search(chords('F')[:1] + [None] + chords('C')).tolist()}"
+    )
+    print(f"min, then maj: {index.search([MinorChord, MajorChord]).tolist()}")
+    print(f"Five chords: {len(index.count(5))} distinct 5-grams")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.pcarchive")
+        index.save(path)
+        loaded = ProgressionIndex.load(path, order=3)
+    pattern = chords("C Am F")
+    same = np.array_equal(loaded.search(pattern), index.search(pattern))
+    print(f"Loaded: {len(loaded)} pieces, same search results: {same}")
+
+    rng = np.random.default_rng(0)
+    pool = [MajorChord(SPC._from_int(root)) for root in range(-7, 8)] + [
+        MinorChord(SPC._from_int(root)) for root in range(-7, 8)
+    ]
+    large = ProgressionIndex()
+    start = time.perf_counter()
+    for _ in range(1000):
+        large.add_piece([pool[i] for i in rng.integers(0, len(pool), 200).tolist()])
+    print(f"Indexed {large.size} chords in {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    found = large.search(chords("C Am F G"))
+    print(
+        f"{len(found)} occurrences of I-vi-IV-V found in {1000 * (time.perf_counter() - start):.1f} ms"
+    )
@@ -0,0 +1,261 @@
+"""Set classes, i.e. pitch-class sets up to transposition and inversion, of EnharmonicPitchClass collections. The
+prime form, Forte number, and interval-class vector of every one of the 4096 subsets of the twelve pitch classes are
+computed once into lookup tables indexed by the 12-bit masks of pitch_sets.EnharmonicPitchClassSet, so that the
+set class of a chord, a scale, or of whole arrays of masks is a table lookup.
+
+Prime forms follow Rahn: among all transpositions and inversions, the one with the smallest mask, i.e. the one that
+is most packed towards 0. Forte numbers are looked up by set class and thus do not depend on this choice.
+
+Spelled collections (SpecificPitchClassSet) have set classes on the line of fifths instead, where transposition
+shifts and inversion mirrors the set, see spelled_prime_form() and spelled_interval_vector().
+"""
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+from abstract import IntType
+from harmony import PitchClassSelector
+from identify import CANONICAL_ROTATION, _normalize_fifths
+from pitch_sets import EnharmonicPitchClassSet, PitchClassSet, SpecificPitchClassSet
+
+FORTE_CATALOG = {
+    2: "01 02 03 04 05 06",
+    3: "012 013 014 015 016 024 025 026 027 036 037 048",
+    4: "0123 0124 0134 0125 0126 0127 0145 0156 0167 0235 0135 0236 0136 0237 Z0146 0157 0347 0147 0148 "
+    "0158 0246 0247 0257 0248 0268 0358 0258 0369 Z0137",
+    5: "01234 01235 01245 01236 01237 01256 01267 02346 01246 01346 02347 Z01356 01248 01257 01268 01347 Z01348 "
+    "Z01457 01367 01378 01458 01478 02357 01357 02358 02458 01358 02368 01368 01468 01369 01469 02468 02469 "
+    "02479 Z01247 Z03458 Z01258",
+    6: "012345 012346 Z012356 Z012456 012367 Z012567 012678 023457 012357 Z013457 Z012457 Z012467 Z013467 "
+    "013458 012458 014568 Z012478 012578 Z013478 014589 023468 012468 Z023568 Z013468 Z013568 Z013578 013469 "
+    "Z013569 Z013689 013679 013589 024579 023579 013579 02468A Z012347 Z012348 Z012378 Z023458 Z012358 "
+    "Z012368 Z012369 Z012568 Z012569 Z023469 Z012469 Z012479 Z012579 Z013479 Z014679",
+}
+"""Forte's list of set classes with two to six elements, in the order of their Forte numbers. Each entry is a member
+of the set class in base-12 digits (A for 10), marked with Z if the set class is Z-related to another one. Set classes
+with seven to ten elements are numbered like their complements."""
+
+
+def _masks_from_bits(bits: np.ndarray) -> np.ndarray:
+    return (bits.astype(np.int16) << np.arange(12, dtype=np.int16)).sum(axis=-1)
+
+
+def _build_set_class_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """For every 12-bit mask, computes the mask of its prime form, its interval-class vector, and its cardinality."""
+    masks = np.arange(4096, dtype=np.int16)
+    bits = (masks[:, None] >> np.arange(12, dtype=np.int16)) & 1
+    # pitch class -i of the inversion is pitch class i of the set
+    inverted = _masks_from_bits(bits[:, -np.arange(12) % 12])
+    prime = np.minimum(CANONICAL_ROTATION, CANONICAL_ROTATION[inverted])
+    vector = np.stack(
+        [(bits & np.roll(bits, -k, axis=1)).sum(axis=1) for k in range(1, 7)], axis=1
+    )
+    # each tritone is counted from both of its pitch classes
+    vector[:, 5] //= 2
+    return (
+        prime.astype(np.int16),
+        vector.astype(np.int8),
+        bits.sum(axis=1, dtype=np.int8),
+    )
+
+
+PRIME_FORM, INTERVAL_VECTOR, CARDINALITY = _build_set_class_tables()
+"""Lookup tables indexed by 12-bit masks: the mask of the prime form, the interval-class vector (counts of interval
+classes 1 to 6), and the number of pitch classes."""
+
+
+def _build_forte_tables() -> Tuple[np.ndarray, List[str]]:
+    """Numbers all set classes after FORTE_CATALOG and returns, for every 12-bit mask, an index into the list of
+    Forte numbers."""
+    names = {0: "0-1", 0xFFF: "12-1"}
+    for pitch_class in range(12):
+        names[1 << pitch_class] = "1-1"
+        names[0xFFF ^ (1 << pitch_class)] = "11-1"
+    for cardinality, entries in FORTE_CATALOG.items():
+        for number, entry in enumerate(entries.split(), start=1):
+            z = "Z" if entry.startswith("Z") else ""
+            mask = sum(1 << int(digit, 12) for digit in entry.lstrip("Z"))
+            names[int(PRIME_FORM[mask])] = f"{cardinality}-{z}{number}"
+            if cardinality < 6:
+                complement = int(PRIME_FORM[0xFFF ^ mask])
+                names[complement] = f"{12 - cardinality}-{z}{number}"
+    forte_numbers = sorted(
+        set(names.values()),
+        key=lambda name: tuple(int(part.lstrip("Z")) for part in name.split("-")),
+    )
+    position = {name: i for i, name in enumerate(forte_numbers)}
+    index = np.full(4096, -1, dtype=np.int16)
+    for prime, name in names.items():
+        index[PRIME_FORM == PRIME_FORM[prime]] = position[name]
+    assert (index >= 0).all(), "FORTE_CATALOG misses set classes."
+    return index, forte_numbers
+
+
+FORTE_INDEX, FORTE_NUMBERS = _build_forte_tables()
+"""FORTE_NUMBERS lists all 224 Forte numbers from '0-1' to '12-1'; FORTE_INDEX is the lookup table of the
+positions in this list, indexed by 12-bit masks."""
+
+MaskLike = Union[
+    int, EnharmonicPitchClassSet, PitchClassSelector, Iterable[Union[int, IntType]]
+]
+
+
+def enharmonic_mask(collection: MaskLike) -> int:
+    """The 12-bit mask of a collection of pitch classes.
+
+    Args:
+        collection:
+            A mask, an EnharmonicPitchClassSet, a Chord or Scale (its chord_tones or scale_degrees, projected to
+            EnharmonicPitchClasses), or any iterable of pitch classes or semitones.
+    """
+    if isinstance(collection, int):
+        if not 0 <= collection < 4096:
+            raise ValueError(f"{collection} is not a 12-bit mask.")
+        return collection
+    if isinstance(collection, PitchClassSelector):
+        return collection.enharmonic_set.mask
+    if isinstance(collection, PitchClassSet) and not isinstance(
+        collection, EnharmonicPitchClassSet
+    ):
+        collection = collection.enharmonic
+    if not isinstance(collection, EnharmonicPitchClassSet):
+        collection = EnharmonicPitchClassSet(collection)
+    return collection.mask
+
+
+def _pitch_classes(mask: int) -> Tuple[int, ...]:
+    return tuple(pitch_class for pitch_class in range(12) if mask >> pitch_class & 1)
+
+
+def prime_form(collection: MaskLike) -> Tuple[int, ...]:
+    """The prime form as semitones, e.g. (0, 3, 7) for any major or minor triad."""
+    return _pitch_classes(int(PRIME_FORM[enharmonic_mask(collection)]))
+
+
+def forte_number(collection: MaskLike) -> str:
+    """The Forte number, e.g. '3-11' for any major or minor triad and '7-35' for diatonic scales."""
+    return FORTE_NUMBERS[FORTE_INDEX[enharmonic_mask(collection)]]
+
+
+def interval_vector(collection: MaskLike) -> Tuple[int, ...]:
+    """The interval-class vector, i.e. the number of pairs of pitch classes per interval class 1 to 6."""
+    return tuple(INTERVAL_VECTOR[enharmonic_mask(collection)].tolist())
+
+
+def _mask_array(masks: Union[np.ndarray, Iterable[int]]) -> np.ndarray:
+    masks = np.asarray(masks)
+    if masks.dtype.kind not in "iu":
+        raise TypeError("Masks need to be integers.")
+    if masks.size > 0 and (masks.min() < 0 or masks.max() >= 4096):
+        raise ValueError("Masks need to be between 0 and 4095.")
+    return masks
+
+
+def prime_forms(masks: Union[np.ndarray, Iterable[int]]) -> np.ndarray:
+    """Bulk version of prime_form() returning the masks of the prime forms in an array of the input's shape."""
+    return PRIME_FORM[_mask_array(masks)]
+
+
+def forte_numbers(masks: Union[np.ndarray, Iterable[int]]) -> np.ndarray:
+    """Bulk version of forte_number() returning an object array of the input's shape."""
+    return np.array(FORTE_NUMBERS, dtype=object)[FORTE_INDEX[_mask_array(masks)]]
+
+
+def interval_vectors(masks: Union[np.ndarray, Iterable[int]]) -> np.ndarray:
+    """Bulk version of interval_vector() returning an int8 array with an additional last axis of length 6."""
+    return INTERVAL_VECTOR[_mask_array(masks)]
+
+
+def spelled_mask(
+    collection: Union[int, SpecificPitchClassSet, PitchClassSelector, Iterable]
+) -> int:
+    """The mask of a SpecificPitchClassSet, see enharmonic_mask().
+
+    Raises:
+        ValueError: If a Chord or Scale has an enharmonic root.
+    """
+    if isinstance(collection, int):
+        return collection
+    if isinstance(collection, PitchClassSelector):
+        spelled = collection.spelled_set
+        if spelled is None:
+            raise ValueError(f"{collection} has no SpecificPitchClasses.")
+        return spelled.mask
+    if not isinstance(collection, SpecificPitchClassSet):
+        collection = SpecificPitchClassSet(collection)
+    return collection.mask
+
+
+def _mirror(mask: int) -> int:
+    """Reverses the bits of a mask whose highest bit is set."""
+    return int(bin(mask)[:1:-1], 2)
+
+
+def spelled_prime_form(
+    collection: Union[int, SpecificPitchClassSet, PitchClassSelector, Iterable]
+) -> Tuple[int, ...]:
+    """The prime form on the line of fifths, as fifths starting at 0: among the set shifted to start at 0 and its
+    mirror image, the one that is most packed towards 0. For example, (0, 1, 4) for any major or minor triad,
+    (0, 1, 2, 3, 4, 5, 6) for diatonic scales, and (0, 1, 4, 10) for a German sixth chord, which has the same
+    enharmonic prime form as a dominant seventh chord.
+    """
+    mask = spelled_mask(collection)
+    if mask == 0:
+        return ()
+    normalized, _ = _normalize_fifths(mask)
+    prime = min(normalized, _mirror(normalized))
+    return tuple(bit for bit in range(prime.bit_length()) if prime >> bit & 1)
+
+
+def spelled_interval_vector(
+    collection: Union[int, SpecificPitchClassSet, PitchClassSelector, Iterable]
+) -> Tuple[int, ...]:
+    """The number of pairs of SpecificPitchClasses per distance on the line of fifths, starting from 1: perfect
+    fifths and fourths, major seconds and minor sevenths, minor thirds and major sixths, major thirds and minor
+    sixths, minor seconds and major sevenths, tritones (A4 and d5), chromatic semitones (A1 and d8), etc. The vector
+    ends at the largest distance between two of the pitch classes."""
+    mask = spelled_mask(collection)
+    if mask == 0:
+        return ()
+    normalized, _ = _normalize_fifths(mask)
+    return tuple(
+        bin(normalized & (normalized >> distance)).count("1")
+        for distance in range(1, normalized.bit_length())
+    )
+
+
+if __name__ == "__main__":
+    import time
+
+    from harmony import MajorChord, MajorPentatonicScale, MajorScale
+    from pitch import SPC
+
+    for selector in (
+        MajorChord(SPC("Eb")),
+        MajorPentatonicScale(SPC("A")),
+        MajorScale(SPC("F#")),
+    ):
+        print(
+            f"{selector}: prime form {prime_form(selector)}, Forte number {forte_number(selector)}, "
+            f"interval vector {interval_vector(selector)}"
+        )
+        print(
+            f"    spelled prime form {spelled_prime_form(selector)}, "
+            f"spelled interval vector {spelled_interval_vector(selector)}"
+        )
+    german_sixth = [SPC(name) for name in ("Ab", "C", "Eb", "F#")]
+    dominant = [SPC(name) for name in ("Ab", "C", "Eb", "Gb")]
+    print(
+        f"Ger+6 and V7 share {forte_number(german_sixth)}, but not their spelled prime forms: "
+        f"{spelled_prime_form(german_sixth)}, {spelled_prime_form(dominant)}"
+    )
+    print(
+        f"Z-related: {forte_numbers([0b1010011, 0b10001011])}, {interval_vectors([0b1010011, 0b10001011])}"
+    )
+    rng = np.random.default_rng(0)
+    masks = rng.integers(0, 4096, 1_000_000)
+    start = time.perf_counter()
+    numbers, vectors = forte_numbers(masks), interval_vectors(masks)
+    print(
+        f"{len(masks)} masks in {time.perf_counter() - start:.2f} s: {numbers[:3]}, {vectors[0]}"
+    )
@@ -0,0 +1,282 @@
+"""Spells sequences of enharmonic pitch classes or MIDI numbers on the line of fifths. Every note can be spelled as
+one of the candidates CANDIDATE_OFFSETS around its spelling closest to C, e.g. Ab, G# or Fbbb for EPC(8). A Viterbi
+pass chooses the candidates that minimize the distances between consecutive spellings plus the distances of every
+spelling from the center of its key context.
+
+The Viterbi pass runs on NumPy arrays: the forward costs of all prefixes are obtained by a parallel scan of the
+transition matrices in the (min, +) semiring, whose work is linear in the sequence length, and only the final
+backtracking is a Python loop over precomputed pointers. Long sequences are decoded in windows of bounded size.
+"""
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from harmony import Scale
+from pitch_arrays import (
+    EnharmonicPitchArray,
+    IntArray,
+    SemitonesArray,
+    SpecificPitchArray,
+    SPCArray,
+)
+
+CANDIDATE_OFFSETS = np.array([0, -12, 12])
+"""Candidate spellings relative to the spelling closest to C, in fifths. The first candidate wins ties."""
+
+DEFAULT_CENTER = 2.0
+"""Center of the line of fifths assumed without key context, i.e. D, the middle of the C major scale."""
+
+Context = Optional[Union[Scale, Sequence[Optional[Scale]]]]
+Spellable = Union[SemitonesArray, np.ndarray, Sequence[int]]
+
+
+def _min_plus(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Products of stacks of square matrices in the (min, +) semiring."""
+    # one elementwise minimum per inner index is much faster than reducing a 4-dimensional array
+    product = a[..., :, 0, None] + b[..., None, 0, :]
+    for k in range(1, a.shape[-1]):
+        np.minimum(product, a[..., :, k, None] + b[..., None, k, :], out=product)
+    return product
+
+
+def _min_plus_scan(matrices: np.ndarray) -> np.ndarray:
+    """Inclusive prefix products M[0] * M[1] * ... * M[t] of a stack of matrices in the (min, +) semiring. Adjacent
+    pairs are multiplied, the half-length stack is scanned recursively and the products at even positions are
+    filled in afterwards, so that the total work is linear in the number of matrices."""
+    n = len(matrices)
+    if n == 1:
+        return matrices
+    scanned = _min_plus_scan(_min_plus(matrices[:-1:2], matrices[1::2]))
+    result = np.empty_like(matrices)
+    result[0] = matrices[0]
+    result[1::2] = scanned
+    evens = matrices[2::2]
+    result[2::2] = _min_plus(scanned[: len(evens)], evens)
+    return result
+
+
+def scale_center(scale: Scale) -> float:
+    """The mean fifths of a scale's pitch classes, e.g. 2.0 for C major and 6.0 for E major.
+
+    Raises:
+        ValueError: If the scale has an enharmonic root and thus no spelled pitch classes.
+    """
+    members = scale.spelled_set
+    if members is None:
+        raise ValueError(
+            f"{scale} needs a SpecificPitchClass root to provide key context."
+        )
+    return float(np.mean([int(member) for member in members]))
+
+
+class Speller:
+    """Viterbi speller for sequences of enharmonic pitch classes. The cost of a spelling is
+
+        transition_weight * sum |fifths[t] - fifths[t - 1]| + context_weight * sum |fifths[t] - center[t]|
+
+    where center[t] is the scale_center() of the key context of note t, or DEFAULT_CENTER without context.
+    """
+
+    def __init__(
+        self,
+        transition_weight: float = 1.0,
+        context_weight: float = 0.5,
+        window: int = 65536,
+        lookahead: int = 256,
+    ):
+        """
+
+        Args:
+            transition_weight: Weight of the distances between consecutive spellings.
+            context_weight: Weight of the distances from the key context.
+            window: Maximum number of notes decoded at once, which bounds the memory needed.
+            lookahead:
+                Number of following notes taken into account when the spellings at the end of a window are fixed.
+                They are decoded again as part of the next window.
+        """
+        if window <= lookahead:
+            raise ValueError("The window needs to be longer than the lookahead.")
+        self.transition_weight = transition_weight
+        self.context_weight = context_weight
+        self.window = window
+        self.lookahead = lookahead
+
+    def _centers(self, context: Context, length: int) -> np.ndarray:
+        if context is None:
+            return np.full(length, DEFAULT_CENTER)
+        if isinstance(context, Scale):
+            return np.full(length, scale_center(context))
+        if len(context) != length:
+            raise ValueError(
+                f"Got {len(context)} key contexts for {length} notes; pass one per note or a single Scale."
+            )
+        # selectors are compared by identity, so every distinct object is looked at once
+        centers = {}
+        for scale in context:
+            if id(scale) not in centers:
+                centers[id(scale)] = (
+                    DEFAULT_CENTER if scale is None else scale_center(scale)
+                )
+        return np.fromiter(
+            (centers[id(scale)] for scale in context), dtype=float, count=length
+        )
+
+    def _decode(
+        self, semitones: np.ndarray, centers: np.ndarray, previous: Optional[int]
+    ) -> np.ndarray:
+        """Spells one window.
+
+        Args:
+            semitones: Enharmonic pitch classes or MIDI numbers.
+            centers: Key context of every note.
+            previous: Fifths of the note preceding the window, if any.
+        """
+        closest = (7 * semitones.astype(np.int64) + 5) % 12 - 5
+        candidates = closest[:, None] + CANDIDATE_OFFSETS
+        emission = self.context_weight * np.abs(candidates - centers[:, None])
+        first = emission[0]
+        if previous is not None:
+            first = first + self.transition_weight * np.abs(candidates[0] - previous)
+        if len(candidates) == 1:
+            return candidates[0, [np.argmin(first)]]
+        # steps[t, i, j]: cost of spelling note t + 1 as candidate j after candidate i of note t
+        steps = (
+            self.transition_weight
+            * np.abs(candidates[1:, None, :] - candidates[:-1, :, None])
+            + emission[1:, None, :]
+        )
+        forward = np.empty_like(candidates, dtype=float)
+        forward[0] = first
+        forward[1:] = (first[None, :, None] + _min_plus_scan(steps)).min(axis=1)
+        pointers = np.argmin(forward[:-1, :, None] + steps, axis=1).tolist()
+        state = int(np.argmin(forward[-1]))
+        path = [state]
+        for row in reversed(pointers):
+            state = row[state]
+            path.append(state)
+        return candidates[np.arange(len(candidates)), path[::-1]]
+
+    def _spell_windows(
+        self, chunks: Iterable[Tuple[np.ndarray, np.ndarray]]
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Spells a stream of (semitones, centers) chunks, yielding the semitones and the fifths of each window once
+        its spelling is fixed."""
+        semitones = np.zeros(0, dtype=np.int64)
+        centers = np.zeros(0)
+        previous = None
+        for chunk_semitones, chunk_centers in chunks:
+            semitones = np.concatenate([semitones, chunk_semitones])
+            centers = np.concatenate([centers, chunk_centers])
+            while len(semitones) >= self.window:
+                fixed = self.window - self.lookahead
+                window = slice(self.window)
+                fifths = self._decode(semitones[window], centers[window], previous)
+                previous = int(fifths[fixed - 1])
+                yield semitones[:fixed], fifths[:fixed]
+                semitones, centers = semitones[fixed:], centers[fixed:]
+        if len(semitones) > 0:
+            yield semitones, self._decode(semitones, centers, previous)
+
+    @staticmethod
+    def _semitones(values: Spellable) -> Tuple[np.ndarray, bool]:
+        """Returns the values to be spelled and whether they are MIDI numbers of an EnharmonicPitchArray."""
+        if isinstance(values, IntArray):
+            if not isinstance(values, SemitonesArray):
+                raise TypeError(f"{type(values).__name__} is spelled already.")
+            return np.asarray(values.semitones), isinstance(
+                values, EnharmonicPitchArray
+            )
+        values = np.asarray(values)
+        if values.dtype.kind not in "iu":
+            raise TypeError("Only integer values can be spelled.")
+        return values, False
+
+    @staticmethod
+    def _result(semitones: np.ndarray, fifths: np.ndarray, midi: bool) -> IntArray:
+        if midi:
+            return SpecificPitchArray.from_fifths_semitones(fifths, semitones)
+        return SPCArray._from_values(fifths)
+
+    def spell(self, values: Spellable, context: Context = None) -> IntArray:
+        """Spells a sequence of notes.
+
+        Args:
+            values:
+                A one-dimensional EPCArray, EnharmonicPitchArray, or integer array of pitch classes or MIDI numbers.
+            context: A Scale for all notes, or a sequence with one Scale (or None) per note.
+
+        Returns:
+            A SpecificPitchArray for an EnharmonicPitchArray, otherwise an SPCArray.
+        """
+        semitones, midi = self._semitones(values)
+        chunks = [(semitones, self._centers(context, len(semitones)))]
+        windows = list(self._spell_windows(chunks)) or [(semitones, semitones)]
+        return self._result(
+            np.concatenate([w[0] for w in windows]),
+            np.concatenate([w[1] for w in windows]),
+            midi,
+        )
+
+    def spell_stream(
+        self,
+        chunks: Iterable[Union[Spellable, Tuple[Spellable, Context]]],
+        context: Context = None,
+    ) -> Iterator[IntArray]:
+        """Spells a stream of chunks with memory bounded by the window size. The chunks are re-cut into windows,
+        so that the yielded arrays do not correspond to the chunks, but together they spell the stream in order.
+
+        Args:
+            chunks: Arrays accepted by spell(), or pairs of such an array and its context.
+            context: A Scale used for all chunks that come without context.
+
+        Yields:
+            SpecificPitchArrays if the chunks are EnharmonicPitchArrays, otherwise SPCArrays.
+        """
+        kinds = set()
+
+        def prepared():
+            for chunk in chunks:
+                values, chunk_context = (
+                    chunk if isinstance(chunk, tuple) else (chunk, context)
+                )
+                semitones, midi = self._semitones(values)
+                kinds.add(midi)
+                if len(kinds) > 1:
+                    raise TypeError(
+                        "A stream needs to consist of either MIDI numbers or pitch classes."
+                    )
+                yield semitones, self._centers(chunk_context, len(semitones))
+
+        for semitones, fifths in self._spell_windows(prepared()):
+            yield self._result(semitones, fifths, True in kinds)
+
+
+def spell(values: Spellable, context: Context = None) -> IntArray:
+    """Spells a sequence of notes with a Speller using the default weights, see Speller.spell()."""
+    return Speller().spell(values, context)
+
+
+if __name__ == "__main__":
+    from harmony import SPC, MajorScale
+    from pitch_arrays import EPCArray
+
+    ascending = EnharmonicPitchArray(range(60, 73))
+    print(f"Chromatic scale: {spell(ascending)}")
+    e_major = EnharmonicPitchArray([64, 66, 68, 69, 71, 73, 75, 76])
+    print(f"E major scale: {spell(e_major)}")
+    print(
+        f"In Db major: {spell(EPCArray([1, 3, 5, 6, 8, 10, 0]), MajorScale(SPC('Db')))}"
+    )
+    local = [MajorScale(SPC("C"))] * 4 + [MajorScale(SPC("Ab"))] * 4
+    print(f"Modulation: {spell(EPCArray([0, 4, 7, 0, 8, 0, 3, 8]), local)}")
+
+    import time
+
+    rng = np.random.default_rng(0)
+    notes = EnharmonicPitchArray(60 + np.cumsum(rng.integers(-4, 5, 1_000_000)) % 24)
+    start = time.perf_counter()
+    spelled = spell(notes)
+    print(f"Spelled {len(spelled)} notes in {time.perf_counter() - start:.2f} s")
+    chunks = map(EnharmonicPitchArray, np.array_split(notes.values, 10))
+    streamed = [array.values for array in Speller().spell_stream(chunks)]
+    assert (np.concatenate(streamed) == spelled.values).all()
@@ -0,0 +1,84 @@
+"""Checks the chunked reading of annotation tables."""
+import numpy as np
+import pytest
+
+from annotation_tables import (
+    MISSING_FIFTHS,
+    MISSING_SEMITONES,
+    iter_annotation_chunks,
+)
+from pitch import SIC, SPC
+
+ROWS = [
+    ("0", "F#", "M3"),
+    ("1", "Bbb", "P5"),
+    ("2", "", ""),
+    ("3", "C", "m7"),
+    ("4", "F#"),
+]
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = tmp_path / "annotations.tsv"
+    path.write_text(
+        "\n".join("\t".join(row) for row in [("mc", "root", "interval")] + ROWS) + "\n"
+    )
+    return path
+
+
+def read(path, **kwargs):
+    return list(
+        iter_annotation_chunks(
+            path,
+            note_columns=["root"],
+            interval_columns=["interval"],
+            other_columns=["mc"],
+            **kwargs
+        )
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 100])
+def test_chunks(table, chunk_size):
+    chunks = read(table, chunk_size=chunk_size)
+    sizes = [
+        min(chunk_size, len(ROWS) - start) for start in range(0, len(ROWS), chunk_size)
+    ]
+    assert [len(chunk["mc"]) for chunk in chunks] == sizes
+    roots = np.concatenate([chunk["root"] for chunk in chunks])
+    intervals = np.concatenate([chunk["interval"] for chunk in chunks])
+    assert roots.dtype == intervals.dtype == np.int16
+    assert roots.tolist() == [
+        SPC("F#"),
+        SPC("Bbb"),
+        MISSING_FIFTHS,
+        SPC("C"),
+        SPC("F#"),
+    ]
+    # the short last row is padded with empty cells
+    assert intervals.tolist() == [
+        SIC("M3"),
+        SIC("P5"),
+        MISSING_FIFTHS,
+        SIC("m7"),
+        MISSING_FIFTHS,
+    ]
+    assert sum((chunk["mc"] for chunk in chunks), []) == [row[0] for row in ROWS]
+
+
+def test_semitones(table):
+    (chunk,) = read(table, semitones=True)
+    assert chunk["root_semitones"].dtype == np.int8
+    assert chunk["root_semitones"].tolist() == [6, 9, MISSING_SEMITONES, 0, 6]
+
+
+def test_errors(table, tmp_path):
+    with pytest.raises(KeyError, match="bass"):
+        list(iter_annotation_chunks(table, note_columns=["bass"]))
+    with pytest.raises(ValueError, match="chunk_size"):
+        read(table, chunk_size=0)
+    invalid = tmp_path / "invalid.csv"
+    invalid.write_text("root\nC\nD\nH\n")
+    with pytest.raises(ValueError, match="from data row 3"):
+        list(iter_annotation_chunks(invalid, note_columns=["root"], chunk_size=2))
@@ -0,0 +1,90 @@
+"""Checks the round trip of columns and selectors through archives."""
+import numpy as np
+import pytest
+
+import archive
+from archive import ALIGNMENT, MISSING, Archive, selector_columns, write_archive
+from harmony import MajorChord, MajorScale
+from pitch import EIC, EPC, SPC
+from pitch_arrays import EICArray, EPCArray, SICArray, SPCArray
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "corpus.pcarchive"
+
+
+def test_selector_round_trip(path):
+    selectors = [MajorChord(SPC("F#")), None, MajorScale(SPC("Bb")), MajorChord(None)]
+    write_archive(path, selector_columns(selectors), kinds={"root": "SPC"})
+    archive = Archive(path)
+    assert list(archive.selectors()) == selectors
+
+
+def test_enharmonic_roots_are_rejected():
+    with pytest.raises(TypeError):
+        selector_columns([MajorChord(SPC("C")), MajorChord(EPC(6))])
+
+
+def test_columns_with_missing_values(path):
+    columns = {
+        "root": SPCArray(["C", "F#", "Bbb", "C"]),
+        "interval": SICArray(["M3", "P5", "m7", "a4"]),
+        "key": EPCArray([0, 11, 6, 3]),
+        "step": EICArray([1, 2, 3, 4]),
+        "bass": np.array([-1, MISSING, 30, MISSING]),
+        "type": [MajorChord, None, MajorScale, MajorChord],
+    }
+    write_archive(path, columns, kinds={"bass": "SPC"})
+    stored = Archive(path)
+    assert len(stored) == 4 and stored.types == [MajorChord, MajorScale]
+    assert list(stored["root"]) == list(columns["root"])
+    assert list(stored["interval"]) == list(columns["interval"])
+    assert list(stored["key"]) == [EPC(0), EPC(11), EPC(6), EPC(3)]
+    assert list(stored["step"]) == [EIC(1), EIC(2), EIC(3), EIC(4)]
+    assert list(stored["bass"]) == [SPC("F"), None, SPC._from_int(30), None]
+    assert stored["bass"].missing.tolist() == [False, True, False, True]
+    assert list(stored["type"]) == columns["type"]
+    assert stored["root"].to_array().values.tolist() == columns["root"].values.tolist()
+    with pytest.raises(ValueError, match="empty cells"):
+        stored["bass"].to_array()
+    with pytest.raises(TypeError):
+        stored["type"].to_array()
+
+
+def test_views_and_layout(path):
+    write_archive(path, {"root": SPCArray(range(-50, 50)), "type": [MajorChord] * 100})
+    stored = Archive(path)
+    view = stored["root"][10:20:3]
+    assert (
+        len(view) == 4
+        and view[1] == SPC._from_int(-37)
+        and list(view)[-1] == SPC._from_int(-31)
+    )
+    assert stored["root"][np.int64(-1)] == SPC._from_int(49)
+    assert all(
+        column.values.offset % ALIGNMENT == 0 for column in stored.columns.values()
+    )
+
+
+def test_empty_archive(path):
+    write_archive(path, {"root": SPCArray([]), "type": []})
+    stored = Archive(path)
+    assert len(stored) == 0 and list(stored.selectors()) == []
+
+
+def test_invalid_input(path, monkeypatch):
+    with pytest.raises(ValueError, match="same length"):
+        write_archive(path, {"root": SPCArray(["C"]), "type": []})
+    with pytest.raises(ValueError, match="kinds"):
+        write_archive(path, {"root": np.array([0])})
+    path.write_bytes(b"PCARCHIV")
+    with pytest.raises(ValueError, match="too short"):
+        Archive(path)
+    path.write_bytes(b"NOTANARCHIVE" * 2)
+    with pytest.raises(ValueError, match="not an archive"):
+        Archive(path)
+    write_archive(path, {"type": [MajorChord]})
+    monkeypatch.setattr(archive, "SELECTOR_TYPES", [])
+    with pytest.raises(KeyError, match="harmony.MajorChord"):
+        Archive(path)
@@ -0,0 +1,136 @@
+"""Checks that the raw backend of harmony (see harmony.set_backend()) yields the same results as the pitch backend
+for every registered PitchClassSelector type, with spelled, enharmonic, NumPy-integer, and without roots."""
+import numpy as np
+import pytest
+
+import harmony
+from abstract import SemitonesScalar
+from harmony import (
+    SELECTOR_TYPES,
+    Chord,
+    MajorChord,
+    MajorScale,
+    RawSemitones,
+    set_backend,
+    to_pitch,
+    to_raw,
+)
+from pitch import EIC, EPC, SIC, SPC
+
+
+SELECTORS = list(SELECTOR_TYPES) + ["AugmentedTriad", "DominantSeventhChord"]
+"""Registered types, and the names of types defined by the test_types fixture."""
+SPELLED_ROOTS = [SPC._from_int(fifths) for fifths in range(-7, 8)]
+ENHARMONIC_ROOTS = [EPC(semitones) for semitones in range(12)]
+
+
+@pytest.fixture
+def test_types(isolated_types):
+    class AugmentedTriad(Chord):
+        """Type with enharmonic intervals, whose concretization consists of semitones for all roots."""
+
+        intervals = (EIC(0), EIC(4), EIC(8))
+
+    class DominantSeventhChord(Chord):
+        intervals = (SIC(0), SIC(4), SIC(1), SIC(-2))
+
+    return {
+        selector.__name__: selector
+        for selector in (AugmentedTriad, DominantSeventhChord)
+    }
+
+
+@pytest.fixture
+def selector(request):
+    if isinstance(request.param, str):
+        return request.getfixturevalue("test_types")[request.param]
+    return request.param
+
+
+@pytest.fixture
+def raw_backend():
+    previous = set_backend("raw")
+    yield harmony.get_backend()
+    set_backend(previous.name)
+
+
+def assert_same(typed: harmony.PitchClassSelector, raw: harmony.PitchClassSelector):
+    typed_members, raw_members = typed._concretized(), raw._concretized()
+    assert [int(member) for member in typed_members] == list(raw_members)
+    # semitones and fifths need to stay distinguishable
+    assert [isinstance(member, SemitonesScalar) for member in typed_members] == [
+        isinstance(member, (RawSemitones, SemitonesScalar)) for member in raw_members
+    ]
+    assert typed.enharmonic_set == raw.enharmonic_set
+    assert typed.spelled_set == raw.spelled_set
+    assert to_pitch(raw)._concretized() == typed_members
+
+
+@pytest.mark.parametrize(
+    "selector", SELECTORS, ids=lambda s: getattr(s, "__name__", s), indirect=True
+)
+@pytest.mark.parametrize("root", [None] + SPELLED_ROOTS + ENHARMONIC_ROOTS, ids=repr)
+def test_converted_selectors(selector, root):
+    typed = selector(root)
+    raw = to_raw(typed)
+    assert_same(typed, raw)
+    assert to_pitch(raw) == typed
+
+
+@pytest.mark.parametrize(
+    "selector", SELECTORS, ids=lambda s: getattr(s, "__name__", s), indirect=True
+)
+@pytest.mark.parametrize("value", range(-7, 12))
+def test_numpy_roots(selector, value):
+    typed = selector(SPC._from_int(value))
+    assert_same(typed, selector(np.int64(value)))
+    assert_same(typed, selector(np.int16(value)))
+
+
+@pytest.mark.parametrize(
+    "selector", SELECTORS, ids=lambda s: getattr(s, "__name__", s), indirect=True
+)
+@pytest.mark.parametrize("name", ["C", "F#", "Bb", "Cb", "E#"])
+def test_aliases(raw_backend, selector, name):
+    spelled, enharmonic = selector(SPC(name)), selector(EPC(SPC(name)))
+    assert_same(spelled, selector(harmony.SPC(name)))
+    assert_same(enharmonic, selector(harmony.EPC(SPC(name))))
+
+
+def test_enharmonic_root_stays_semitones(raw_backend):
+    scale = MajorScale(harmony.EPC(1))
+    assert scale.enharmonic_set == MajorScale(EPC(1)).enharmonic_set
+    assert scale.spelled_set is None
+    assert scale != MajorScale(harmony.SPC("G"))
+
+
+def test_constructors(raw_backend):
+    assert raw_backend.SPC("F#") == 6
+    assert raw_backend.SIC("M3") == 4
+    assert raw_backend.EPC(SPC("F#")) == RawSemitones(6)
+    assert type(raw_backend.EPC(13)) is RawSemitones
+    assert type(raw_backend.SPC("C")) is int
+
+
+def test_set_backend():
+    assert harmony.SPC is SPC
+    previous = set_backend("raw")
+    try:
+        assert previous.name == "pitch"
+        assert harmony.get_backend().name == "raw"
+        assert not isinstance(harmony.SPC("C"), SPC)
+    finally:
+        set_backend(previous.name)
+    assert harmony.SPC is SPC
+    with pytest.raises(ValueError):
+        set_backend("music21")
+
+
+def test_conversion_of_values():
+    assert to_raw((SPC("F#"), EPC(6), SIC("M3"))) == (6, 6, 4)
+    assert isinstance(to_raw(EPC(6)), RawSemitones)
+    assert to_pitch([6, RawSemitones(6)]) == [SPC("F#"), EPC(6)]
+    assert to_pitch(4, SIC) == SIC("M3")
+    assert to_raw(MajorChord(SPC("D"))).root == 2
+    with pytest.raises(TypeError):
+        to_raw("C")
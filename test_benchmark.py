@@ -0,0 +1,36 @@
+"""Checks that every benchmark case runs and that regressions against a baseline are reported."""
+import json
+
+import pytest
+
+from benchmark import NAMESPACE, all_cases, compare, main
+
+
+@pytest.mark.parametrize("case", all_cases(), ids=lambda case: case.name)
+def test_cases_run(case):
+    code = compile(
+        f"for {case.targets} in inputs[:3]: {case.expression}", case.name, "exec"
+    )
+    exec(code, {**NAMESPACE, "inputs": case.inputs})
+
+
+def test_case_names_are_unique():
+    names = [case.name for case in all_cases()]
+    assert len(names) == len(set(names))
+
+
+def test_compare(capsys):
+    baseline = {"a": 100.0, "b": 100.0}
+    assert compare({"a": 119.0, "b": 121.0, "c": 5.0}, baseline, 0.2) == ["b"]
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_baseline_round_trip(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    arguments = ["--n", "10", "--repeat", "1", "--select", "SPC(int)"]
+    assert main(arguments + ["--output", str(output)]) == 0
+    results = json.loads(output.read_text())
+    assert results["n"] == 10 and list(results["results"]) == ["SPC(int)"]
+    results["results"]["SPC(int)"] /= 1000
+    output.write_text(json.dumps(results))
+    assert main(arguments + ["--baseline", str(output)]) == 1
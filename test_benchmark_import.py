@@ -0,0 +1,42 @@
+"""Checks what the core modules do at import time and the budget check of benchmark_import."""
+import subprocess
+import sys
+
+from benchmark_import import DIRECTORY, MODULES, check, measure_once
+
+
+def run(code: str) -> str:
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=DIRECTORY,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return process.stdout.strip()
+
+
+def test_core_modules_do_not_import_numpy():
+    assert run(f"import sys, {MODULES[-1]}; print('numpy' in sys.modules)") == "False"
+
+
+def test_regexes_are_compiled_on_first_use():
+    code = (
+        "import pitch_helpers; compiled = 'NOTE_NAME_REGEX' in vars(pitch_helpers); "
+        "pitch_helpers.note_name2fifths('F' + '#' * 9); "
+        "print(compiled, 'NOTE_NAME_REGEX' in vars(pitch_helpers), pitch_helpers.INTERVAL_NAME_REGEX.pattern != '')"
+    )
+    assert run(code) == "False True True"
+
+
+def test_measure_once():
+    times = measure_once(MODULES[-1])
+    assert set(times) == {*MODULES, "total"}
+    assert times["total"] >= sum(times[module] for module in MODULES)
+
+
+def test_check(capsys):
+    assert check(
+        {"abstract": 10.0, "pitch": 30.0, "total": 50.0}, {"abstract": 20, "pitch": 20}
+    ) == ["pitch"]
+    assert "OVER BUDGET" in capsys.readouterr().out
@@ -0,0 +1,49 @@
+"""Checks that label_degrees() agrees with scale_degree() and handles melodies without known scales."""
+import numpy as np
+import pytest
+
+from degrees import NO_DEGREE, label_degrees, scale_degree
+from harmony import MajorPentatonicScale, MajorScale, Scale
+from pitch import EIC, SPC
+
+
+@pytest.fixture
+def whole_tone_scale(isolated_types):
+    class WholeToneScale(Scale):
+        intervals = tuple(EIC(semitones) for semitones in range(0, 12, 2))
+
+    return WholeToneScale
+
+
+@pytest.mark.parametrize(
+    "melody, scales",
+    [([], []), ([], MajorScale(SPC("C"))), ([0, 1], [None, None]), ([3], [None])],
+)
+def test_no_known_scale(melody, scales):
+    degrees, alterations = label_degrees(melody, scales)
+    assert degrees.dtype == np.int8 and alterations.dtype == np.int16
+    assert (degrees == NO_DEGREE).all() and (alterations == 0).all()
+    assert len(degrees) == len(alterations) == len(melody)
+
+
+@pytest.mark.parametrize("mixed", [True, False], ids=["mixed", "enharmonic"])
+def test_bulk_matches_single(whole_tone_scale, mixed):
+    scales = [whole_tone_scale(SPC("C")), None]
+    if mixed:
+        scales[:0] = [
+            MajorScale(SPC("C")),
+            MajorScale(SPC("Bb")),
+            MajorPentatonicScale(SPC("D")),
+        ]
+    melody = list(range(-10, 11))
+    per_note = [scales[i % len(scales)] for i in range(len(melody))]
+    degrees, alterations = label_degrees(melody, per_note)
+    for fifths, scale, degree, alteration in zip(
+        melody, per_note, degrees.tolist(), alterations.tolist()
+    ):
+        expected = (
+            (NO_DEGREE, 0)
+            if scale is None
+            else scale_degree(SPC._from_int(fifths), scale)
+        )
+        assert (degree, alteration) == expected
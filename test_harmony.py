@@ -0,0 +1,75 @@
+"""Checks equality, hashing, freezing and pickling of PitchClassSelectors."""
+import pickle
+from collections import OrderedDict
+
+import pytest
+
+import harmony
+from harmony import MajorChord, MajorScale
+from parallel import decode, encode
+from pitch import EPC, SIC, SPC
+
+
+def test_hashing_has_no_side_effects():
+    chord = MajorChord(SPC("D"))
+    counts = {chord: 1}
+    assert not chord._frozen and MajorChord(SPC("D")) in counts
+    # the hash follows the root; freeze() prevents such changes of dict keys
+    chord.root = SPC("E")
+    assert hash(chord) == hash(MajorChord(SPC("E")))
+
+
+def test_equality():
+    assert MajorChord(SPC("D")) == MajorChord(SPC("D"))
+    assert MajorChord(SPC("D")) != MajorScale(SPC("D"))
+    assert MajorChord(EPC(2)) != MajorChord(SPC("D"))
+    assert len({MajorChord(SPC("D")), MajorChord(SPC("D")), MajorChord(None)}) == 2
+
+
+def test_frozen_root_is_read_only():
+    chord = MajorChord(SPC("D")).freeze()
+    with pytest.raises(AttributeError):
+        chord.root = SPC("E")
+
+
+@pytest.mark.parametrize("root", [SPC("F#"), EPC(3), None, SIC("M3")], ids=repr)
+@pytest.mark.parametrize("frozen", [False, True])
+def test_frozen_state_survives_transfers(root, frozen):
+    chord = MajorChord(root)
+    if frozen:
+        chord.freeze()
+    copy = pickle.loads(pickle.dumps(chord))
+    assert copy == chord and copy._frozen == frozen
+    if not isinstance(root, SIC):
+        (decoded,) = decode(*encode([chord]))
+        assert decoded == chord and decoded._frozen == frozen
+
+
+def test_concretization_is_lazy_and_shared():
+    chord = MajorChord(SPC("D"))
+    assert chord._members is None
+    assert chord.chord_tones == (SPC("D"), SPC("F#"), SPC("A"))
+    assert MajorChord(SPC("D")).chord_tones is chord.chord_tones
+    chord.root = EPC(2)
+    assert chord.chord_tones == (EPC(2), EPC(6), EPC(9))
+    assert MajorScale(None).scale_degrees[:3] == (SIC(0), SIC(2), SIC(4))
+
+
+def test_concretization_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(harmony, "CONCRETIZATION_CACHE_SIZE", 2)
+    monkeypatch.setattr(harmony, "_CONCRETIZATIONS", OrderedDict())
+    c, d, _ = (MajorChord(SPC(name)).chord_tones for name in "CDE")
+    assert list(harmony._CONCRETIZATIONS) == [
+        (MajorChord, SPC, 2),
+        (MajorChord, SPC, 4),
+    ]
+    assert MajorChord(SPC("D")).chord_tones is d
+    MajorChord(SPC("F")).chord_tones
+    assert list(harmony._CONCRETIZATIONS) == [
+        (MajorChord, SPC, 2),
+        (MajorChord, SPC, -1),
+    ]
+    assert (
+        MajorChord(SPC("C")).chord_tones == c
+        and MajorChord(SPC("C")).chord_tones is not c
+    )
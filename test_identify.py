@@ -0,0 +1,89 @@
+"""Checks the identification index against the concretizations of the indexed types."""
+import numpy as np
+import pytest
+
+from harmony import Chord, MajorChord, MajorPentatonicScale, MajorScale
+from identify import IdentificationIndex, identify
+from pitch import EIC, EPC, SIC, SPC
+from pitch_sets import EnharmonicPitchClassSet
+
+TYPES = [MajorChord, MajorScale, MajorPentatonicScale]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return IdentificationIndex(TYPES)
+
+
+@pytest.mark.parametrize("superset", [False, True])
+def test_spelled_matches(index, superset):
+    for selector in TYPES:
+        for root in range(-10, 11):
+            members = selector(SPC._from_int(root)).spelled_set
+            query = members - type(members)(list(members)[:1]) if superset else members
+            matches = index.match(query, superset=superset)
+            assert (selector, SPC._from_int(root)) in matches
+            for match, match_root in matches:
+                found = match(match_root).spelled_set
+                assert found >= query if superset else found == query
+
+
+@pytest.mark.parametrize("superset", [False, True])
+def test_enharmonic_matches(index, superset):
+    for selector in TYPES:
+        for root in range(12):
+            query = selector(EPC(root)).enharmonic_set
+            if superset:
+                query = query - EnharmonicPitchClassSet([root])
+            matches = index.match(query, superset=superset)
+            assert (selector, EPC(root)) in matches
+            for match, match_root in matches:
+                found = match(match_root).enharmonic_set
+                assert found >= query if superset else found == query
+
+
+def test_iterables_and_spelling(index):
+    c_major = [SPC("C"), SPC("E"), SPC("G")]
+    assert index.match(c_major) == [(MajorChord, SPC("C"))]
+    assert index.match([SPC("C"), SPC("Fb"), SPC("G")]) == []
+    assert index.match([EPC(0), EPC(4), EPC(7)]) == [(MajorChord, EPC(0))]
+    assert index.match([]) == []
+
+
+def test_batches(index):
+    queries = [[0, 4, 7], [2, 6, 9], [0, 1], [0, 4, 7], []]
+    masks = np.array([EnharmonicPitchClassSet(query).mask for query in queries])
+    for superset in (False, True):
+        expected = [
+            index.match(EnharmonicPitchClassSet(query), superset) for query in queries
+        ]
+        assert index.match_masks(masks, superset) == expected
+    with pytest.raises(ValueError):
+        index.match_masks(np.array([0x1000]))
+    rows = np.array([[0, 4, 1], [6, 10, 7], [-1, 0, 0]])
+    valid = np.array([[True] * 3, [True] * 3, [True, True, False]])
+    for superset in (False, True):
+        expected = [
+            index.match([SPC._from_int(int(f)) for f in row[row_valid]], superset)
+            for row, row_valid in zip(rows, valid)
+        ]
+        assert index.match_fifths(rows, valid, superset) == expected
+    # queries wider than any template match nothing, even outside the window of SpecificPitchClassSet
+    assert index.match_fifths([[0, 70]], superset=True) == [[]]
+
+
+def test_new_types_are_identified(isolated_types):
+    assert identify([SPC("C"), SPC("E"), SPC("G"), SPC("Bb")]) == []
+
+    class DominantSeventhChord(Chord):
+        intervals = (SIC(0), SIC(4), SIC(1), SIC(-2))
+
+    class AugmentedTriad(Chord):
+        intervals = (EIC(0), EIC(4), EIC(8))
+
+    assert identify([SPC("C"), SPC("E"), SPC("G"), SPC("Bb")]) == [
+        (DominantSeventhChord, SPC("C"))
+    ]
+    assert identify([EPC(0), EPC(4), EPC(8)]) == [
+        (AugmentedTriad, EPC(root)) for root in (0, 4, 8)
+    ]
@@ -0,0 +1,43 @@
+"""Checks the sliding-window key estimation, spelled and enharmonic."""
+import pytest
+
+from harmony import MajorPentatonicScale, MajorScale, Scale
+from key_estimation import KeyEstimator, estimate_keys
+from pitch import EIC, EPC, SPC
+
+
+@pytest.fixture
+def whole_tone_scale(isolated_types):
+    class WholeToneScale(Scale):
+        intervals = tuple(EIC(semitones) for semitones in range(0, 12, 2))
+
+    return WholeToneScale
+
+
+def test_spelled_estimates():
+    melody = [SPC(name) for name in "F G A Bb C D E F".split()]
+    *_, last = estimate_keys(melody, window=8)
+    assert last == MajorScale(SPC("F"))
+    pentatonic = [SPC(name) for name in "C D E G A".split()]
+    *_, last = estimate_keys(pentatonic)
+    assert last == MajorPentatonicScale(SPC("C"))
+
+
+def test_window_evicts_old_notes():
+    estimator = KeyEstimator(window=7)
+    for name in "C D E F G A B".split() + "Bb F G A C D E".split():
+        estimate = estimator.push(SPC(name))
+    assert estimate == MajorScale(SPC("F"))
+    assert estimator.histogram.sum() == 7
+
+
+def test_enharmonic_types(whole_tone_scale):
+    melody = [EPC(semitones) for semitones in (0, 2, 4, 6, 8, 10, 8, 6)]
+    *_, last = estimate_keys(
+        melody, types=[MajorScale, whole_tone_scale], spelled=False
+    )
+    assert last == whole_tone_scale(EPC(0))
+    assert whole_tone_scale not in KeyEstimator().types
+    with pytest.raises(ValueError, match="spelled=False"):
+        KeyEstimator(types=[MajorScale, whole_tone_scale])
+    assert whole_tone_scale in KeyEstimator(spelled=False).types
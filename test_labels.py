@@ -0,0 +1,78 @@
+"""Checks the label parser, in particular parse_labels() with missing values and roots that do not fit into int16."""
+import numpy as np
+import pytest
+
+from annotation_tables import MISSING_FIFTHS
+from harmony import Chord, MajorChord
+from labels import MISSING_TYPE, format_label, label_types, parse_label, parse_labels
+from pitch import EPC, SPC
+
+
+def test_missing_values():
+    labels = np.array(["C", np.nan, None, "", float("nan"), "Bb:pent"], dtype=object)
+    type_ids, roots = parse_labels(labels)
+    missing = [False, True, True, True, True, False]
+    assert (type_ids[missing] == MISSING_TYPE).all()
+    assert (roots[missing] == MISSING_FIFTHS).all()
+    assert type_ids[5] == parse_label("Bb:pent").type_id
+    assert roots.tolist()[::5] == [0, -2]
+
+
+def test_missing_values_stay_out_of_the_cache():
+    cache = {}
+    parse_labels(["C", None, float("nan")], cache)
+    assert set(cache) == {"", "C"}
+
+
+def test_roots_outside_int16():
+    largest = "C" + "#" * ((np.iinfo(np.int16).max) // 7)
+    assert parse_labels([largest])[1][0] == np.iinfo(np.int16).max // 7 * 7
+    with pytest.raises(ValueError, match="2 invalid labels") as error:
+        parse_labels(["C", largest + "#" * 7, "H"])
+    assert "(position 1)" in str(error.value)
+
+
+def test_subclasses_do_not_inherit_labels(isolated_types):
+    class DoubledMajorChord(MajorChord):
+        pass
+
+    assert parse_label("Bb:maj").root == SPC("Bb")
+    assert type(parse_label("Bb:maj")) is MajorChord
+    with pytest.raises(ValueError):
+        format_label(DoubledMajorChord(SPC("C")))
+
+    class LabeledMajorChord(MajorChord):
+        label = "doubled"
+
+    assert type(parse_label("C:doubled")) is LabeledMajorChord
+    assert format_label(LabeledMajorChord(SPC("C"))) == "C:doubled"
+
+
+@pytest.mark.parametrize("label", ["C:maj", "F#:major", "Bbb:pent", "E##:maj"])
+def test_round_trips(label):
+    selector = parse_label(label)
+    assert format_label(selector) == label and selector._frozen
+    assert parse_label(label) is selector
+    type_ids, roots = parse_labels(np.array([[label, label]]))
+    assert type_ids.shape == (1, 2) and type_ids.dtype == roots.dtype == np.int16
+    assert type_ids[0, 0] == selector.type_id and roots[0, 1] == int(selector.root)
+
+
+def test_defaults_and_errors():
+    assert parse_label("G") == MajorChord(SPC("G"))
+    for label in ["H:maj", "C:", "C:nine", "C maj"]:
+        with pytest.raises(ValueError):
+            parse_label(label)
+    with pytest.raises(TypeError):
+        parse_label(3)
+    with pytest.raises(ValueError):
+        format_label(MajorChord(EPC(0)))
+
+
+def test_duplicate_labels(isolated_types):
+    class OtherMajorChord(Chord):
+        label = "maj"
+        intervals = MajorChord.intervals
+
+    with pytest.raises(ValueError, match="same label"):
+        label_types()
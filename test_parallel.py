@@ -0,0 +1,63 @@
+"""Checks the compact pickles of the pitch types and the integer encoding used by map_corpus()."""
+import pickle
+
+import numpy as np
+import pytest
+
+from harmony import MajorChord, MajorScale
+from parallel import _chord_tone_names, decode, encode, map_corpus
+from pitch import EI, EIC, EP, EPC, SI, SIC, SP, SPC
+
+SCALARS = [EPC(3), EIC(11), SPC("F#"), SIC(-30), EP(61), EI(-13), SP("Cb4"), SI("M3:1")]
+
+
+@pytest.mark.parametrize("scalar", SCALARS, ids=repr)
+def test_pickles(scalar):
+    copy = pickle.loads(pickle.dumps(scalar))
+    assert type(copy) is type(scalar) and copy == scalar
+    # pickled by type code and value instead of by class name
+    assert b"_unpickle" in pickle.dumps(scalar, protocol=0)
+    assert type(scalar).__name__.encode() not in pickle.dumps(scalar, protocol=0)
+
+
+def test_pickles_are_interned():
+    assert pickle.loads(pickle.dumps(SPC("D"))) is SPC("D")
+
+
+def test_round_trip():
+    items = [
+        SCALARS,
+        tuple(SCALARS[:2]),
+        MajorChord(SPC("Bb")),
+        MajorScale(EPC(4)),
+        MajorChord(None),
+        [],
+        SCALARS[6],
+    ]
+    atoms, offsets, is_sequence = encode(items)
+    assert atoms.shape == (len(SCALARS) + 2 + 3 + 1, 3)
+    assert offsets.tolist()[-1] == len(atoms)
+    assert is_sequence.tolist() == [True, True, False, False, False, True, False]
+    expected = [tuple(item) if isinstance(item, list) else item for item in items]
+    assert decode(atoms, offsets, is_sequence) == expected
+    assert encode([])[0].shape == (0, 3)
+
+
+def test_small_integer_types():
+    atoms, offsets, _ = encode([SPC(0), SPC(10), MajorChord(SPC("C"))])
+    assert atoms.dtype == np.int8 and offsets.dtype == np.uint8
+
+
+def test_unencodable_items():
+    with pytest.raises(TypeError, match="Item 1"):
+        encode([SPC(0), [SPC(1), "C"]])
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, None), (2, None), (2, 3)])
+def test_map_corpus(workers, chunk_size):
+    chords = [MajorChord(SPC._from_int(fifths % 15 - 7)) for fifths in range(20)]
+    chords[1] = MajorChord(EPC(1))
+    results = map_corpus(
+        _chord_tone_names, chords, workers=workers, chunk_size=chunk_size
+    )
+    assert results == [_chord_tone_names(chord) for chord in chords]
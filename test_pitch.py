@@ -0,0 +1,75 @@
+"""Checks the construction of the pitch types and the operators between them."""
+from collections import Counter
+
+import pytest
+
+import abstract
+from abstract import INTERN_RANGE, register_operation, result_type
+from pitch import EIC, EPC, SIC, SPC
+
+
+@pytest.mark.parametrize("pitch_type", [SPC, SIC, EPC, EIC])
+def test_interning(pitch_type):
+    assert pitch_type(3) is pitch_type(3) is pitch_type._from_int(3)
+    assert not hasattr(pitch_type(3), "__dict__")
+
+
+def test_large_values_are_not_interned():
+    large = INTERN_RANGE.stop + 20
+    assert SPC(large) == SPC(large)
+    assert SPC(large) is not SPC(large)
+
+
+def test_results_are_interned():
+    assert SPC("D") + SIC("M2") is SPC("E")
+    assert SPC("C") - SIC(1) is SPC("F")
+    assert EPC(11) + EIC(2) is EPC(1)
+    assert SIC(1) * 3 is SIC(3)
+
+
+def test_tables_per_type():
+    assert SPC(2) is not SIC(2) and type(SPC(2)) is SPC and type(SIC(2)) is SIC
+    assert EPC._from_int(14) is EPC(2)
+
+
+def test_dispatch_follows_mro():
+    assert type(SPC("C") + EIC(4)) is EPC
+    assert type(EIC(4) + SPC("C")) is EPC
+    assert type(SIC(1) + 3) is SIC and type(3 - SIC(1)) is SIC
+    assert divmod(SIC(7), 5) == (1, 2)
+    with pytest.raises(NotImplementedError):
+        SPC("C") + SPC("D")
+
+
+def test_register_operation(monkeypatch):
+    monkeypatch.setattr(
+        abstract, "OPERATION_REGISTRY", dict(abstract.OPERATION_REGISTRY)
+    )
+    monkeypatch.setattr(abstract, "_DISPATCH", {})
+    with pytest.raises(NotImplementedError, match="Operation not defined"):
+        EPC(5) - EPC(2)
+    register_operation("-", EPC, EPC, EIC)
+    assert EPC(5) - EPC(2) is EIC(3)
+    assert result_type(EPC, EPC, "-") is EIC
+    with pytest.raises(ValueError, match="Unknown operator"):
+        register_operation("@", EPC, EPC, EIC)
+
+
+def test_hashing():
+    tones = [
+        SPC("C"),
+        SPC("E"),
+        SPC("G"),
+        SPC("C"),
+        SPC._from_int(100),
+        SPC._from_int(100),
+    ]
+    assert Counter(tones) == {
+        SPC("C"): 2,
+        SPC("E"): 1,
+        SPC("G"): 1,
+        SPC._from_int(100): 2,
+    }
+    assert hash(SPC("E")) == hash(4) and {4: "E"}[SPC("E")] == "E"
+    with pytest.raises(NotImplementedError):
+        {SPC(0), EPC(0)}
@@ -0,0 +1,75 @@
+"""Checks that array operations and conversions raise or widen instead of wrapping around the storage dtype."""
+import numpy as np
+import pytest
+
+from pitch import EIC, EPC, SIC, SP, SPC
+from pitch_arrays import (
+    EnharmonicPitchArray,
+    EPCArray,
+    SICArray,
+    SpecificPitchArray,
+    SPCArray,
+)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda: SPCArray([30000]) + SICArray([10000]),
+        lambda: SPCArray([30000]) + 10000,
+        lambda: 10000 + SPCArray([30000]),
+        lambda: SPCArray([-30000]) * 2,
+        lambda: -SICArray([-32768]),
+        lambda: EnharmonicPitchArray([32767]) + 1,
+        lambda: SPCArray(np.array([40000])),
+    ],
+)
+def test_overflow(operation):
+    with pytest.raises(OverflowError):
+        operation()
+
+
+def test_results_within_range():
+    assert (SPCArray([32766]) + 1).values.tolist() == [32767]
+    assert (SICArray([-32767]) - SICArray([1])).values.tolist() == [-32768]
+    assert (SPCArray([]) + 1).values.tolist() == []
+
+
+@pytest.mark.parametrize("fifths", [4681, 4682, 5000, -5000, 32767, -32767])
+def test_semitones_of_large_fifths(fifths):
+    assert SPCArray([fifths]).semitones.tolist() == [SPC._from_int(fifths).semitones]
+    assert list(SPCArray([fifths]) + EIC(0)) == [SPC._from_int(fifths) + EIC(0)]
+
+
+def test_semitones_of_high_pitches():
+    pitches = SpecificPitchArray.from_fifths_semitones([0, 1], [36000, -36000])
+    assert pitches.semitones.tolist() == [36000, -36000]
+    assert [pitch.semitones for pitch in pitches] == [36000, -36000]
+
+
+@pytest.mark.parametrize(
+    "array_type, scalars",
+    [
+        (EPCArray, [SPC("G"), SPC("F#"), EPC(3)]),
+        (SPCArray, [EPC(1), EPC(6), SPC("E#")]),
+        (SICArray, [SIC("M3"), EIC(6)]),
+        (EnharmonicPitchArray, [SP("B#3"), SP("Cb4")]),
+        (SpecificPitchArray, [SP("B#3"), "Cb4"]),
+    ],
+)
+def test_typed_elements(array_type, scalars):
+    expected = [array_type.scalar_type(scalar) for scalar in scalars]
+    assert list(array_type(scalars)) == expected
+    assert list(array_type(np.array(scalars, dtype=object))) == expected
+    assert array_type([scalars, scalars]).shape == (2, len(scalars))
+
+
+@pytest.mark.parametrize("array_type", [SPCArray, SICArray])
+@pytest.mark.parametrize(
+    "semitones", [EPCArray(range(12)), EnharmonicPitchArray(range(55, 80))], ids=repr
+)
+def test_context_free_spelling(array_type, semitones):
+    expected = [array_type.scalar_type(value) for value in semitones]
+    assert list(array_type(semitones)) == expected
+    assert array_type(semitones).fifths.tolist() == semitones.fifths.tolist()
+    assert all(-5 <= fifths <= 6 for fifths in semitones.fifths.tolist())
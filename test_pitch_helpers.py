@@ -0,0 +1,49 @@
+"""Checks the bulk name codecs of pitch_helpers against their scalar counterparts."""
+import numpy as np
+import pytest
+
+from pitch_helpers import (
+    TABLE_RANGE,
+    fifths2interval_names,
+    fifths2note_names,
+    interval_name2fifths,
+    interval_names2fifths,
+    note_name2fifths,
+    note_names2fifths,
+    pitch_name2fifths_semitones,
+    pitch_names2fifths_semitones,
+)
+
+TOO_SHARP = "C" + "#" * 5000
+
+
+@pytest.mark.parametrize("fifths", [-30, -21, 0, 21, 30, 100])
+def test_round_trips(fifths):
+    names = fifths2note_names(np.array([[fifths]]))
+    assert names.shape == (1, 1)
+    assert note_names2fifths(names).tolist() == [[fifths]]
+    assert note_name2fifths(names[0, 0]) == fifths
+    intervals = fifths2interval_names([fifths])
+    assert interval_names2fifths(intervals).tolist() == [fifths]
+    assert interval_name2fifths(intervals[0]) == fifths
+
+
+def test_tables_cover_range():
+    names = fifths2note_names(list(TABLE_RANGE))
+    assert len(set(names.tolist())) == len(TABLE_RANGE)
+
+
+def test_invalid_names_are_collected():
+    cache = {}
+    with pytest.raises(ValueError, match="2 invalid note names") as error:
+        note_names2fifths(["C", TOO_SHARP, "H", "H"], cache)
+    assert "(position 1)" in str(error.value) and "(position 2)" in str(error.value)
+    assert cache == {"C": 0}
+
+
+def test_overflowing_pitch_names():
+    assert pitch_name2fifths_semitones(TOO_SHARP + "4")[0] == 35000
+    with pytest.raises(ValueError, match="2 invalid pitch names"):
+        pitch_names2fifths_semitones(["C4", TOO_SHARP + "4", "C9999"])
+    with pytest.raises(ValueError, match="1 invalid interval names"):
+        interval_names2fifths(["M3", "a" * 5000 + "4"])
@@ -0,0 +1,96 @@
+"""Checks the pandas extension dtypes, in particular the handling of empty cells."""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pitch_pandas  # noqa: F401 registers the dtypes
+from pitch import EIC, EPC, SIC, SPC
+
+
+def values(column) -> list:
+    """The elements with None for empty cells, which unlike pd.NA can be compared."""
+    return [None if value is pd.NA else value for value in column]
+
+
+@pytest.fixture
+def table():
+    return pd.DataFrame(
+        {
+            "root": pd.Series(["C", "F#", None, "Bb", "C"]).astype("spc"),
+            "interval": pd.array(["M3", "P5", "P1", None, "M3"], dtype="sic"),
+        }
+    )
+
+
+def test_construction(table):
+    assert table.root.dtype.name == "spc" and table.root.dtype.type is SPC
+    assert table.root.isna().tolist() == [False, False, True, False, False]
+    assert table.root.array._data.dtype == np.int16
+    assert table.root[1] == SPC("F#") and table.root[2] is pd.NA
+    assert values(pd.array([SPC("C"), np.nan, 3], dtype="spc")) == [
+        SPC("C"),
+        None,
+        SPC("A"),
+    ]
+    assert values(pd.array([0, 4, None], dtype="epc")) == [EPC(0), EPC(4), None]
+    with pytest.raises(ValueError):
+        pd.array(["H"], dtype="spc")
+
+
+def test_arithmetic_keeps_missing_values(table):
+    assert values(table.root + table.interval) == [
+        SPC("E"),
+        SPC("C#"),
+        None,
+        None,
+        SPC("E"),
+    ]
+    assert (table.root + EIC(1)).dtype.name == "epc"
+    assert (table.root - SIC("M2")).tolist()[:2] == [SPC("Bb"), SPC("E")]
+    assert (-table.interval).tolist()[:2] == [SIC("m6"), SIC("P4")]
+    assert (table.interval * 2).tolist()[0] == SIC("a5")
+    with pytest.raises(NotImplementedError):
+        table.root + table.root
+
+
+def test_comparisons(table):
+    equal = table.root == SPC("C")
+    assert equal.dtype == "boolean"
+    assert values(equal) == [True, False, None, False, True]
+
+
+def test_conversions(table):
+    assert values(table.root.astype("epc")) == [EPC(0), EPC(6), None, EPC(10), EPC(0)]
+    names = table.interval.astype(str)
+    assert names.isna().tolist() == [False, False, False, True, False]
+    assert names.dropna().tolist() == ["M3", "P5", "P1", "M3"]
+    assert table.root.astype(object).tolist()[:2] == [SPC("C"), SPC("F#")]
+
+
+def test_grouping_sorting_and_concatenation(table):
+    assert table.groupby("root").size().to_dict() == {
+        SPC("Bb"): 1,
+        SPC("C"): 2,
+        SPC("F#"): 1,
+    }
+    assert values(table.sort_values("root").root) == [
+        SPC("Bb"),
+        SPC("C"),
+        SPC("C"),
+        SPC("F#"),
+        None,
+    ]
+    both = pd.concat([table, table.iloc[::-1]], ignore_index=True)
+    assert both.root.dtype.name == "spc" and len(both) == 10
+    assert values(table.root.unique()) == [SPC("C"), SPC("F#"), None, SPC("Bb")]
+
+
+def test_parquet_round_trip(table):
+    pytest.importorskip("pyarrow")
+    buffer = io.BytesIO()
+    table.to_parquet(buffer)
+    restored = pd.read_parquet(buffer)
+    assert [dtype.name for dtype in restored.dtypes] == ["spc", "sic"]
+    assert restored.equals(table)
@@ -0,0 +1,80 @@
+"""Checks the bitset pitch-class sets against Python sets of the same pitch classes."""
+import itertools
+
+import pytest
+
+from harmony import MajorChord
+from pitch import EIC, EPC, SIC, SPC
+from pitch_sets import FIFTHS_WINDOW, EnharmonicPitchClassSet, SpecificPitchClassSet
+
+SPELLED = [[], [0, 1, 2], [-1, 0, 1, 2, 3, 4, 5], [2, 6, -9], FIFTHS_WINDOW[:3]]
+ENHARMONIC = [[], [0, 4, 7], [11], list(range(12)), [1, 2, 3]]
+
+
+@pytest.mark.parametrize(
+    "set_type, values",
+    [(SpecificPitchClassSet, SPELLED), (EnharmonicPitchClassSet, ENHARMONIC)],
+)
+def test_set_operations(set_type, values):
+    for a, b in itertools.product(values, repeat=2):
+        left, right = set_type(a), set_type(b)
+        expected_a = {set_type._element(set_type._bit(value)) for value in a}
+        expected_b = {set_type._element(set_type._bit(value)) for value in b}
+        assert set(left) == expected_a and len(left) == len(expected_a)
+        assert set(left & right) == expected_a & expected_b
+        assert set(left | right) == expected_a | expected_b
+        assert set(left ^ right) == expected_a ^ expected_b
+        assert set(left - right) == expected_a - expected_b
+        assert (left <= right) == (expected_a <= expected_b)
+        assert (left < right) == (expected_a < expected_b)
+        assert (left >= right) == (expected_a >= expected_b)
+        assert left.isdisjoint(right) == expected_a.isdisjoint(expected_b)
+        assert (left == right) == (expected_a == expected_b)
+        assert set_type.from_mask(left.mask) == left and hash(set_type(a)) == hash(left)
+
+
+def test_membership():
+    c_major = SpecificPitchClassSet(SPC(fifths) for fifths in range(-1, 6))
+    assert SPC("F") in c_major and SPC("F#") not in c_major
+    assert SPC(100) not in c_major
+    assert EPC(5) in c_major.enharmonic and SPC("E#") in c_major.enharmonic
+    with pytest.raises(NotImplementedError):
+        EPC(5) in c_major
+
+
+def test_transposition():
+    triad = SpecificPitchClassSet([SPC("C"), SPC("E"), SPC("G")])
+    assert triad.transpose(SIC("M2")) == SpecificPitchClassSet(
+        [SPC("D"), SPC("F#"), SPC("A")]
+    )
+    assert triad.transpose(-3) == SpecificPitchClassSet(
+        [SPC("Eb"), SPC("G"), SPC("Bb")]
+    )
+    with pytest.raises(ValueError):
+        triad.transpose(FIFTHS_WINDOW.stop)
+    with pytest.raises(ValueError):
+        SpecificPitchClassSet([FIFTHS_WINDOW.start]).transpose(-1)
+    with pytest.raises(NotImplementedError):
+        triad.transpose(EIC(2))
+    enharmonic = EnharmonicPitchClassSet([0, 4, 7, 11])
+    assert enharmonic.transpose(EIC(1)) == EnharmonicPitchClassSet([1, 5, 8, 0])
+    assert enharmonic.transpose(SIC("M2")) == enharmonic.transpose(2)
+
+
+def test_invalid_use():
+    spelled = SpecificPitchClassSet([SPC("C")])
+    with pytest.raises(NotImplementedError):
+        spelled | EnharmonicPitchClassSet([0])
+    with pytest.raises(AttributeError):
+        spelled.mask = 0
+    with pytest.raises(ValueError):
+        EnharmonicPitchClassSet.from_mask(1 << 12)
+    with pytest.raises(ValueError):
+        SpecificPitchClassSet([FIFTHS_WINDOW.stop])
+
+
+def test_selector_sets():
+    chord = MajorChord(SPC("D"))
+    assert chord.spelled_set == SpecificPitchClassSet([SPC("D"), SPC("F#"), SPC("A")])
+    assert chord.enharmonic_set == EnharmonicPitchClassSet([2, 6, 9])
+    assert MajorChord(EPC(2)).spelled_set is None
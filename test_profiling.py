@@ -0,0 +1,78 @@
+"""Checks the counts of the opt-in profiling and that disabling it restores the original functions."""
+import pytest
+
+import abstract
+import pitch
+import pitch_helpers
+import profiling
+from abstract import IntType
+from pitch import EPC, SIC, SPC
+
+
+@pytest.fixture(autouse=True)
+def restore():
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_counts():
+    with profiling.profiling():
+        SPC("C") + SIC("M3")
+        SPC(100) + SIC(1)
+        with pytest.raises(NotImplementedError):
+            SPC("C") + EPC(3)
+        -SIC(3)
+        SPC(4) == SPC(4)
+    counts = profiling.snapshot()
+    assert counts["operator_calls"][(SPC, SIC, "+")] == 2
+    assert counts["operator_errors"] == {(SPC, EPC, "+"): 1}
+    assert counts["operator_calls"][(SIC, None, "neg")] == 1
+    assert counts["operator_calls"][(SPC, SPC, "==")] == 1
+    assert counts["helper_calls"]["note_name2fifths"] == 2
+    assert counts["helper_calls"]["interval_name2fifths"] == 1
+    assert counts["helper_seconds"]["note_name2fifths"] > 0
+    assert "SpecificPitchClass + SpecificIntervalClass" in profiling.report()
+
+
+def test_instances():
+    SPC(0)
+    with profiling.profiling():
+        SPC(0)
+        SPC(100)
+        SPC(100)
+    # interned instances are allocated only once, the others every time
+    assert profiling.snapshot()["instances"] == {SPC: 2}
+
+
+def test_disable_restores_originals():
+    originals = (vars(IntType)["_from_int"], abstract._resolve, pitch.note_name2fifths)
+    with profiling.profiling():
+        assert profiling.is_enabled()
+        assert pitch.note_name2fifths is not originals[2]
+    assert not profiling.is_enabled()
+    assert (
+        vars(IntType)["_from_int"],
+        abstract._resolve,
+        pitch.note_name2fifths,
+    ) == originals
+    assert pitch_helpers.note_name2fifths is originals[2]
+    SPC("C") + SIC("M3")
+    assert profiling.snapshot()["operator_calls"] == {}
+
+
+def test_counts_accumulate_on_request():
+    with profiling.profiling():
+        SPC("C") + SIC(1)
+    with profiling.profiling(reset_counts=False):
+        SPC("C") + SIC(1)
+    assert profiling.snapshot()["operator_calls"][(SPC, SIC, "+")] == 2
+
+
+def test_environment(monkeypatch):
+    monkeypatch.setenv(profiling.ENVIRONMENT_VARIABLE, "0")
+    profiling.enable_from_environment()
+    assert not profiling.is_enabled()
+    monkeypatch.setenv(profiling.ENVIRONMENT_VARIABLE, "1")
+    profiling.enable_from_environment()
+    assert profiling.is_enabled()
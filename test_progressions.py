@@ -0,0 +1,142 @@
+"""Checks the n-gram counts and the pattern search of the progression index against a scan of the corpus."""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from harmony import Chord, MajorChord
+from pitch import EPC, SIC, SPC
+from progressions import ProgressionIndex
+
+
+@pytest.fixture
+def minor_chord(isolated_types):
+    class MinorChord(Chord):
+        intervals = (SIC(0), SIC(-3), SIC(1))
+        label = "min"
+
+    return MinorChord
+
+
+@pytest.fixture
+def corpus(minor_chord):
+    pool = [MajorChord(SPC._from_int(root)) for root in range(-4, 5)]
+    pool += [minor_chord(SPC._from_int(root)) for root in range(-4, 5)]
+    rng = np.random.default_rng(0)
+    return [
+        [pool[i] for i in rng.integers(0, len(pool), length).tolist()]
+        for length in [50, 0, 1, 3, 80, 40]
+    ]
+
+
+def gram(chords):
+    key = (type(chords[0]).type_id,)
+    for previous, chord in zip(chords, chords[1:]):
+        key += (int(chord.root) - int(previous.root), type(chord).type_id)
+    return key
+
+
+def matches(chords, pattern):
+    reference = None
+    for chord, element in zip(chords, pattern):
+        if element is None:
+            continue
+        if isinstance(element, type):
+            if type(chord) is not element:
+                return False
+            continue
+        if type(chord) is not type(element):
+            return False
+        if reference is None:
+            reference = (chord, element)
+            continue
+        motion = int(chord.root) - int(reference[0].root)
+        if motion != int(element.root) - int(reference[1].root):
+            return False
+    return True
+
+
+def scan(corpus, pattern):
+    n = len(pattern)
+    return [
+        [piece, i]
+        for piece, chords in enumerate(corpus)
+        for i in range(len(chords) - n + 1)
+        if matches(chords[i:][:n], pattern)
+    ]
+
+
+def build(corpus, order):
+    index = ProgressionIndex(order)
+    for chords in corpus:
+        index.add_piece(chords)
+    return index
+
+
+@pytest.mark.parametrize("order", [1, 2, 4])
+@pytest.mark.parametrize("n", [1, 2, 3, 5])
+def test_counts(corpus, order, n):
+    expected = Counter(
+        gram(chords[i:][:n]) for chords in corpus for i in range(len(chords) - n + 1)
+    )
+    index = build(corpus, order)
+    assert index.count(n) == dict(expected)
+    counts = [count for _, count in index.most_common(n, 3)]
+    assert counts == sorted(expected.values(), reverse=True)[:3]
+
+
+@pytest.mark.parametrize("order", [1, 3])
+def test_search(corpus, minor_chord, order):
+    index = build(corpus, order)
+    c, f, a = MajorChord(SPC("C")), MajorChord(SPC("F")), minor_chord(SPC("A"))
+    patterns = [
+        [c],
+        [c, a, f],
+        [f, None, c],
+        [minor_chord, MajorChord],
+        [None, None],
+        [a, minor_chord, None, c],
+        [c, c, c, c, c, c],
+    ]
+    for pattern in patterns:
+        found = index.search(pattern)
+        assert found.shape[1] == 2
+        assert found.tolist() == scan(corpus, pattern)
+
+
+def test_transposition_invariance():
+    index = ProgressionIndex(2)
+    index.add_piece([MajorChord(SPC(name)) for name in ("C", "F", "G", "C")])
+    index.add_piece([MajorChord(SPC(name)) for name in ("Db", "Gb", "Ab", "Db")])
+    found = index.search([MajorChord(SPC("B")), MajorChord(SPC("E"))])
+    assert found.tolist() == [[0, 0], [0, 2], [1, 0], [1, 2]]
+    assert index.count(2)[gram([MajorChord(SPC("F")), MajorChord(SPC("G"))])] == 2
+    plagal = gram([MajorChord(SPC("C")), MajorChord(SPC("F"))])
+    assert index.format_gram(plagal) == "maj P4 maj"
+
+
+def test_save_and_load(corpus, minor_chord, tmp_path):
+    index = build(corpus, 3)
+    path = tmp_path / "corpus.pcarchive"
+    index.save(path)
+    loaded = ProgressionIndex.load(path, order=2)
+    assert len(loaded) == len(index) and loaded.size == index.size
+    assert loaded.count(3) == index.count(3)
+    pattern = [MajorChord(SPC("C")), minor_chord(SPC("A"))]
+    assert np.array_equal(loaded.search(pattern), index.search(pattern))
+    ProgressionIndex().save(tmp_path / "empty.pcarchive")
+    assert len(ProgressionIndex.load(tmp_path / "empty.pcarchive")) == 0
+
+
+def test_errors():
+    index = ProgressionIndex()
+    with pytest.raises(ValueError):
+        ProgressionIndex(0)
+    with pytest.raises(ValueError):
+        index.count(0)
+    with pytest.raises(ValueError):
+        index.search([])
+    with pytest.raises(ValueError, match="root"):
+        index.add_piece([MajorChord(EPC(0))])
+    with pytest.raises(TypeError):
+        index.add_piece([SPC("C")])
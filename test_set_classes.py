@@ -0,0 +1,109 @@
+"""Checks the precomputed set-class tables against direct computations and known set classes."""
+import itertools
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from harmony import MajorChord, MajorPentatonicScale, MajorScale
+from pitch import EPC, SPC
+from pitch_sets import EnharmonicPitchClassSet
+from set_classes import (
+    FORTE_INDEX,
+    FORTE_NUMBERS,
+    PRIME_FORM,
+    forte_number,
+    forte_numbers,
+    interval_vector,
+    interval_vectors,
+    prime_form,
+    prime_forms,
+    spelled_interval_vector,
+    spelled_prime_form,
+)
+
+MASKS = range(4096)
+
+
+def transformations(mask: int):
+    pitch_classes = [pc for pc in range(12) if mask >> pc & 1]
+    for steps, sign in itertools.product(range(12), (1, -1)):
+        yield EnharmonicPitchClassSet(sign * pc + steps for pc in pitch_classes).mask
+
+
+def test_prime_forms():
+    for mask in MASKS:
+        assert PRIME_FORM[mask] == min(transformations(mask))
+
+
+def test_interval_vectors():
+    for mask in range(0, 4096, 7):
+        pitch_classes = [pc for pc in range(12) if mask >> pc & 1]
+        counts = Counter(
+            min((a - b) % 12, (b - a) % 12)
+            for a, b in itertools.combinations(pitch_classes, 2)
+        )
+        assert interval_vector(mask) == tuple(counts[k] for k in range(1, 7))
+
+
+def test_forte_numbers():
+    assert len(FORTE_NUMBERS) == 224
+    per_cardinality = Counter(name.split("-")[0] for name in FORTE_NUMBERS)
+    sizes = [1, 1, 6, 12, 29, 38, 50, 38, 29, 12, 6, 1, 1]
+    assert [per_cardinality[str(n)] for n in range(13)] == sizes
+    for mask in MASKS:
+        assert all(
+            FORTE_INDEX[other] == FORTE_INDEX[mask] for other in transformations(mask)
+        )
+    # complements share the number, except for the Z-related hexachords, which are each other's complements
+    for mask in (mask for mask in range(0, 4096, 5) if bin(mask).count("1") != 6):
+        number, complement = forte_number(mask), forte_number(0xFFF ^ mask)
+        assert number.split("-")[1] == complement.split("-")[1]
+
+
+@pytest.mark.parametrize(
+    "collection, prime, number, vector",
+    [
+        (MajorChord(SPC("Eb")), (0, 3, 7), "3-11", (0, 0, 1, 1, 1, 0)),
+        (MajorChord(EPC(1)), (0, 3, 7), "3-11", (0, 0, 1, 1, 1, 0)),
+        (MajorScale(SPC("F#")), (0, 1, 3, 5, 6, 8, 10), "7-35", (2, 5, 4, 3, 6, 1)),
+        (MajorPentatonicScale(SPC("A")), (0, 2, 4, 7, 9), "5-35", (0, 3, 2, 1, 4, 0)),
+        ([0, 1, 4, 6], (0, 1, 4, 6), "4-Z15", (1, 1, 1, 1, 1, 1)),
+        ([0, 1, 3, 7], (0, 1, 3, 7), "4-Z29", (1, 1, 1, 1, 1, 1)),
+        ([], (), "0-1", (0,) * 6),
+        (0xFFF, tuple(range(12)), "12-1", (12, 12, 12, 12, 12, 6)),
+    ],
+)
+def test_known_set_classes(collection, prime, number, vector):
+    assert prime_form(collection) == prime
+    assert forte_number(collection) == number
+    assert interval_vector(collection) == vector
+
+
+def test_bulk_versions():
+    masks = np.arange(4096).reshape(64, 64)
+    assert prime_forms(masks).shape == masks.shape
+    assert forte_numbers(masks)[1, 2] == forte_number(66)
+    assert interval_vectors(masks).shape == (64, 64, 6)
+    with pytest.raises(ValueError):
+        forte_numbers([4096])
+    with pytest.raises(TypeError):
+        prime_forms([0.5])
+    with pytest.raises(ValueError):
+        prime_form(-1)
+
+
+def test_spelled_set_classes():
+    german_sixth = [SPC(name) for name in ("Ab", "C", "Eb", "F#")]
+    dominant = [SPC(name) for name in ("Ab", "C", "Eb", "Gb")]
+    assert forte_number(german_sixth) == forte_number(dominant)
+    assert spelled_prime_form(german_sixth) == (0, 1, 4, 10)
+    assert spelled_prime_form(dominant) == (0, 2, 3, 6)
+    assert spelled_prime_form(MajorChord(SPC("D"))) == spelled_prime_form(
+        [SPC("C"), SPC("Eb"), SPC("G")]
+    )
+    assert spelled_prime_form(MajorScale(SPC("Cb"))) == tuple(range(7))
+    assert spelled_interval_vector([SPC("C"), SPC("E"), SPC("G")]) == (1, 0, 1, 1)
+    assert spelled_prime_form([]) == () and spelled_interval_vector([]) == ()
+    with pytest.raises(ValueError):
+        spelled_prime_form(MajorChord(EPC(0)))
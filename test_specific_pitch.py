@@ -0,0 +1,107 @@
+"""Checks that SpecificPitch and SpecificInterval, which pack fifths and semitones into one integer, cannot be
+corrupted by plain integers, and their octaves, names and operations."""
+import pytest
+
+from pitch import EI, EP, SI, SIC, SP, SPC
+from pitch_arrays import SpecificIntervalArray, SpecificPitchArray
+
+
+@pytest.mark.parametrize("operation", ["+", "-", "*", "//", "%"])
+@pytest.mark.parametrize(
+    "value", [SP("C4"), SI("M3:0"), SpecificPitchArray(["C4", "E4"])], ids=repr
+)
+def test_integer_operands(value, operation):
+    with pytest.raises(NotImplementedError):
+        eval(f"value {operation} 1")
+    with pytest.raises(NotImplementedError):
+        eval(f"1 {operation} value")
+
+
+@pytest.mark.parametrize(
+    "constructor, value",
+    [(SP, 60), (SI, 4), (SpecificPitchArray, [60]), (SpecificIntervalArray, [4])],
+)
+def test_integer_constructors(constructor, value):
+    with pytest.raises(TypeError):
+        constructor(value)
+
+
+def test_from_midi():
+    assert SP.from_midi(60) == SP("C4")
+    assert [SP.from_midi(midi).name for midi in (61, 66, 71, 59)] == [
+        "Db4",
+        "F#4",
+        "B4",
+        "B3",
+    ]
+    assert SpecificPitchArray.from_midi([60, 61, 66]).names.tolist() == [
+        "C4",
+        "Db4",
+        "F#4",
+    ]
+    assert SP.from_midi(61).midi == 61
+
+
+def test_typed_operands():
+    assert SP("C4") + SI("M3:0") == SP("E4")
+    assert SP("E4") - SP("C4") == SI("M3:0")
+    assert SP(SP("B#3")) == SP("B#3")
+
+
+def test_negation():
+    intervals = SpecificIntervalArray(["M3:0", "P5:1"])
+    assert list(-intervals) == [-SI("M3:0"), -SI("P5:1")]
+    assert ((-intervals + intervals) == SI("P1:0")).all()
+
+
+@pytest.mark.parametrize("name", ["C4", "B#3", "Cb4", "F##-1", "Ebb10", "G0"])
+def test_pitches(name):
+    pitch = SP(name)
+    assert pitch.name == name and SP(pitch.name) == pitch
+    assert SP.from_fifths_octaves(pitch.fifths, pitch.octaves) == pitch
+    assert pitch.pitch_class == SPC(name.rstrip("-0123456789"))
+    assert EP(pitch) == EP(name) == EP(pitch.midi)
+    assert pitch.octave == int(name.lstrip("ABCDEFG#b"))
+
+
+def test_octaves():
+    assert (SP("B#3").midi, SP("B#3").octave) == (60, 3)
+    assert (SP("Cb4").midi, SP("Cb4").octave) == (59, 4)
+    assert EP(60).octave == 4 and EP(59).octave == 3 and EP(-1).octave == -2
+    assert [EI(semitones).octave for semitones in (0, 11, 12, -11, -12, -13)] == [
+        0,
+        0,
+        1,
+        0,
+        -1,
+        -1,
+    ]
+
+
+@pytest.mark.parametrize(
+    "name, interval_class",
+    [("M3:0", "M3"), ("P5:1", "P5"), ("-m2:0", "M7"), ("a4:2", "a4"), ("P1:0", "P1")],
+)
+def test_intervals(name, interval_class):
+    interval = SI(name)
+    assert interval.name == name
+    assert SI.from_fifths_octaves(interval.fifths, interval.octaves) == interval
+    assert interval.interval_class == SIC(interval_class)
+    assert EI(interval) == EI(interval.semitones)
+    assert SI("P1:0") - interval == -interval
+
+
+def test_steps_and_mixed_operands():
+    assert [SI(name).steps for name in ("M3:0", "-P5:0", "M3:1", "P1:0")] == [
+        2,
+        -4,
+        9,
+        0,
+    ]
+    assert SP("C4") + SI("M3:1") == SP("E5")
+    assert SP("E4") - SP("B#3") == SI("d4:0")
+    assert SP("C4") + EI(4) == EP(64)
+    assert EP(60) + EI(-13) == EP(47) and EP(64) - EP(60) == EI(4)
+    assert type(EP(60) - EP(60)) is EI
+    with pytest.raises(NotImplementedError):
+        EP(60) + SP("C4")
@@ -0,0 +1,79 @@
+"""Checks the Viterbi speller against an exhaustive search and the windowed decoding against a single pass."""
+import itertools
+
+import numpy as np
+import pytest
+
+from harmony import MajorScale
+from pitch import EPC, SPC
+from pitch_arrays import EnharmonicPitchArray, EPCArray, SICArray, SPCArray
+from spelling import CANDIDATE_OFFSETS, DEFAULT_CENTER, Speller, scale_center, spell
+
+
+def cost(speller, fifths, centers):
+    fifths = np.asarray(fifths)
+    return (
+        speller.transition_weight * np.abs(np.diff(fifths)).sum()
+        + speller.context_weight * np.abs(fifths - centers).sum()
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_optimal_spelling(seed):
+    rng = np.random.default_rng(seed)
+    semitones = rng.integers(0, 12, rng.integers(1, 7))
+    centers = rng.uniform(-6, 8, len(semitones))
+    speller = Speller(
+        transition_weight=rng.uniform(0.1, 2), context_weight=rng.uniform(0.1, 2)
+    )
+    closest = (7 * semitones + 5) % 12 - 5
+    best = min(
+        cost(speller, closest + np.array(offsets), centers)
+        for offsets in itertools.product(CANDIDATE_OFFSETS, repeat=len(semitones))
+    )
+    fifths = speller._decode(semitones, centers, None)
+    assert ((7 * fifths) % 12 == semitones).all()
+    assert cost(speller, fifths, centers) == pytest.approx(best)
+
+
+def test_spellings():
+    e_major = spell(EnharmonicPitchArray([64, 66, 68, 69, 71, 73, 75, 76]))
+    assert " ".join(e_major.names.tolist()) == "E4 F#4 G#4 A4 B4 C#5 D#5 E5"
+    db_major = spell(EPCArray([1, 3, 5, 6, 8, 10, 0]), MajorScale(SPC("Db")))
+    assert type(db_major) is SPCArray
+    assert db_major.values.tolist() == [-5, -3, -1, -6, -4, -2, 0]
+    local = [MajorScale(SPC("C"))] * 4 + [MajorScale(SPC("Ab"))] * 4
+    modulation = spell(EPCArray([0, 4, 7, 0, 8, 0, 3, 8]), local)
+    assert modulation.values.tolist() == [0, 4, 1, 0, -4, 0, -3, -4]
+    assert len(spell(EPCArray([]))) == 0
+
+
+def test_windows_and_streams():
+    rng = np.random.default_rng(1)
+    notes = EnharmonicPitchArray(60 + np.cumsum(rng.integers(-4, 5, 3000)) % 24)
+    expected = spell(notes)
+    windowed = Speller(window=500, lookahead=100)
+    assert (windowed.spell(notes).values == expected.values).all()
+    chunks = map(EnharmonicPitchArray, np.array_split(notes.values, 7))
+    streamed = np.concatenate([array.values for array in windowed.spell_stream(chunks)])
+    assert (streamed == expected.values).all()
+
+
+def test_context():
+    assert scale_center(MajorScale(SPC("C"))) == DEFAULT_CENTER
+    assert scale_center(MajorScale(SPC("E"))) == 6.0
+    with pytest.raises(ValueError):
+        scale_center(MajorScale(EPC(0)))
+    with pytest.raises(ValueError, match="key contexts"):
+        spell(EPCArray([0, 1]), [None])
+
+
+def test_invalid_input():
+    with pytest.raises(TypeError, match="spelled already"):
+        spell(SICArray([1]))
+    with pytest.raises(TypeError):
+        spell(np.array([0.5]))
+    with pytest.raises(ValueError):
+        Speller(window=10, lookahead=10)
+    with pytest.raises(TypeError, match="either"):
+        list(Speller().spell_stream([EPCArray([0]), EnharmonicPitchArray([60])]))
@@ -0,0 +1,72 @@
+"""Checks the universe table in the presence of selector types with enharmonic intervals and of stepped roots."""
+import pytest
+
+from harmony import Chord, MajorChord, MajorScale
+from key_estimation import KeyEstimator
+from pitch import EIC, SIC, SPC
+from universe import UniverseTable, get_universe_table
+
+
+@pytest.fixture
+def augmented_triad(isolated_types):
+    class AugmentedTriad(Chord):
+        intervals = (EIC(0), EIC(4), EIC(8))
+
+    return AugmentedTriad
+
+
+def test_enharmonic_types_are_skipped(augmented_triad):
+    table = get_universe_table()
+    assert augmented_triad not in table.types
+    assert MajorChord in table.types
+    KeyEstimator()
+
+
+def test_enharmonic_types_are_rejected_explicitly(augmented_triad):
+    with pytest.raises(TypeError):
+        get_universe_table().type_index(augmented_triad)
+    with pytest.raises(TypeError):
+        UniverseTable([augmented_triad])
+
+
+@pytest.mark.parametrize("roots", [range(-14, 15, 2), range(7, -8, -1)])
+def test_stepped_roots(roots):
+    table = UniverseTable([MajorScale], roots=roots)
+    for index, root in enumerate(roots):
+        assert table.root_index(root) == index
+        assert table.lookup(MajorScale, root)[0] == root
+    with pytest.raises(KeyError):
+        table.root_index(roots.stop)
+
+
+def test_roots_between_steps():
+    with pytest.raises(KeyError):
+        UniverseTable([MajorScale], roots=range(-14, 15, 2)).root_index(1)
+
+
+def test_members_match_concretization():
+    table = get_universe_table()
+    for selector in table.types:
+        for root in (-14, 0, 6, 14):
+            expected = [
+                int(member) for member in selector(SPC._from_int(root))._concretized()
+            ]
+            assert table.lookup(selector, root).tolist() == expected
+    assert table.semitones[table.type_index(MajorChord), table.root_index(0)].tolist()[
+        :3
+    ] == [0, 4, 7]
+
+
+def test_new_types_and_save_load(isolated_types, tmp_path):
+    table = get_universe_table()
+    shape = table.shape
+
+    class DominantSeventhChord(Chord):
+        intervals = (SIC(0), SIC(4), SIC(1), SIC(-2))
+
+    assert get_universe_table() is table and table.shape[0] == shape[0] + 1
+    assert table.lookup(DominantSeventhChord, 0).tolist() == [0, 4, 1, -2]
+    table.save(tmp_path / "universe.npz")
+    loaded = UniverseTable.load(tmp_path / "universe.npz")
+    assert loaded.types == table.types
+    assert (loaded.members == table.members).all() and (loaded.mask == table.mask).all()
@@ -0,0 +1,106 @@
+"""Checks the batched voice-leading distances against a direct search over all voice assignments."""
+import itertools
+
+import numpy as np
+import pytest
+
+from harmony import Chord, MajorChord
+from pitch import EPC, SIC, SPC
+from voice_leading import VoiceLeading
+
+
+@pytest.fixture
+def dominant_seventh_chord(isolated_types):
+    class DominantSeventhChord(Chord):
+        intervals = (SIC(0), SIC(4), SIC(1), SIC(-2))
+
+    return DominantSeventhChord
+
+
+def reference(first, second, metric):
+    """The smallest displacement over all relations between the tones in which every tone has a partner."""
+
+    def key(tone):
+        return int(tone) if metric == "fifths" else tone.semitones
+
+    def distance(a, b):
+        if metric == "fifths":
+            return abs(a - b)
+        return min((a - b) % 12, (b - a) % 12)
+
+    a = sorted({key(tone) for tone in first.chord_tones})
+    b = sorted({key(tone) for tone in second.chord_tones})
+    n = max(len(a), len(b))
+    best = None
+    for sources in itertools.product(range(len(a)), repeat=n):
+        if len(set(sources)) < len(a):
+            continue
+        for targets in itertools.product(range(len(b)), repeat=n):
+            if len(set(targets)) < len(b) or (
+                len(a) == len(b) and len(set(sources)) < n
+            ):
+                continue
+            pairs = set(zip(sources, targets))
+            if len(pairs) != n:
+                continue
+            total = sum(distance(a[i], b[j]) for i, j in pairs)
+            best = total if best is None else min(best, total)
+    return best
+
+
+@pytest.mark.parametrize("metric", ["semitones", "fifths"])
+def test_distances(dominant_seventh_chord, metric):
+    pool = [MajorChord(SPC._from_int(root)) for root in range(-7, 8)]
+    pool += [dominant_seventh_chord(SPC._from_int(root)) for root in range(-7, 8)]
+    rng = np.random.default_rng(0)
+    sequence = [pool[i] for i in rng.integers(0, len(pool), 60).tolist()]
+    distances = VoiceLeading(metric).distances(sequence)
+    assert distances.dtype == np.int64 and len(distances) == len(sequence) - 1
+    expected = [reference(a, b, metric) for a, b in zip(sequence, sequence[1:])]
+    assert distances.tolist() == expected
+
+
+def test_examples(dominant_seventh_chord):
+    semitones, fifths = VoiceLeading(), VoiceLeading("fifths")
+    c, f = MajorChord(SPC("C")), MajorChord(SPC("F"))
+    assert semitones.distance(c, f) == 3 and fifths.distance(c, f) == 3
+    assert (
+        semitones.distance(c, MajorChord(SPC("Ab")))
+        == semitones.distance(c, MajorChord(EPC(8)))
+        == 2
+    )
+    assert fifths.distance(c, MajorChord(SPC("Ab"))) == 12
+    assert fifths.distance(c, MajorChord(SPC("G#"))) == 24
+    assert semitones.distance(c, c) == 0
+    assert semitones.distance(MajorChord(None), c) == 0
+    g7 = dominant_seventh_chord(SPC("G"))
+    assignment = semitones.assignment(g7, c)
+    assert len(assignment) == 4
+    assert {tone for tone, _ in assignment} == set(g7.chord_tones)
+    steps = [(b.semitones - a.semitones) % 12 for a, b in assignment]
+    assert sum(min(step, 12 - step) for step in steps) == semitones.distance(g7, c)
+
+
+def test_memoization_and_short_sequences():
+    semitones = VoiceLeading()
+    assert semitones.distances([]).tolist() == []
+    assert semitones.distances([MajorChord(SPC("C"))]).tolist() == []
+    semitones.distances([MajorChord(SPC("C")), MajorChord(SPC("G"))])
+    # the pair is normalized to the same key in every transposition
+    assert len(semitones._distances) == 1
+    semitones.distances(
+        [
+            MajorChord(SPC("D")),
+            MajorChord(SPC("A")),
+            MajorChord(EPC(4)),
+            MajorChord(EPC(11)),
+        ]
+    )
+    assert len(semitones._distances) == 2
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="metric"):
+        VoiceLeading("octaves")
+    with pytest.raises(TypeError, match="spelled"):
+        VoiceLeading("fifths").distance(MajorChord(SPC("C")), MajorChord(EPC(4)))
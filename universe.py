@@ -0,0 +1,201 @@
+"""Precomputed tables holding the members of every registered Chord and Scale type for every root within a range of
+the line of fifths."""
+import os
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from harmony import SELECTOR_TYPES, PitchClassSelector
+
+DEFAULT_ROOTS = range(-14, 15)
+"""Roots from Fbb to B## expressed as fifths."""
+
+
+def _interval_fifths(selector: Type[PitchClassSelector]) -> List[int]:
+    """Returns the intervals of a selector type as fifths.
+
+    Raises:
+        TypeError: If the selector type has enharmonic intervals.
+    """
+    if selector._enharmonic():
+        raise TypeError(
+            f"{selector.__name__} is defined by enharmonic intervals which cannot be placed on the line of fifths."
+        )
+    return [int(interval) for interval in selector.intervals]
+
+
+class UniverseTable:
+    """Dense table of concretized PitchClassSelector types. ``members[t, r, i]`` holds, as fifths, the i-th member
+    of the type ``types[t]`` with the root ``roots[r]``. Types with fewer members than the widest one are padded and
+    ``mask`` is False for the padding. Types with enharmonic intervals have no place on the line of fifths; they are
+    left out of the registered types and rejected when passed explicitly.
+    """
+
+    def __init__(
+        self,
+        types: Optional[Iterable[Type[PitchClassSelector]]] = None,
+        roots: range = DEFAULT_ROOTS,
+    ):
+        """
+
+        Args:
+            types: PitchClassSelector subclasses to include. Defaults to all registered ones with specific intervals.
+            roots: Range of roots, expressed as fifths.
+        """
+        self.roots = np.arange(roots.start, roots.stop, roots.step, dtype=np.int16)
+        self.types: List[Type[PitchClassSelector]] = []
+        self._type_indices: Dict[Type[PitchClassSelector], int] = {}
+        self.members = np.zeros((0, len(self.roots), 0), dtype=np.int16)
+        self.mask = np.zeros((0, len(self.roots), 0), dtype=bool)
+        if types is None:
+            self.update()
+        else:
+            self.add_types(types)
+
+    def add_types(self, types: Iterable[Type[PitchClassSelector]]) -> None:
+        """Appends rows for all given types that are not yet part of the table.
+
+        Raises:
+            TypeError: If one of the types has enharmonic intervals.
+        """
+        new_types = [
+            selector
+            for selector in dict.fromkeys(types)
+            if selector not in self._type_indices
+        ]
+        if len(new_types) == 0:
+            return
+        intervals = [_interval_fifths(selector) for selector in new_types]
+        width = max(self.members.shape[2], *(len(fifths) for fifths in intervals))
+        members = np.zeros((len(new_types), len(self.roots), width), dtype=np.int16)
+        mask = np.zeros(members.shape, dtype=bool)
+        for row, fifths in enumerate(intervals):
+            members[row, :, : len(fifths)] = self.roots[:, None] + np.array(
+                fifths, dtype=np.int16
+            )
+            mask[row, :, : len(fifths)] = True
+        padding = ((0, 0), (0, 0), (0, width - self.members.shape[2]))
+        self.members = np.concatenate([np.pad(self.members, padding), members])
+        self.mask = np.concatenate([np.pad(self.mask, padding), mask])
+        for selector in new_types:
+            self._type_indices[selector] = len(self.types)
+            self.types.append(selector)
+
+    def update(self) -> None:
+        """Adds the PitchClassSelector types with specific intervals registered since the table was built."""
+        self.add_types(
+            selector for selector in SELECTOR_TYPES if not selector._enharmonic()
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """(number of types, number of roots, maximum number of members)"""
+        return self.members.shape
+
+    @property
+    def semitones(self) -> np.ndarray:
+        """The members expressed in semitones; padding is -1."""
+        semitones = (7 * self.members.astype(np.int32) % 12).astype(np.int8)
+        semitones[~self.mask] = -1
+        return semitones
+
+    def type_index(self, selector: Type[PitchClassSelector]) -> int:
+        """Returns the first index of the table for the given PitchClassSelector subclass.
+
+        Raises:
+            TypeError: If the selector type has enharmonic intervals.
+            KeyError: If the selector type is not part of the table.
+        """
+        try:
+            return self._type_indices[selector]
+        except KeyError:
+            _interval_fifths(selector)
+            raise KeyError(f"{selector.__name__} is not part of the table.") from None
+
+    def root_index(self, root: int) -> int:
+        """Returns the second index of the table for the given root, expressed as fifths."""
+        step = int(self.roots[1] - self.roots[0]) if len(self.roots) > 1 else 1
+        index, remainder = divmod(int(root) - int(self.roots[0]), step)
+        if remainder != 0 or not 0 <= index < len(self.roots):
+            raise KeyError(f"Root {int(root)} is not among the table's roots.")
+        return index
+
+    def lookup(self, selector: Type[PitchClassSelector], root: int) -> np.ndarray:
+        """Returns the members of ``selector`` with the given root as fifths, without padding."""
+        t, r = self.type_index(selector), self.root_index(root)
+        return self.members[t, r][self.mask[t, r]]
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Stores the table as .npz file. The types are referenced by their qualified names."""
+        names = [
+            f"{selector.__module__}.{selector.__qualname__}" for selector in self.types
+        ]
+        np.savez(
+            path,
+            members=self.members,
+            mask=self.mask,
+            roots=self.roots,
+            types=np.array(names, dtype=str),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "UniverseTable":
+        """Loads a table stored with save(). All its types need to be registered, i.e. defined, already."""
+        registered = {
+            f"{selector.__module__}.{selector.__qualname__}": selector
+            for selector in SELECTOR_TYPES
+        }
+        with np.load(path) as data:
+            names = data["types"].tolist()
+            unknown = [name for name in names if name not in registered]
+            if len(unknown) > 0:
+                raise KeyError(
+                    f"The table uses types that have not been defined: {unknown}"
+                )
+            table = cls.__new__(cls)
+            table.roots = data["roots"]
+            table.members = data["members"]
+            table.mask = data["mask"]
+        table.types = [registered[name] for name in names]
+        table._type_indices = {
+            selector: index for index, selector in enumerate(table.types)
+        }
+        return table
+
+
+_TABLES: Dict[Tuple[int, int, int], UniverseTable] = {}
+
+
+def get_universe_table(roots: range = DEFAULT_ROOTS) -> UniverseTable:
+    """Returns the shared table for the given range of roots. It is built on first access and extended by all
+    PitchClassSelector subclasses defined in the meantime on every further access.
+
+    Args:
+        roots: Range of roots, expressed as fifths.
+    """
+    key = (roots.start, roots.stop, roots.step)
+    try:
+        table = _TABLES[key]
+    except KeyError:
+        table = _TABLES[key] = UniverseTable(roots=roots)
+    else:
+        table.update()
+    return table
+
+
+if __name__ == "__main__":
+    from harmony import SIC, Chord, MajorScale
+    from pitch_helpers import fifths2note_names
+
+    table = get_universe_table()
+    print(
+        f"Table of shape {table.shape} for the types {[t.__name__ for t in table.types]}"
+    )
+    print(f"MajorScale on F#: {fifths2note_names(table.lookup(MajorScale, 6))}")
+
+    class MinorChord(Chord):
+        intervals = (SIC("P1"), SIC("m3"), SIC("P5"))
+
+    table = get_universe_table()
+    print(f"After defining MinorChord: {table.shape}")
+    print(f"MinorChord on Eb: {fifths2note_names(table.lookup(MinorChord, -3))}")
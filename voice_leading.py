@@ -0,0 +1,218 @@
+"""Minimal voice-leading distances between consecutive chords. The distance between two chords is the smallest total
+displacement of the voices over all assignments of the tones of one chord to those of the other, where chords with
+different numbers of tones double some of the tones of the smaller chord.
+
+Distances do not change when both chords are transposed, so every pair of chords is transposed such that the lowest
+tone of the first chord is 0. The distances of all distinct normalized pairs of a sequence are computed at once on
+NumPy arrays and memoized, such that recurring progressions are computed once, whatever their key.
+"""
+from functools import lru_cache
+from itertools import permutations, product
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from abstract import FifthsScalar, IntType, SemitonesScalar
+from harmony import Chord
+
+METRICS = ("semitones", "fifths")
+"""Semitones measures voices by the smaller of both distances between two enharmonic pitch classes, fifths by the
+distance of two SpecificPitchClasses on the line of fifths."""
+
+_PADDING = np.iinfo(np.int16).max
+"""Fills the rows of chords with fewer tones than the largest chord; sorts after all tones."""
+
+
+@lru_cache(maxsize=None)
+def _assignments(n: int, m: int) -> Tuple[np.ndarray, np.ndarray]:
+    """All assignments between n and m voices, as two arrays of voice indices of shape (assignments, max(n, m)).
+    Equal numbers of voices are permuted; otherwise every voice of the larger chord goes to some voice of the smaller
+    chord such that all voices of the smaller chord are used."""
+    if n == m:
+        targets = list(permutations(range(m)))
+    else:
+        smaller = min(n, m)
+        targets = [
+            f
+            for f in product(range(smaller), repeat=max(n, m))
+            if len(set(f)) == smaller
+        ]
+    targets = np.array(targets, dtype=np.intp)
+    sources = np.broadcast_to(np.arange(targets.shape[1]), targets.shape)
+    return (sources, targets) if n >= m else (targets, sources)
+
+
+class VoiceLeading:
+    """Voice-leading distances under one of the METRICS. Distances of normalized chord pairs are kept for the
+    lifetime of the instance."""
+
+    def __init__(self, metric: str = "semitones"):
+        """
+
+        Args:
+            metric: One of METRICS. 'fifths' requires chords with SpecificPitchClass roots.
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}. Choose from {METRICS}.")
+        self.metric = metric
+        self._distances: Dict[tuple, int] = {}
+
+    def _key(self, tone: IntType) -> int:
+        """A chord tone as semitones or fifths, depending on the metric."""
+        if self.metric == "fifths":
+            if isinstance(tone, SemitonesScalar):
+                raise TypeError(
+                    f"{tone!r} needs to be spelled to measure voice leading in fifths."
+                )
+            return int(tone)
+        return tone.semitones if isinstance(tone, FifthsScalar) else int(tone) % 12
+
+    def _tones(self, chord: Chord) -> Tuple[int, ...]:
+        """The distinct chord tones, sorted."""
+        return tuple(sorted({self._key(tone) for tone in chord.chord_tones}))
+
+    def _matrix(self, chords: Sequence[Chord]) -> Tuple[np.ndarray, np.ndarray]:
+        """The tones of all distinct chords in the rows of a padded int16 matrix, and the row of every chord."""
+        # chords are compared by identity, so every distinct object is looked at once
+        rows: Dict[int, int] = {}
+        distinct = []
+        index = np.empty(len(chords), dtype=np.int64)
+        for i, chord in enumerate(chords):
+            row = rows.get(id(chord))
+            if row is None:
+                row = rows[id(chord)] = len(distinct)
+                distinct.append(self._tones(chord))
+            index[i] = row
+        matrix = np.full(
+            (len(distinct), max(map(len, distinct))), _PADDING, dtype=np.int16
+        )
+        for row, tones in enumerate(distinct):
+            matrix[row, : len(tones)] = tones
+        return matrix, index
+
+    def _normalized_pairs(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Concatenates the rows of pairs of chords, both transposed by the lowest tone of the first one."""
+        first, second = first.astype(np.int32), second.astype(np.int32)
+        lowest = first[:, :1]
+        pairs = np.concatenate([first - lowest, second - lowest], axis=1)
+        if self.metric == "semitones":
+            pairs %= 12
+        pairs[np.concatenate([first, second], axis=1) == _PADDING] = _PADDING
+        pairs[:, first.shape[1] :].sort(axis=1)  # noqa: E203
+        return pairs.astype(np.int16)
+
+    def _voice_distances(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Distances between all voices of stacks of chords, of shape (chords, len(first), len(second))."""
+        differences = first[:, :, None].astype(np.int32) - second[:, None, :]
+        if self.metric == "semitones":
+            differences %= 12
+            return np.minimum(differences, 12 - differences)
+        return np.abs(differences)
+
+    def _compute(self, pairs: np.ndarray) -> np.ndarray:
+        """The distances of normalized pairs, vectorized over all pairs with the same numbers of tones."""
+        width = pairs.shape[1] // 2
+        sizes = (pairs[:, :width] != _PADDING).sum(axis=1), (
+            pairs[:, width:] != _PADDING
+        ).sum(axis=1)
+        distances = np.empty(len(pairs), dtype=np.int64)
+        for n, m in set(zip(*(s.tolist() for s in sizes))):
+            selected = (sizes[0] == n) & (sizes[1] == m)
+            voices = self._voice_distances(
+                pairs[selected, :n], pairs[selected, width : width + m]  # noqa: E203
+            )
+            sources, targets = _assignments(n, m)
+            distances[selected] = voices[:, sources, targets].sum(axis=2).min(axis=1)
+        return distances
+
+    def distances(self, chords: Sequence[Chord]) -> np.ndarray:
+        """The voice-leading distances between all consecutive chords of a sequence.
+
+        Args:
+            chords: Chords with roots, spelled or enharmonic, or without roots (their intervals relative to C).
+
+        Returns:
+            An int64 array with one distance less than there are chords.
+        """
+        if len(chords) < 2:
+            return np.zeros(0, dtype=np.int64)
+        matrix, index = self._matrix(chords)
+        # most consecutive pairs repeat, so each distinct pair of rows is normalized once
+        codes, inverse = np.unique(
+            index[:-1] * len(matrix) + index[1:], return_inverse=True
+        )
+        pairs = self._normalized_pairs(
+            matrix[codes // len(matrix)], matrix[codes % len(matrix)]
+        )
+        keys = [tuple(row) for row in pairs.tolist()]
+        missing = {key: i for i, key in enumerate(keys) if key not in self._distances}
+        if len(missing) > 0:
+            computed = self._compute(pairs[list(missing.values())]).tolist()
+            self._distances.update(zip(missing, computed))
+        distances = np.array([self._distances[key] for key in keys], dtype=np.int64)
+        return distances[inverse.ravel()]
+
+    def distance(self, first: Chord, second: Chord) -> int:
+        """The voice-leading distance between two chords."""
+        return int(self.distances([first, second])[0])
+
+    def assignment(
+        self, first: Chord, second: Chord
+    ) -> Tuple[Tuple[IntType, IntType], ...]:
+        """An optimal voice leading between two chords as (tone of first, tone of second) pairs. Ties are broken
+        in favour of the assignment listed first by _assignments().
+        """
+        members = []
+        for chord in (first, second):
+            tones = {}
+            for tone in chord.chord_tones:
+                tones.setdefault(self._key(tone), tone)
+            members.append([tones[key] for key in sorted(tones)])
+        voices = self._voice_distances(
+            np.array([self._tones(first)]), np.array([self._tones(second)])
+        )[0]
+        sources, targets = _assignments(len(members[0]), len(members[1]))
+        best = int(np.argmin(voices[sources, targets].sum(axis=1)))
+        return tuple(
+            (members[0][i], members[1][j])
+            for i, j in zip(sources[best].tolist(), targets[best].tolist())
+        )
+
+
+if __name__ == "__main__":
+    import time
+
+    from harmony import SIC, MajorChord
+    from pitch import EPC, SPC
+
+    class DominantSeventhChord(Chord):
+        intervals = (SIC(0), SIC(4), SIC(1), SIC(-2))
+
+    semitones, fifths = VoiceLeading(), VoiceLeading("fifths")
+    c, f, g7, ab = (
+        MajorChord(SPC("C")),
+        MajorChord(SPC("F")),
+        DominantSeventhChord(SPC("G")),
+        MajorChord(SPC("Ab")),
+    )
+    print(
+        f"C -> F: {semitones.distance(c, f)} semitones, {fifths.distance(c, f)} fifths"
+    )
+    print(f"G7 -> C: {semitones.assignment(g7, c)}")
+    print(
+        f"C -> Ab: {semitones.distance(c, ab)} semitones, C -> G#: "
+        f"{semitones.distance(c, MajorChord(EPC(8)))} semitones, "
+        f"{fifths.distance(c, ab)} vs. {fifths.distance(c, MajorChord(SPC('G#')))} fifths"
+    )
+    rng = np.random.default_rng(0)
+    pool = [MajorChord(SPC._from_int(root)) for root in range(-7, 8)]
+    pool += [DominantSeventhChord(SPC._from_int(root)) for root in range(-7, 8)]
+    sequence = [pool[i] for i in rng.integers(0, len(pool), 1_000_000).tolist()]
+    start = time.perf_counter()
+    distances = semitones.distances(sequence)
+    print(
+        f"{len(sequence)} chords in {time.perf_counter() - start:.2f} s, mean distance {distances.mean():.2f}"
+    )
+    start = time.perf_counter()
+    semitones.distances(sequence)
+    print(f"Again with memoized pairs in {time.perf_counter() - start:.2f} s")